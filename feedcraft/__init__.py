@@ -0,0 +1,14 @@
+from .atom import AtomFeed, parse_atom, parse_atom_file
+from .batch import ParseResult, parse_many
+from .rss import RssFeed, parse_rss, parse_rss_file
+
+__all__ = [
+    "AtomFeed",
+    "ParseResult",
+    "RssFeed",
+    "parse_atom",
+    "parse_atom_file",
+    "parse_many",
+    "parse_rss",
+    "parse_rss_file",
+]
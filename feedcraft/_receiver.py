@@ -0,0 +1,205 @@
+import asyncio
+import typing as t
+import urllib.parse
+from dataclasses import dataclass
+
+_MAX_HEADER_LINES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class Request:
+    """One HTTP request received by a Receiver."""
+
+    method: str
+    """Request method, upper-cased."""
+
+    path: str
+    """Path component of the request target, without the query."""
+
+    query: dict[str, list[str]]
+    """Query string parameters."""
+
+    headers: dict[str, str]
+    """Request headers, keyed by lower-cased name."""
+
+    body: bytes
+    """Request body."""
+
+    def form(self) -> dict[str, list[str]]:
+        """Parse an application/x-www-form-urlencoded body."""
+
+        return urllib.parse.parse_qs(self.body.decode("utf-8", "replace"))
+
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    """Reply produced by a Receiver handler."""
+
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "text/plain"
+
+
+type Handler = t.Callable[[Request], t.Awaitable[Response]]
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    500: "Internal Server Error",
+}
+
+
+class Receiver:
+    """Serve `handler` over plain HTTP/1.1, one request per connection.
+
+    Request bodies are delimited by Content-Length or chunked
+    Transfer-Encoding and may be at most `max_body_bytes` long; anything
+    malformed or larger, including over-long request and header lines, is
+    answered with 400 without reaching the handler, and handler exceptions
+    with 500. Connections that take longer than `read_timeout` seconds to send
+    their headers, or their body, are dropped.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        *,
+        max_body_bytes: int = 1 << 20,
+        read_timeout: float = 30.0,
+    ) -> None:
+        self._handler = handler
+        self._max_body_bytes = max_body_bytes
+        self._read_timeout = read_timeout
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            raise RuntimeError("Receiver is not running.")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str, port: int) -> None:
+        self._server = await asyncio.start_server(self._serve, host, port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            try:
+                request = await _read_request(
+                    reader, self._max_body_bytes, self._read_timeout
+                )
+            except ValueError:
+                # readline() raises it for lines over the stream limit, and
+                # int() for malformed chunk sizes.
+                request = None
+            except asyncio.LimitOverrunError:
+                request = None
+            if request is None:
+                response = Response(400)
+            else:
+                try:
+                    response = await self._handler(request)
+                except Exception:
+                    response = Response(500)
+            writer.write(_encode_response(response))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        except asyncio.IncompleteReadError:
+            pass
+        except TimeoutError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_request(
+    reader: asyncio.StreamReader, max_body_bytes: int, timeout: float
+) -> Request | None:
+    async with asyncio.timeout(timeout):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            return None
+        method, target, _ = request_line
+
+        headers: dict[str, str] = {}
+        for _ in range(_MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, sep, value = line.partition(":")
+            if not sep:
+                return None
+            headers[name.strip().lower()] = value.strip()
+        else:
+            return None
+
+    transfer_encoding = headers.get("transfer-encoding")
+    if transfer_encoding is not None:
+        # Both headers at once is a request smuggling vector; refuse it.
+        if transfer_encoding.lower() != "chunked" or "content-length" in headers:
+            return None
+        async with asyncio.timeout(timeout):
+            body = await _read_chunked(reader, max_body_bytes)
+        if body is None:
+            return None
+    else:
+        length = headers.get("content-length", "0")
+        if not length.isdigit() or int(length) > max_body_bytes:
+            return None
+        async with asyncio.timeout(timeout):
+            body = await reader.readexactly(int(length))
+
+    url = urllib.parse.urlsplit(target)
+    return Request(
+        method=method.upper(),
+        path=url.path,
+        query=urllib.parse.parse_qs(url.query),
+        headers=headers,
+        body=body,
+    )
+
+
+async def _read_chunked(
+    reader: asyncio.StreamReader, max_body_bytes: int
+) -> bytes | None:
+    chunks: list[bytes] = []
+    received = 0
+    while True:
+        size_line = (await reader.readline()).split(b";", 1)[0].strip()
+        size = int(size_line, 16)
+        if size < 0:
+            return None
+        if size == 0:
+            break
+        received += size
+        if received > max_body_bytes:
+            return None
+        chunks.append(await reader.readexactly(size))
+        if await reader.readexactly(2) != b"\r\n":
+            return None
+    # Skip any trailer fields up to the blank line ending the message.
+    for _ in range(_MAX_HEADER_LINES):
+        if not (await reader.readline()).strip():
+            return b"".join(chunks)
+    return None
+
+
+def _encode_response(response: Response) -> bytes:
+    reason = _REASONS.get(response.status, "")
+    head = (
+        f"HTTP/1.1 {response.status} {reason}\r\n"
+        f"Content-Type: {response.content_type}\r\n"
+        f"Content-Length: {len(response.body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + response.body
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from ._receiver import Receiver, Request, Response
+
+
+def _exchange(
+    raw: bytes, *, max_body_bytes: int = 1 << 20
+) -> tuple[bytes, list[bytes]]:
+    """Send `raw` to an echoing Receiver; return the status line and bodies seen."""
+
+    bodies: list[bytes] = []
+
+    async def handler(request: Request) -> Response:
+        bodies.append(request.body)
+        return Response(202)
+
+    async def run() -> bytes:
+        receiver = Receiver(handler, max_body_bytes=max_body_bytes)
+        await receiver.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+            writer.write(raw)
+            await writer.drain()
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+        finally:
+            await receiver.close()
+
+    return asyncio.run(run()), bodies
+
+
+def test_receiver_decodes_chunked_bodies():
+    status, bodies = _exchange(
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n"
+    )
+    assert status.startswith(b"HTTP/1.1 202")
+    assert bodies == [b"hello world"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"b\r\nhello world\r\n0\r\n\r\n",
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n",
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n",
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\nContent-Length: 5\r\n\r\n",
+        b"GET /" + b"a" * (1 << 17) + b" HTTP/1.1\r\n\r\n",
+        b"GET / HTTP/1.1\r\nX-Long: " + b"a" * (1 << 17) + b"\r\n\r\n",
+    ],
+    ids=["over-limit", "bad-size", "gzip", "both-lengths", "long-line", "long-header"],
+)
+def test_receiver_rejects_unreadable_bodies_and_lines(raw: bytes):
+    status, bodies = _exchange(raw, max_body_bytes=10)
+    assert status.startswith(b"HTTP/1.1 400")
+    assert bodies == []
@@ -0,0 +1,73 @@
+import contextlib
+import os
+import sqlite3
+import threading
+import typing as t
+
+
+class Database:
+    """A SQLite connection in WAL mode, shared between threads behind one lock.
+
+    WAL lets any number of processes read while one writes, and
+    synchronous=NORMAL only syncs at checkpoints, which is durable enough for
+    caches and indexes that can be rebuilt. `schema` statements run on open.
+    Hold `lock` around every use of `connection`.
+    """
+
+    __slots__ = ("connection", "lock")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        timeout: float = 30.0,
+        schema: t.Iterable[str] = (),
+    ) -> None:
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in schema:
+            self.connection.execute(statement)
+
+    @contextlib.contextmanager
+    def transaction(self) -> t.Iterator[sqlite3.Connection]:
+        """Hold the lock and run the block in a write transaction, rolled back on error."""
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+class SqliteStore:
+    """Base of the stores persisted in one SQLite Database; closes it on exit."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        timeout: float = 30.0,
+        schema: t.Iterable[str] = (),
+    ) -> None:
+        self.path = path
+        self._database = Database(path, timeout=timeout, schema=schema)
+
+    def close(self) -> None:
+        self._database.close()
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,93 @@
+import typing as t
+
+from .rss import Item
+
+
+class _History:
+    __slots__ = ("gap", "latest", "new_items")
+
+    def __init__(self) -> None:
+        self.gap: float | None = None
+        self.latest: int | None = None
+        self.new_items = 0
+
+
+class UpdateRateEstimator:
+    """Learn how often each feed publishes, from the item dates seen across polls.
+
+    observe() records the publication timestamps of a poll's items; the gap
+    between consecutive publications is tracked as an exponentially weighted
+    moving average, with `smoothing` as the weight of each new gap. interval()
+    then recommends how long to wait before the next poll:
+
+    - normally half the average gap, so a feed is polled about twice per update;
+    - after a poll that turned up several new items (a burst), the average gap
+      divided by their number, so the rest of the burst is picked up quickly;
+    - once a feed has been quiet for more than twice its average gap, half of
+      the time it has been quiet, so dormant feeds back off progressively.
+
+    Only a few numbers are kept per feed. The recommendation is not clamped;
+    combine it with a PollPolicy, as PollScheduler does.
+    """
+
+    def __init__(self, *, smoothing: float = 0.3) -> None:
+        self.smoothing = smoothing
+        self._histories: dict[str, _History] = {}
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def observe(self, url: str, items: t.Iterable[Item], now: float) -> int:
+        """Record the items a poll of `url` returned; return how many were new."""
+
+        history = self._histories.get(url)
+        if history is None:
+            history = self._histories[url] = _History()
+        # Future-dated items are clock skew or scheduled posts; they say nothing
+        # about when the feed actually updates.
+        horizon = now + 3600
+        published = sorted(
+            timestamp
+            for item in items
+            if (timestamp := item.pub_timestamp) is not None and timestamp <= horizon
+        )
+        latest = history.latest
+        if latest is not None:
+            published = [timestamp for timestamp in published if timestamp > latest]
+        history.new_items = len(published) if latest is not None else 0
+        if not published:
+            return history.new_items
+
+        gap = history.gap
+        for timestamp in published:
+            if latest is not None:
+                if gap is None:
+                    gap = float(timestamp - latest)
+                else:
+                    gap += self.smoothing * ((timestamp - latest) - gap)
+            latest = timestamp
+        history.gap = gap
+        history.latest = latest
+        return history.new_items
+
+    def interval(self, url: str, now: float) -> float | None:
+        """Recommend seconds to wait before polling `url` again, or None if unsure.
+
+        There is no recommendation until at least two publications have been
+        seen.
+        """
+
+        history = self._histories.get(url)
+        if history is None or history.gap is None or history.latest is None:
+            return None
+        gap = history.gap
+        interval = gap / 2
+        if history.new_items >= 2:
+            interval = gap / history.new_items
+        quiet = now - history.latest
+        if quiet > 2 * gap:
+            interval = max(interval, quiet / 2)
+        return interval
+
+    def forget(self, url: str) -> None:
+        self._histories.pop(url, None)
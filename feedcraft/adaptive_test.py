@@ -0,0 +1,52 @@
+import pytest
+
+from .adaptive import UpdateRateEstimator
+from .rss import Item
+
+HOUR = 3600
+
+
+def _items(*timestamps: int) -> list[Item]:
+    return [Item(title=str(ts), pub_timestamp=ts) for ts in timestamps]
+
+
+def test_interval_needs_two_publications():
+    estimator = UpdateRateEstimator()
+    assert estimator.interval("feed", 0) is None
+    estimator.observe("feed", _items(0), 0)
+    assert estimator.interval("feed", 0) is None
+
+
+def test_interval_tracks_steady_feeds():
+    estimator = UpdateRateEstimator()
+    assert estimator.observe("feed", _items(0, 4 * HOUR), 4 * HOUR) == 0
+    assert estimator.interval("feed", 4 * HOUR) == 2 * HOUR
+    # Items already seen are not counted again.
+    assert estimator.observe("feed", _items(0, 4 * HOUR, 8 * HOUR), 8 * HOUR) == 1
+    assert estimator.interval("feed", 8 * HOUR) == 2 * HOUR
+
+
+def test_interval_returns_quickly_after_bursts():
+    estimator = UpdateRateEstimator()
+    estimator.observe("feed", _items(0, 8 * HOUR), 8 * HOUR)
+    estimator.observe(
+        "feed", _items(9 * HOUR, 9 * HOUR + 60, 9 * HOUR + 120), 10 * HOUR
+    )
+    interval = estimator.interval("feed", 10 * HOUR)
+    assert interval is not None and interval < HOUR
+
+
+def test_interval_backs_off_for_dormant_feeds():
+    estimator = UpdateRateEstimator()
+    estimator.observe("feed", _items(0, 2 * HOUR), 2 * HOUR)
+    assert estimator.interval("feed", 3 * HOUR) == HOUR
+    assert estimator.interval("feed", 2 * HOUR + 48 * HOUR) == 24 * HOUR
+    assert estimator.interval("feed", 2 * HOUR + 96 * HOUR) == pytest.approx(48 * HOUR)
+
+
+def test_observe_ignores_future_and_undated_items():
+    estimator = UpdateRateEstimator()
+    estimator.observe("feed", [*_items(0, HOUR, 100 * HOUR), Item(title="x")], HOUR)
+    assert estimator.interval("feed", HOUR) == HOUR / 2
+    estimator.forget("feed")
+    assert len(estimator) == 0
@@ -0,0 +1,498 @@
+import datetime as dt
+import functools
+import os
+import re
+import typing as t
+from dataclasses import dataclass, field
+
+from .rss import (
+    Backend,
+    RssParseError,
+    RssSource,
+    _Element,
+    _find_direct_children,
+    _get_attr,
+    _get_text,
+    _intern,
+    _load_root,
+    _parse_date_once,
+    _parse_int,
+    map_rss_file,
+)
+
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+
+type TextType = t.Literal["text", "html", "xhtml"]
+
+
+class AtomDateError(ValueError):
+    """Raised when an Atom date string is not an RFC 3339 date-time."""
+
+
+class AtomParseError(ValueError):
+    """Raised when an Atom document cannot be parsed into the expected Atom 1.0 structure."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomText:
+    """An Atom text construct such as <title>, <subtitle>, <summary> or <rights>."""
+
+    value: str
+    """Text content; markup for "html", and the bare text of the div for "xhtml"."""
+
+    type: TextType = "text"
+    """How `value` is to be interpreted."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomPerson:
+    """An Atom person construct: an <author> or <contributor>."""
+
+    name: str
+    """Human-readable name of the person."""
+
+    uri: str | None = None
+    """IRI associated with the person."""
+
+    email: str | None = None
+    """Email address of the person."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomLink:
+    """A <link> from a feed or entry to a related web resource."""
+
+    href: str
+    """IRI of the linked resource."""
+
+    rel: str = "alternate"
+    """Link relation type, such as "alternate", "self", "enclosure" or "hub"."""
+
+    type: str | None = None
+    """Advisory media type of the linked resource."""
+
+    hreflang: str | None = None
+    """Language of the linked resource."""
+
+    title: str | None = None
+    """Human-readable information about the link."""
+
+    length: int | None = None
+    """Advisory length of the linked resource in bytes."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomCategory:
+    """A <category> classifying a feed or entry."""
+
+    term: str
+    """Category the feed or entry belongs to."""
+
+    scheme: str | None = None
+    """IRI identifying the categorization scheme."""
+
+    label: str | None = None
+    """Human-readable label for display."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomGenerator:
+    """The <generator> agent used to produce a feed."""
+
+    name: str
+    """Human-readable name of the generating agent."""
+
+    uri: str | None = None
+    """IRI relevant to the agent."""
+
+    version: str | None = None
+    """Version of the generating agent."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomContent:
+    """The <content> of an entry, either inline or referenced by `src`."""
+
+    value: str | None = None
+    """Inline content; None when the content is out of line."""
+
+    type: str = "text"
+    """"text", "html", "xhtml" or a media type."""
+
+    src: str | None = None
+    """IRI of out-of-line content."""
+
+
+@dataclass(frozen=True, slots=True)
+class AtomEntry:
+    """Represents an <entry>: one article, post or other item of a feed."""
+
+    id: str
+    """Permanent, universally unique identifier of the entry."""
+
+    title: AtomText
+    """Human-readable title of the entry."""
+
+    updated: str | None = None
+    """Most recent significant modification of the entry, as an RFC 3339 string."""
+
+    authors: tuple[AtomPerson, ...] = field(default_factory=tuple)
+    """Authors of the entry; when empty, the feed's authors apply."""
+
+    contributors: tuple[AtomPerson, ...] = field(default_factory=tuple)
+    """Contributors to the entry."""
+
+    links: tuple[AtomLink, ...] = field(default_factory=tuple)
+    """Links from the entry to related resources."""
+
+    categories: tuple[AtomCategory, ...] = field(default_factory=tuple)
+    """Categories of the entry."""
+
+    content: AtomContent | None = None
+    """Content of the entry."""
+
+    summary: AtomText | None = None
+    """Short summary, abstract or excerpt of the entry."""
+
+    published: str | None = None
+    """Initial publication of the entry, as an RFC 3339 string."""
+
+    rights: AtomText | None = None
+    """Rights held in and over the entry."""
+
+    updated_datetime: dt.datetime | None = field(default=None, compare=False)
+    """updated parsed to an aware datetime; None when absent or invalid."""
+
+    published_datetime: dt.datetime | None = field(default=None, compare=False)
+    """published parsed to an aware datetime; None when absent or invalid."""
+
+    @property
+    def link(self) -> str | None:
+        """href of the entry's first alternate link."""
+
+        return _first_link(self.links, "alternate")
+
+
+@dataclass(frozen=True, slots=True)
+class AtomFeed:
+    """Top-level representation of an Atom 1.0 document consisting of a <feed> element."""
+
+    id: str
+    """Permanent, universally unique identifier of the feed."""
+
+    title: AtomText
+    """Human-readable title of the feed."""
+
+    updated: str | None = None
+    """Most recent significant modification of the feed, as an RFC 3339 string."""
+
+    authors: tuple[AtomPerson, ...] = field(default_factory=tuple)
+    """Authors of the feed."""
+
+    contributors: tuple[AtomPerson, ...] = field(default_factory=tuple)
+    """Contributors to the feed."""
+
+    links: tuple[AtomLink, ...] = field(default_factory=tuple)
+    """Links from the feed to related resources, including "self" and "hub"."""
+
+    categories: tuple[AtomCategory, ...] = field(default_factory=tuple)
+    """Categories of the feed."""
+
+    generator: AtomGenerator | None = None
+    """Agent used to generate the feed."""
+
+    icon: str | None = None
+    """IRI of a small image identifying the feed."""
+
+    logo: str | None = None
+    """IRI of a larger image identifying the feed."""
+
+    rights: AtomText | None = None
+    """Rights held in and over the feed."""
+
+    subtitle: AtomText | None = None
+    """Human-readable description or subtitle of the feed."""
+
+    entries: tuple[AtomEntry, ...] = field(default_factory=tuple)
+    """Entries of the feed, in document order."""
+
+    updated_datetime: dt.datetime | None = field(default=None, compare=False)
+    """updated parsed to an aware datetime; None when absent or invalid."""
+
+    invalid_dates: tuple[str, ...] = field(default_factory=tuple, compare=False)
+    """Distinct date strings in the feed or its entries that failed to parse."""
+
+    @property
+    def link(self) -> str | None:
+        """href of the feed's first alternate link."""
+
+        return _first_link(self.links, "alternate")
+
+    @property
+    def self_link(self) -> str | None:
+        """href of the feed's rel="self" link: its own URL, and its WebSub topic."""
+
+        return _first_link(self.links, "self")
+
+    @property
+    def hub_links(self) -> tuple[str, ...]:
+        """hrefs of the WebSub hubs the feed advertises."""
+
+        return tuple(link.href for link in self.links if link.rel == "hub")
+
+
+def _first_link(links: tuple[AtomLink, ...], rel: str) -> str | None:
+    for link in links:
+        if link.rel == rel:
+            return link.href
+    return None
+
+
+_RFC3339 = re.compile(
+    r"(\d{4}-\d\d-\d\d)[Tt ](\d\d:\d\d):(\d\d)(?:\.(\d+))?([Zz]|[+-]\d\d:\d\d)",
+    re.ASCII,
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_rfc3339_date(value: str) -> dt.datetime:
+    """Parse an RFC 3339 date-time string as used by Atom <updated> and <published>.
+
+    A leap second (:60) is read as :59, and fractions beyond microseconds are
+    truncated. Results are memoized like those of parse_rfc822_date.
+    """
+
+    match = _RFC3339.fullmatch(value.strip())
+    if match is None:
+        raise AtomDateError(f"Invalid Atom date string: {value!r}")
+    date, clock, second, fraction, zone = match.groups()
+    if second == "60":
+        second = "59"
+    fraction = f".{fraction[:6]}" if fraction else ""
+    zone = "+00:00" if zone in "Zz" else zone
+    try:
+        return dt.datetime.fromisoformat(f"{date}T{clock}:{second}{fraction}{zone}")
+    except ValueError as exc:
+        raise AtomDateError(f"Invalid Atom date string: {value!r}") from exc
+
+
+def parse_atom(
+    atom: RssSource, *, backend: Backend = "auto", max_items: int | None = None
+) -> AtomFeed:
+    """Parse an Atom 1.0 document with the same backends and defensive checks as parse_rss.
+
+    The <feed> must have an <id> and a <title>; entries missing either are
+    skipped. Date strings that fail to parse are listed in AtomFeed.invalid_dates
+    instead of raising. `max_items` stops entry extraction once that many
+    entries have been built. xhtml text constructs and content are reduced to
+    their text.
+    """
+
+    try:
+        feed_tag = _load_root(
+            atom, backend, tags=(f"{{{ATOM_NAMESPACE}}}feed", "feed"), kind="Atom"
+        )
+    except RssParseError as exc:
+        raise AtomParseError(str(exc)) from exc
+    if feed_tag is None:
+        raise AtomParseError("Missing Atom <feed> root element.")
+
+    dates: dict[str, dt.datetime | None] = {}
+    entries: list[AtomEntry] = []
+    for entry_tag in _children(feed_tag, "entry"):
+        if max_items is not None and len(entries) >= max_items:
+            break
+        entry = _parse_entry(entry_tag, dates)
+        if entry is not None:
+            entries.append(entry)
+
+    feed_id = _child_text(feed_tag, "id")
+    title = _parse_text(feed_tag, "title")
+    if not feed_id or title is None:
+        raise AtomParseError("Atom <feed> elements require an <id> and a <title>.")
+    updated = _child_text(feed_tag, "updated")
+    updated_datetime = _parse_date_once(dates, updated, _parse_date_or_none)
+
+    return AtomFeed(
+        id=feed_id,
+        title=title,
+        updated=updated,
+        authors=_parse_people(feed_tag, "author"),
+        contributors=_parse_people(feed_tag, "contributor"),
+        links=_parse_links(feed_tag),
+        categories=_parse_categories(feed_tag),
+        generator=_parse_generator(feed_tag),
+        icon=_child_text(feed_tag, "icon"),
+        logo=_child_text(feed_tag, "logo"),
+        rights=_parse_text(feed_tag, "rights"),
+        subtitle=_parse_text(feed_tag, "subtitle"),
+        entries=tuple(entries),
+        updated_datetime=updated_datetime,
+        invalid_dates=tuple(value for value, parsed in dates.items() if parsed is None),
+    )
+
+
+def parse_atom_file(
+    path: str | os.PathLike[str],
+    *,
+    backend: Backend = "auto",
+    max_items: int | None = None,
+) -> AtomFeed:
+    """Parse the Atom 1.0 document at `path` straight from a read-only memory map."""
+
+    try:
+        with map_rss_file(path, kind="Atom") as view:
+            return parse_atom(view, backend=backend, max_items=max_items)
+    except AtomParseError:
+        raise
+    except RssParseError as exc:
+        raise AtomParseError(str(exc)) from exc
+
+
+def _children(parent: _Element, name: str) -> t.Sequence[_Element]:
+    children = _find_direct_children(parent, f"{{{ATOM_NAMESPACE}}}{name}")
+    if not children:
+        # Documents that forgot the namespace declaration still deserve a parse.
+        children = _find_direct_children(parent, name)
+    return children
+
+
+def _child(parent: _Element, name: str) -> _Element | None:
+    # Atom forbids repeating these elements, but the first one is good enough.
+    children = _children(parent, name)
+    return children[0] if children else None
+
+
+def _child_text(parent: _Element, name: str) -> str | None:
+    return _get_text(_child(parent, name))
+
+
+def _text_type(tag: _Element) -> str:
+    type_ = _get_attr(tag, "type")
+    return "text" if not type_ else _intern(type_.lower())
+
+
+def _parse_text(parent: _Element, name: str) -> AtomText | None:
+    tag = _child(parent, name)
+    if tag is None:
+        return None
+    type_ = _text_type(tag)
+    if type_ not in ("text", "html", "xhtml"):
+        type_ = "text"
+    return AtomText(
+        value=_get_text(tag) or "",
+        type=t.cast(TextType, type_),
+    )
+
+
+def _parse_people(parent: _Element, name: str) -> tuple[AtomPerson, ...]:
+    people: list[AtomPerson] = []
+    for tag in _children(parent, name):
+        person_name = _child_text(tag, "name")
+        if not person_name:
+            continue
+        people.append(
+            AtomPerson(
+                name=_intern(person_name),
+                uri=_child_text(tag, "uri"),
+                email=_child_text(tag, "email"),
+            )
+        )
+    return tuple(people)
+
+
+def _parse_links(parent: _Element) -> tuple[AtomLink, ...]:
+    links: list[AtomLink] = []
+    for tag in _children(parent, "link"):
+        href = _get_attr(tag, "href")
+        if not href:
+            continue
+        rel = _get_attr(tag, "rel")
+        type_ = _get_attr(tag, "type")
+        links.append(
+            AtomLink(
+                href=href,
+                rel=_intern(rel) if rel else "alternate",
+                type=None if type_ is None else _intern(type_),
+                hreflang=_get_attr(tag, "hreflang"),
+                title=_get_attr(tag, "title"),
+                length=_parse_int(_get_attr(tag, "length")),
+            )
+        )
+    return tuple(links)
+
+
+def _parse_categories(parent: _Element) -> tuple[AtomCategory, ...]:
+    categories: list[AtomCategory] = []
+    for tag in _children(parent, "category"):
+        term = _get_attr(tag, "term")
+        if not term:
+            continue
+        scheme = _get_attr(tag, "scheme")
+        label = _get_attr(tag, "label")
+        categories.append(
+            AtomCategory(
+                term=_intern(term),
+                scheme=None if scheme is None else _intern(scheme),
+                label=None if label is None else _intern(label),
+            )
+        )
+    return tuple(categories)
+
+
+def _parse_generator(parent: _Element) -> AtomGenerator | None:
+    tag = _child(parent, "generator")
+    name = _get_text(tag)
+    if tag is None or not name:
+        return None
+    return AtomGenerator(
+        name=_intern(name),
+        uri=_get_attr(tag, "uri"),
+        version=_get_attr(tag, "version"),
+    )
+
+
+def _parse_content(parent: _Element) -> AtomContent | None:
+    tag = _child(parent, "content")
+    if tag is None:
+        return None
+    src = _get_attr(tag, "src")
+    type_ = _text_type(tag)
+    return AtomContent(
+        value=None if src else _get_text(tag) or "",
+        type=type_,
+        src=src or None,
+    )
+
+
+def _parse_entry(
+    entry_tag: _Element, dates: dict[str, dt.datetime | None]
+) -> AtomEntry | None:
+    entry_id = _child_text(entry_tag, "id")
+    title = _parse_text(entry_tag, "title")
+    if not entry_id or title is None:
+        return None
+    updated = _child_text(entry_tag, "updated")
+    published = _child_text(entry_tag, "published")
+    return AtomEntry(
+        id=entry_id,
+        title=title,
+        updated=updated,
+        authors=_parse_people(entry_tag, "author"),
+        contributors=_parse_people(entry_tag, "contributor"),
+        links=_parse_links(entry_tag),
+        categories=_parse_categories(entry_tag),
+        content=_parse_content(entry_tag),
+        summary=_parse_text(entry_tag, "summary"),
+        published=published,
+        rights=_parse_text(entry_tag, "rights"),
+        updated_datetime=_parse_date_once(dates, updated, _parse_date_or_none),
+        published_datetime=_parse_date_once(dates, published, _parse_date_or_none),
+    )
+
+
+def _parse_date_or_none(value: str) -> dt.datetime | None:
+    try:
+        return parse_rfc3339_date(value)
+    except AtomDateError:
+        return None
@@ -0,0 +1,139 @@
+import datetime as dt
+import typing as t
+
+import pytest
+
+from .atom import (
+    AtomContent,
+    AtomDateError,
+    AtomLink,
+    AtomParseError,
+    AtomPerson,
+    AtomText,
+    parse_atom,
+    parse_atom_file,
+    parse_rfc3339_date,
+)
+
+SAMPLE_ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title type="text">Example Feed</title>
+  <subtitle type="html">A &lt;em&gt;subtitle&lt;/em&gt;</subtitle>
+  <link href="https://example.org/"/>
+  <link rel="self" href="https://example.org/feed.atom"/>
+  <link rel="hub" href="https://hub.example.org/"/>
+  <updated>2024-05-01T18:30:02Z</updated>
+  <author><name>John Doe</name><email>john@example.org</email></author>
+  <id>urn:uuid:60a76c80-d399-11d9-b93c-0003939e0af6</id>
+  <generator uri="https://example.org/gen" version="1.0">Gen</generator>
+  <entry>
+    <title>Atom-Powered Robots Run Amok</title>
+    <link href="https://example.org/2024/05/01/atom03"/>
+    <link rel="enclosure" type="audio/mpeg" length="1337" href="https://example.org/a.mp3"/>
+    <id>urn:uuid:1225c695-cfb8-4ebb-aaaa-80da344efa6a</id>
+    <updated>2024-05-01T18:30:02.123456789+02:00</updated>
+    <published>2024-04-30t08:00:00z</published>
+    <category term="robots" scheme="https://example.org/tags"/>
+    <summary>Some text.</summary>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Hello</p></div></content>
+  </entry>
+  <entry>
+    <title>Out of line</title>
+    <id>urn:2</id>
+    <updated>yesterday</updated>
+    <content type="video/mp4" src="https://example.org/v.mp4"/>
+  </entry>
+  <entry><title>No id</title></entry>
+</feed>
+"""
+
+
+@pytest.mark.parametrize("backend", ["auto", "lxml", "soup"])
+def test_parse_atom(backend: t.Literal["auto", "lxml", "soup"]):
+    feed = parse_atom(SAMPLE_ATOM, backend=backend)
+    assert feed.id == "urn:uuid:60a76c80-d399-11d9-b93c-0003939e0af6"
+    assert feed.title == AtomText("Example Feed")
+    assert feed.subtitle == AtomText("A <em>subtitle</em>", "html")
+    assert feed.link == "https://example.org/"
+    assert feed.self_link == "https://example.org/feed.atom"
+    assert feed.hub_links == ("https://hub.example.org/",)
+    assert feed.authors == (AtomPerson("John Doe", email="john@example.org"),)
+    assert feed.generator is not None and feed.generator.version == "1.0"
+    assert feed.updated_datetime == dt.datetime(2024, 5, 1, 18, 30, 2, tzinfo=dt.UTC)
+    assert feed.invalid_dates == ("yesterday",)
+
+    first, second = feed.entries
+    assert first.link == "https://example.org/2024/05/01/atom03"
+    assert first.links[1] == AtomLink(
+        "https://example.org/a.mp3", "enclosure", "audio/mpeg", length=1337
+    )
+    assert first.categories[0].scheme == "https://example.org/tags"
+    assert first.content == AtomContent("Hello", "xhtml")
+    assert first.summary == AtomText("Some text.")
+    assert first.updated_datetime == dt.datetime(
+        2024, 5, 1, 16, 30, 2, 123456, tzinfo=dt.UTC
+    )
+    assert first.published_datetime == dt.datetime(2024, 4, 30, 8, tzinfo=dt.UTC)
+    assert second.content == AtomContent(None, "video/mp4", "https://example.org/v.mp4")
+    assert second.updated_datetime is None
+
+    assert parse_atom(SAMPLE_ATOM.encode(), backend=backend, max_items=1).entries == (
+        first,
+    )
+
+
+def test_parse_atom_file_and_errors(tmp_path):
+    path = tmp_path / "feed.atom"
+    path.write_text(SAMPLE_ATOM, encoding="utf-8")
+    assert parse_atom_file(path) == parse_atom(SAMPLE_ATOM)
+
+    with pytest.raises(AtomParseError, match="<feed>"):
+        parse_atom("<rss version='2.0'><channel/></rss>")
+    with pytest.raises(AtomParseError, match="<id>"):
+        parse_atom('<feed xmlns="http://www.w3.org/2005/Atom"><title>x</title></feed>')
+    with pytest.raises(AtomParseError, match="Unable to parse Atom XML document"):
+        parse_atom("<feed", backend="lxml")
+    empty = tmp_path / "empty.atom"
+    empty.write_bytes(b"")
+    with pytest.raises(AtomParseError, match="Empty Atom document"):
+        parse_atom_file(empty)
+
+
+@pytest.mark.parametrize("backend", ["auto", "lxml", "soup"])
+def test_parse_atom_without_namespace(backend: t.Literal["auto", "lxml", "soup"]):
+    bare = SAMPLE_ATOM.replace(' xmlns="http://www.w3.org/2005/Atom"', "")
+    feed = parse_atom(bare, backend=backend)
+    assert feed.id == "urn:uuid:60a76c80-d399-11d9-b93c-0003939e0af6"
+    assert [entry.id for entry in feed.entries] == [
+        "urn:uuid:1225c695-cfb8-4ebb-aaaa-80da344efa6a",
+        "urn:2",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2003-12-13T18:30:02Z", dt.datetime(2003, 12, 13, 18, 30, 2, tzinfo=dt.UTC)),
+        (
+            "2003-12-13T18:30:02.25+01:00",
+            dt.datetime(2003, 12, 13, 17, 30, 2, 250000, tzinfo=dt.UTC),
+        ),
+        ("1990-12-31T23:59:60Z", dt.datetime(1990, 12, 31, 23, 59, 59, tzinfo=dt.UTC)),
+    ],
+)
+def test_parse_rfc3339_date(value: str, expected: dt.datetime):
+    assert parse_rfc3339_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2003-12-13",
+        "2003-12-13T18:30:02",
+        "2003-13-13T18:30:02Z",
+        "٢٠٠٣-12-13T18:30:02Z",
+    ],
+)
+def test_parse_rfc3339_date_rejects(value: str):
+    with pytest.raises(AtomDateError):
+        parse_rfc3339_date(value)
@@ -0,0 +1,150 @@
+import itertools
+import os
+import pickle
+import typing as t
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+
+from .packing import PackedFeed, pack_feed, unpack_feed
+from .rss import ParseOptions, RssFeed, RssParseError, parse_rss, parse_rss_file
+
+type BatchSource = str | bytes | os.PathLike[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ParseResult:
+    """Outcome of parsing one source passed to parse_many."""
+
+    index: int
+    """Position of the source in the input sequence."""
+
+    feed: RssFeed | None = None
+    """The parsed feed, or None when parsing failed."""
+
+    error: Exception | None = None
+    """The exception raised while parsing, or None on success."""
+
+
+type _PackedResult = tuple[int, PackedFeed | None, Exception | None]
+
+
+def parse_many(
+    sources: t.Iterable[BatchSource],
+    *,
+    workers: int | None = None,
+    ordered: bool = True,
+    chunksize: int = 8,
+    executor: Executor | None = None,
+    **options: t.Unpack[ParseOptions],
+) -> t.Iterator[ParseResult]:
+    """Parse many RSS documents in parallel, yielding one ParseResult per source.
+
+    Sources are str or bytes documents, or paths that are parsed with
+    parse_rss_file; keyword options are those of parse_rss. Work is fanned out
+    in chunks of `chunksize` sources over a ProcessPoolExecutor with `workers`
+    processes (all available CPUs by default), or over `executor` when one is
+    given, in which case the caller keeps ownership of it. With `workers=1` and
+    no executor, everything runs in the calling process.
+
+    Results arrive in input order when `ordered` is true, and otherwise as soon
+    as each chunk completes. Sources are consumed lazily, with at most two
+    chunks per worker queued at a time. An exception raised while parsing one
+    source, or a failure of the worker running its chunk, is reported on its
+    result rather than aborting the batch. Feeds travel back from workers in
+    the compact form produced by feedcraft.packing.
+    """
+
+    if executor is None and workers == 1:
+        for index, source in enumerate(sources):
+            try:
+                yield ParseResult(index, feed=_parse_source(source, options))
+            except Exception as exc:
+                yield ParseResult(index, error=exc)
+        return
+
+    chunks = itertools.batched(enumerate(sources), chunksize)
+    # Only this many chunks are pulled from `sources` and queued at a time, so
+    # large iterables of in-memory documents stream through the pool.
+    window = 2 * (workers or os.process_cpu_count() or 1)
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    pending: dict[Future[list[_PackedResult]], list[int]] = {}
+
+    def submit() -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        try:
+            future = executor.submit(_parse_chunk, chunk, options)
+        except Exception as exc:  # e.g. BrokenProcessPool once a worker died
+            future = Future()
+            future.set_exception(exc)
+        pending[future] = [index for index, _ in chunk]
+        return True
+
+    try:
+        while len(pending) < window and submit():
+            pass
+        while pending:
+            if ordered:
+                done: t.Iterable[Future[list[_PackedResult]]] = (next(iter(pending)),)
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _results(future, pending.pop(future))
+                submit()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _results(
+    future: Future[list[_PackedResult]], indexes: list[int]
+) -> t.Iterator[ParseResult]:
+    try:
+        packed_results = future.result()
+    except Exception as exc:
+        # The chunk as a whole failed, e.g. because its worker process crashed.
+        for index in indexes:
+            yield ParseResult(index, error=exc)
+        return
+    for index, packed, error in packed_results:
+        if packed is None:
+            yield ParseResult(index, error=error)
+        else:
+            yield ParseResult(index, feed=unpack_feed(packed))
+
+
+def _parse_source(source: BatchSource, options: ParseOptions) -> RssFeed:
+    if isinstance(source, os.PathLike):
+        return parse_rss_file(source, **options)
+    return parse_rss(source, **options)
+
+
+def _parse_chunk(
+    chunk: tuple[tuple[int, BatchSource], ...], options: ParseOptions
+) -> list[_PackedResult]:
+    results: list[_PackedResult] = []
+    for index, source in chunk:
+        try:
+            results.append((index, pack_feed(_parse_source(source, options)), None))
+        except Exception as exc:
+            results.append((index, None, _picklable(exc)))
+    return results
+
+
+def _picklable(exc: Exception) -> Exception:
+    # Exceptions from third-party parsers do not always survive the trip back
+    # to the parent process; fall back to a plain RssParseError carrying the text.
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RssParseError(f"{type(exc).__name__}: {exc}")
+    return exc
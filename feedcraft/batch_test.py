@@ -0,0 +1,77 @@
+import pathlib
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from . import parse_many
+from .rss import RssParseError, parse_rss
+from .rss_test import SAMPLE_RSS
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_reports_errors_in_input_order(tmp_path: pathlib.Path, workers: int):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text(SAMPLE_RSS, encoding="utf-8")
+    sources = [SAMPLE_RSS, "<html />", feed_path, SAMPLE_RSS.encode("utf-8")]
+
+    results = list(parse_many(sources, workers=workers, chunksize=1))
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    expected = parse_rss(SAMPLE_RSS)
+    assert results[0].feed == expected
+    assert results[2].feed == expected
+    assert results[3].feed == expected
+    assert results[1].feed is None
+    assert isinstance(results[1].error, RssParseError)
+
+
+def test_parse_many_as_completed_forwards_options():
+    results = list(
+        parse_many([SAMPLE_RSS] * 5, workers=2, ordered=False, chunksize=2, max_items=1)
+    )
+    assert sorted(result.index for result in results) == [0, 1, 2, 3, 4]
+    for result in results:
+        assert result.feed is not None
+        assert len(result.feed.channel.items) == 1
+
+
+def test_parse_many_streams_sources_with_bounded_chunks_in_flight():
+    consumed: list[int] = []
+
+    def sources() -> t.Iterator[str]:
+        for index in range(100):
+            consumed.append(index)
+            yield SAMPLE_RSS
+
+    with ThreadPoolExecutor(2) as executor:
+        results = parse_many(sources(), workers=2, chunksize=1, executor=executor)
+        assert next(results).index == 0
+        # Four chunks queued up front, then one more once the first is done.
+        assert len(consumed) <= 5
+        assert [result.index for result in results] == list(range(1, 100))
+
+
+class _CrashingExecutor(ThreadPoolExecutor):
+    def submit(self, fn, /, *args, **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride]
+        chunk = args[0]
+        if any(source == "crash" for _, source in chunk):
+            future: Future[t.Any] = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many_reports_failed_chunks_as_results(ordered: bool):
+    sources = [SAMPLE_RSS, "crash", SAMPLE_RSS, SAMPLE_RSS]
+    with _CrashingExecutor(2) as executor:
+        results = list(
+            parse_many(sources, chunksize=2, ordered=ordered, executor=executor)
+        )
+
+    results.sort(key=lambda result: result.index)
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert all(isinstance(results[i].error, BrokenProcessPool) for i in (0, 1))
+    assert results[2].feed is not None and results[3].feed is not None
@@ -0,0 +1,343 @@
+import abc
+import functools
+import hashlib
+import importlib.metadata
+import marshal
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ._sqlite import SqliteStore
+from .packing import pack_feed, unpack_feed
+from .rss import ParseOptions, RssFeed, RssSource, map_rss_file, parse_rss
+
+# Hits only refresh an entry's access time once it is this many seconds old, so
+# most hits read without taking the database write lock.
+_ACCESS_RESOLUTION = 60.0
+# Stable since Python 3.4, so processes on different interpreters can share a cache.
+_MARSHAL_VERSION = 4
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters describing a ParseCache or DiskParseCache."""
+
+    hits: int
+    """Lookups answered from the cache."""
+
+    misses: int
+    """Lookups that had to parse the document."""
+
+    evictions: int
+    """Entries dropped to respect the entry or byte bounds."""
+
+    entries: int
+    """Entries currently held."""
+
+    size_bytes: int
+    """Total size of the entries currently held, as measured by the cache."""
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _BaseParseCache(abc.ABC):
+    """Shared lookup-or-parse logic; subclasses provide the storage."""
+
+    def __init__(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def parse_rss(self, rss: RssSource, **options: t.Unpack[ParseOptions]) -> RssFeed:
+        """Return the cached parse of `rss`, parsing and caching it on a miss.
+
+        `lazy` is ignored: lazy items would keep the whole document tree alive
+        outside the byte bound and mutate on first access, so cached feeds
+        always hold ordinary, fully parsed items.
+        """
+
+        options.pop("lazy", None)
+        _freeze_projections(options)
+        if isinstance(rss, str):
+            data: bytes | memoryview = rss.encode("utf-8")
+        elif isinstance(rss, (bytes, memoryview)):
+            data = rss
+        else:
+            data = rss = rss.read()
+
+        key = _cache_key(data, options)
+        feed = self._lookup(key)
+        with self._lock:
+            if feed is not None:
+                self._hits += 1
+                return feed
+            self._misses += 1
+
+        feed = parse_rss(rss, **options)
+        self._store(key, feed, len(data))
+        return feed
+
+    def parse_rss_file(
+        self, path: str | os.PathLike[str], **options: t.Unpack[ParseOptions]
+    ) -> RssFeed:
+        """Like parse_rss_file, but answered from the cache when possible."""
+
+        with map_rss_file(path) as view:
+            return self.parse_rss(view, **options)
+
+    @abc.abstractmethod
+    def _lookup(self, key: bytes) -> RssFeed | None:
+        """Return the feed stored under `key`, or None."""
+
+    @abc.abstractmethod
+    def _store(self, key: bytes, feed: RssFeed, size: int) -> None:
+        """Store `feed` under `key`; `size` is that of its source document."""
+
+
+class ParseCache(_BaseParseCache):
+    """In-memory LRU cache of parse_rss results keyed by a digest of the document.
+
+    The key combines a BLAKE2b digest of the document bytes, the parse options
+    and the parser version, so byte-identical documents parsed the same way are
+    only parsed once. Entries are evicted least recently used first once either
+    `max_entries` or `max_bytes` (measured as the size of the source documents)
+    would be exceeded. Results are frozen dataclasses and are shared between
+    callers as-is. The cache is safe to use from multiple threads.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, max_bytes: int = 256 << 20) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, tuple[RssFeed, int]] = OrderedDict()
+        self._size_bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _lookup(self, key: bytes) -> RssFeed | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _store(self, key: bytes, feed: RssFeed, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+            self._entries[key] = (feed, size)
+            self._size_bytes += size
+            while (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+
+
+class DiskParseCache(_BaseParseCache, SqliteStore):
+    """Persistent parse_rss cache in a SQLite database shared between processes.
+
+    Entries are keyed exactly like ParseCache and hold the feed in the compact
+    feedcraft.packing form, serialized with marshal rather than pickle so that
+    reading a shared file never runs code. The database runs in WAL mode, so
+    any number of processes may read and write it concurrently, each through
+    its own DiskParseCache. Entries written under a different parser_version()
+    are purged when the cache is opened, and once the stored entries exceed
+    `max_bytes` the least recently used ones are deleted. Recency is tracked
+    to the minute, which keeps cache hits free of writes.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = 1 << 30,
+        timeout: float = 30.0,
+    ) -> None:
+        _BaseParseCache.__init__(self)
+        SqliteStore.__init__(
+            self,
+            path,
+            timeout=timeout,
+            schema=(
+                "CREATE TABLE IF NOT EXISTS feeds ("
+                " key BLOB PRIMARY KEY,"
+                " parser TEXT NOT NULL,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL)",
+                "CREATE INDEX IF NOT EXISTS feeds_accessed ON feeds (accessed)",
+                # Running totals of the feeds table, kept in step with it by every
+                # write transaction so that nothing has to scan it.
+                "CREATE TABLE IF NOT EXISTS totals ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0),"
+                " entries INTEGER NOT NULL,"
+                " size INTEGER NOT NULL)",
+            ),
+        )
+        self.max_bytes = max_bytes
+        with self._database.transaction() as db:
+            purged = db.execute(
+                "DELETE FROM feeds WHERE parser != ?", (parser_version(),)
+            ).rowcount
+            if purged or db.execute("SELECT 1 FROM totals").fetchone() is None:
+                db.execute(
+                    "INSERT OR REPLACE INTO totals (id, entries, size)"
+                    " SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM feeds"
+                )
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._database.lock:
+            entries, size_bytes = self._database.connection.execute(
+                "SELECT entries, size FROM totals WHERE id = 0"
+            ).fetchone()
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                size_bytes=size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Delete every entry, for all processes sharing the database."""
+
+        with self._database.transaction() as db:
+            db.execute("DELETE FROM feeds")
+            db.execute("UPDATE totals SET entries = 0, size = 0")
+
+    def _lookup(self, key: bytes) -> RssFeed | None:
+        now = time.time()
+        with self._database.lock:
+            db = self._database.connection
+            row = db.execute(
+                "SELECT value, accessed FROM feeds WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, accessed = row
+            if now - accessed >= _ACCESS_RESOLUTION:
+                db.execute("UPDATE feeds SET accessed = ? WHERE key = ?", (now, key))
+        return unpack_feed(marshal.loads(value))
+
+    def _store(self, key: bytes, feed: RssFeed, size: int) -> None:
+        # Sizes are those of the stored values rather than of the source documents,
+        # since that is what max_bytes bounds on disk.
+        value = marshal.dumps(pack_feed(feed), _MARSHAL_VERSION)
+        if len(value) > self.max_bytes:
+            return
+        with self._database.transaction() as db:
+            previous = db.execute(
+                "SELECT size FROM feeds WHERE key = ?", (key,)
+            ).fetchone()
+            db.execute(
+                "INSERT OR REPLACE INTO feeds (key, parser, value, size, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, parser_version(), value, len(value), time.time()),
+            )
+            db.execute(
+                "UPDATE totals SET entries = entries + ?, size = size + ? WHERE id = 0",
+                (
+                    previous is None,
+                    len(value) - (0 if previous is None else previous[0]),
+                ),
+            )
+            evicted = _evict(db, self.max_bytes)
+        with self._lock:
+            self._evictions += evicted
+
+
+def _evict(db: sqlite3.Connection, max_bytes: int) -> int:
+    (total,) = db.execute("SELECT size FROM totals WHERE id = 0").fetchone()
+    excess = total - max_bytes
+    if excess <= 0:
+        return 0
+    doomed: list[tuple[bytes]] = []
+    freed = 0
+    for key, size in db.execute("SELECT key, size FROM feeds ORDER BY accessed, rowid"):
+        doomed.append((key,))
+        freed += size
+        if freed >= excess:
+            break
+    db.executemany("DELETE FROM feeds WHERE key = ?", doomed)
+    db.execute(
+        "UPDATE totals SET entries = entries - ?, size = size - ? WHERE id = 0",
+        (len(doomed), freed),
+    )
+    return len(doomed)
+
+
+def _cache_key(data: bytes | memoryview, options: ParseOptions) -> bytes:
+    """Digest a document together with its parse options and the parser version."""
+
+    digest = hashlib.blake2b(data, digest_size=20)
+    digest.update(repr(_options_key(options)).encode("utf-8"))
+    digest.update(parser_version().encode("utf-8"))
+    return digest.digest()
+
+
+def _freeze_projections(options: ParseOptions) -> None:
+    # Projections may be one-shot iterables; sort them into tuples so they can be
+    # both keyed on and passed on to parse_rss.
+    fields = options.get("fields")
+    if fields is not None:
+        options["fields"] = tuple(sorted(fields))
+    channel_fields = options.get("channel_fields")
+    if channel_fields is not None:
+        options["channel_fields"] = tuple(sorted(channel_fields))
+
+
+def _options_key(options: ParseOptions) -> tuple[tuple[str, t.Any], ...]:
+    return tuple(sorted(options.items()))
+
+
+@functools.cache
+def parser_version() -> str:
+    """Identify the parsing logic: the package version plus a digest of its source.
+
+    Any edit to the parser modules changes the digest, so persisted results
+    keyed by it are invalidated automatically, even without a version bump.
+    """
+
+    try:
+        version = importlib.metadata.version("feedcraft")
+    except importlib.metadata.PackageNotFoundError:
+        version = "0+unknown"
+    digest = hashlib.blake2b(digest_size=8)
+    package_dir = pathlib.Path(__file__).parent
+    for module in ("rss.py", "packing.py"):
+        digest.update((package_dir / module).read_bytes())
+    return f"{version}+{digest.hexdigest()}"
@@ -0,0 +1,123 @@
+import pathlib
+
+from .cache import DiskParseCache, ParseCache
+from .rss import LazyItem, parse_rss
+from .rss_test import SAMPLE_RSS
+
+
+def test_parse_cache_hits_on_identical_bytes():
+    cache = ParseCache()
+    first = cache.parse_rss(SAMPLE_RSS.encode("utf-8"))
+    second = cache.parse_rss(SAMPLE_RSS)
+    assert first is second
+    assert first == parse_rss(SAMPLE_RSS)
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_parse_cache_keys_on_options():
+    cache = ParseCache()
+    full = cache.parse_rss(SAMPLE_RSS)
+    limited = cache.parse_rss(SAMPLE_RSS, max_items=1)
+    assert len(full.channel.items) == 2
+    assert len(limited.channel.items) == 1
+    assert cache.parse_rss(SAMPLE_RSS, fields=["guid", "title"]) is cache.parse_rss(
+        SAMPLE_RSS, fields=["title", "guid"]
+    )
+
+
+def test_parse_cache_never_holds_lazy_items():
+    cache = ParseCache()
+    feed = cache.parse_rss(SAMPLE_RSS, lazy=True)
+    assert not any(isinstance(item, LazyItem) for item in feed.channel.items)
+    assert cache.parse_rss(SAMPLE_RSS) is feed
+
+
+def test_parse_cache_evicts_least_recently_used():
+    cache = ParseCache(max_entries=2)
+    a = SAMPLE_RSS
+    b = SAMPLE_RSS.replace("First", "Primero")
+    c = SAMPLE_RSS.replace("First", "Premier")
+    cache.parse_rss(a)
+    cache.parse_rss(b)
+    cache.parse_rss(a)
+    cache.parse_rss(c)  # evicts b, the least recently used
+    stats = cache.stats
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    cache.parse_rss(a)
+    assert cache.stats.hits == stats.hits + 1
+    cache.parse_rss(b)
+    assert cache.stats.misses == stats.misses + 1
+
+
+def test_parse_cache_respects_byte_bound():
+    size = len(SAMPLE_RSS.encode("utf-8"))
+    cache = ParseCache(max_bytes=size)
+    cache.parse_rss(SAMPLE_RSS)
+    cache.parse_rss(SAMPLE_RSS.replace("First", "Primero"))
+    assert cache.stats.entries == 1
+    assert cache.stats.size_bytes <= size
+
+
+def test_disk_parse_cache_persists_between_instances(tmp_path: pathlib.Path):
+    db_path = tmp_path / "cache.sqlite"
+    with DiskParseCache(db_path) as cache:
+        feed = cache.parse_rss(SAMPLE_RSS)
+        assert cache.stats.misses == 1
+
+    with DiskParseCache(db_path) as cache:
+        assert cache.parse_rss(SAMPLE_RSS) == feed
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 0, 1)
+
+
+def test_disk_parse_cache_drops_other_parser_versions(tmp_path: pathlib.Path):
+    db_path = tmp_path / "cache.sqlite"
+    with DiskParseCache(db_path) as cache:
+        cache.parse_rss(SAMPLE_RSS)
+        cache._database.connection.execute("UPDATE feeds SET parser = 'stale'")
+
+    with DiskParseCache(db_path) as cache:
+        assert cache.stats.entries == 0
+
+
+def test_disk_parse_cache_evicts_least_recently_used(tmp_path: pathlib.Path):
+    with DiskParseCache(tmp_path / "cache.sqlite") as cache:
+        cache.parse_rss(SAMPLE_RSS)
+        one_entry = cache.stats.size_bytes
+        cache.max_bytes = one_entry * 2 + one_entry // 2
+        cache.parse_rss(SAMPLE_RSS.replace("First", "Primero"))
+        cache.parse_rss(SAMPLE_RSS.replace("First", "Premier"))
+        stats = cache.stats
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        assert stats.size_bytes <= cache.max_bytes
+
+
+def test_disk_parse_cache_keeps_running_totals(tmp_path: pathlib.Path):
+    def scanned(cache: DiskParseCache) -> tuple[int, int]:
+        return cache._database.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM feeds"
+        ).fetchone()
+
+    with DiskParseCache(tmp_path / "cache.sqlite") as cache:
+        cache.parse_rss(SAMPLE_RSS)
+        cache.max_bytes = cache.stats.size_bytes * 2
+        for title in ("Primero", "Premier", "Erste"):
+            cache.parse_rss(SAMPLE_RSS.replace("First", title))
+        stats = cache.stats
+        assert stats.evictions > 0
+        assert (stats.entries, stats.size_bytes) == scanned(cache)
+        cache.clear()
+        assert (cache.stats.entries, cache.stats.size_bytes) == (0, 0) == scanned(cache)
+
+
+def test_disk_parse_cache_hits_do_not_write(tmp_path: pathlib.Path):
+    with DiskParseCache(tmp_path / "cache.sqlite") as cache:
+        cache.parse_rss(SAMPLE_RSS)
+        db = cache._database.connection
+        changes = db.total_changes
+        cache.parse_rss(SAMPLE_RSS)
+        assert cache.stats.hits == 1
+        assert db.total_changes == changes
@@ -0,0 +1,249 @@
+import asyncio
+import inspect
+import typing as t
+import xml.parsers.expat
+import xmlrpc.client
+
+import httpx
+from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
+
+from ._receiver import Receiver, Request, Response
+from .rss import Cloud, _new_lxml_parser
+
+type PingCallback = t.Callable[[str], t.Awaitable[None] | None]
+
+# rssCloud servers drop registrations that are not renewed within 25 hours.
+_REGISTRATION_LIFETIME = 25 * 3600
+
+
+class CloudRegistrationError(ValueError):
+    """Raised when an rssCloud server refuses or fails a notification request."""
+
+
+class CloudSubscriber:
+    """Receive rssCloud pings for feeds whose channel advertises a <cloud>.
+
+    start() runs a small HTTP receiver on `host`:`port` (an ephemeral port by
+    default). subscribe() asks a feed's cloud server to notify that receiver,
+    using the HTTP-POST or XML-RPC flavour the <cloud> element names, and
+    renews the registration every `renew_interval` seconds, comfortably within
+    the 25 hours servers keep it. When the server pings about a subscribed
+    feed, `on_ping` is called with the feed URL; passing a PollScheduler's add
+    method makes the ping trigger an immediate refetch.
+
+    Servers learn where to send pings from `public_domain`, or from the address
+    the registration request came from when it is not given, and `public_port`
+    (the receiver's port by default). HTTP-POST servers given a domain first
+    verify it with a GET carrying a challenge, which the receiver echoes back
+    for subscribed feeds.
+    """
+
+    def __init__(
+        self,
+        on_ping: PingCallback,
+        *,
+        client: httpx.AsyncClient,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        path: str = "/rsscloud",
+        public_domain: str | None = None,
+        public_port: int | None = None,
+        notify_procedure: str = "feedcraft.notify",
+        renew_interval: float = 24 * 3600,
+    ) -> None:
+        if renew_interval >= _REGISTRATION_LIFETIME:
+            raise ValueError("renew_interval must be shorter than 25 hours.")
+        self.host = host
+        self.path = path
+        self.public_domain = public_domain
+        self.notify_procedure = notify_procedure
+        self.renew_interval = renew_interval
+        self._on_ping = on_ping
+        self._client = client
+        self._port = port
+        self._public_port = public_port
+        self._receiver = Receiver(self._handle)
+        self._renewals: dict[str, asyncio.Task[None]] = {}
+        self._renewal_errors: dict[str, Exception] = {}
+        self._registering: set[str] = set()
+
+    @property
+    def port(self) -> int:
+        """Port the receiver listens on."""
+
+        return self._receiver.port
+
+    @property
+    def subscriptions(self) -> frozenset[str]:
+        return frozenset(self._renewals)
+
+    @property
+    def renewal_errors(self) -> dict[str, Exception]:
+        """Error of the last renewal of each feed whose last renewal failed."""
+
+        return dict(self._renewal_errors)
+
+    async def start(self) -> None:
+        await self._receiver.start(self.host, self._port)
+
+    async def aclose(self) -> None:
+        for task in self._renewals.values():
+            task.cancel()
+        self._renewals.clear()
+        self._renewal_errors.clear()
+        await self._receiver.close()
+
+    async def __aenter__(self) -> t.Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def subscribe(self, feed_url: str, cloud: Cloud) -> None:
+        """Register for pings about `feed_url`, then keep the registration renewed.
+
+        Raises CloudRegistrationError when the first registration fails; later
+        renewal failures are retried at the next renewal, and the error of the
+        last one is kept in renewal_errors until a renewal succeeds.
+        """
+
+        await self._register(feed_url, cloud)
+        self._renewal_errors.pop(feed_url, None)
+        previous = self._renewals.pop(feed_url, None)
+        if previous is not None:
+            previous.cancel()
+        self._renewals[feed_url] = asyncio.create_task(self._renew(feed_url, cloud))
+
+    def unsubscribe(self, feed_url: str) -> None:
+        """Stop renewing `feed_url`; the server forgets it once the registration lapses."""
+
+        task = self._renewals.pop(feed_url, None)
+        if task is not None:
+            task.cancel()
+        self._renewal_errors.pop(feed_url, None)
+
+    async def _renew(self, feed_url: str, cloud: Cloud) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            try:
+                await self._register(feed_url, cloud)
+            except Exception as exc:
+                # Keep renewing; the registration outlives one missed renewal.
+                self._renewal_errors[feed_url] = exc
+            else:
+                self._renewal_errors.pop(feed_url, None)
+
+    async def _register(self, feed_url: str, cloud: Cloud) -> None:
+        protocol = cloud.protocol.lower()
+        endpoint = f"http://{cloud.domain}:{cloud.port}{cloud.path}"
+        port = self._public_port or self.port
+        self._registering.add(feed_url)
+        try:
+            if protocol == "http-post":
+                await self._register_http_post(endpoint, feed_url, port)
+            elif protocol == "xml-rpc":
+                await self._register_xml_rpc(endpoint, cloud, feed_url, port)
+            else:
+                raise CloudRegistrationError(
+                    f"Unsupported rssCloud protocol {cloud.protocol!r} for {feed_url}."
+                )
+        finally:
+            self._registering.discard(feed_url)
+
+    async def _register_http_post(
+        self, endpoint: str, feed_url: str, port: int
+    ) -> None:
+        data = {
+            "notifyProcedure": "",
+            "port": str(port),
+            "path": self.path,
+            "protocol": "http-post",
+            "url1": feed_url,
+        }
+        if self.public_domain is not None:
+            data["domain"] = self.public_domain
+        response = await self._client.post(endpoint, data=data)
+        try:
+            root = etree.fromstring(response.content, _new_lxml_parser())
+        except etree.XMLSyntaxError:
+            root = None
+        if root is None or root.tag != "notifyResult":
+            response.raise_for_status()
+            raise CloudRegistrationError(
+                f"Unexpected rssCloud response from {endpoint}: {response.text[:200]!r}"
+            )
+        if root.get("success", "").lower() != "true":
+            raise CloudRegistrationError(
+                f"rssCloud server {endpoint} refused {feed_url}: {root.get('msg')}"
+            )
+
+    async def _register_xml_rpc(
+        self, endpoint: str, cloud: Cloud, feed_url: str, port: int
+    ) -> None:
+        params: tuple[t.Any, ...] = (
+            self.notify_procedure,
+            port,
+            self.path,
+            "xml-rpc",
+            [feed_url],
+        )
+        if self.public_domain is not None:
+            params += (self.public_domain,)
+        body = xmlrpc.client.dumps(params, cloud.register_procedure)
+        response = await self._client.post(
+            endpoint, content=body.encode(), headers={"Content-Type": "text/xml"}
+        )
+        response.raise_for_status()
+        try:
+            (result,), _ = xmlrpc.client.loads(response.content)
+        except (
+            xmlrpc.client.Fault,
+            xmlrpc.client.ResponseError,
+            xml.parsers.expat.ExpatError,
+            ValueError,
+        ) as exc:
+            raise CloudRegistrationError(
+                f"rssCloud server {endpoint} refused {feed_url}: {exc}"
+            ) from exc
+        if result is not True:
+            raise CloudRegistrationError(
+                f"rssCloud server {endpoint} refused {feed_url}: {result!r}"
+            )
+
+    async def _handle(self, request: Request) -> Response:
+        if request.path != self.path:
+            return Response(404)
+        if request.method == "GET":
+            # HTTP-POST servers verify the notification endpoint before accepting it.
+            url = request.query.get("url", [""])[0]
+            challenge = request.query.get("challenge", [""])[0]
+            # The challenge may arrive while the registration is still in flight.
+            if url not in self._renewals and url not in self._registering:
+                return Response(404)
+            return Response(200, challenge.encode())
+        if request.method != "POST":
+            return Response(400)
+
+        if request.headers.get("content-type", "").startswith("text/xml"):
+            try:
+                params, method = xmlrpc.client.loads(request.body)
+            except (
+                xmlrpc.client.ResponseError,
+                xml.parsers.expat.ExpatError,
+                ValueError,
+            ):
+                return Response(400)
+            urls = [params[0]] if method == self.notify_procedure and params else []
+            reply = xmlrpc.client.dumps((True,), methodresponse=True).encode()
+            response = Response(200, reply, "text/xml")
+        else:
+            urls = request.form().get("url", [])
+            response = Response(200)
+
+        for url in urls:
+            if isinstance(url, str) and url in self._renewals:
+                result = self._on_ping(url)
+                if inspect.isawaitable(result):
+                    await result
+        return response
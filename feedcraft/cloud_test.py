@@ -0,0 +1,179 @@
+import asyncio
+import http.server
+import urllib.parse
+import xmlrpc.client
+
+import httpx
+import pytest
+
+from .cloud import CloudRegistrationError, CloudSubscriber
+from .fetch_test import respond, serve
+from .rss import Cloud
+
+FEED = "https://example.com/feed.xml"
+
+
+def _read_body(handler: http.server.BaseHTTPRequestHandler) -> bytes:
+    return handler.rfile.read(int(handler.headers["Content-Length"]))
+
+
+def _cloud_port(base: str) -> int:
+    port = urllib.parse.urlsplit(base).port
+    assert port is not None
+    return port
+
+
+def test_http_post_registration_verification_renewal_and_ping():
+    registrations: list[dict[str, list[str]]] = []
+
+    def please_notify(handler: http.server.BaseHTTPRequestHandler) -> None:
+        form = urllib.parse.parse_qs(_read_body(handler).decode())
+        registrations.append(form)
+        # Like real servers, verify the endpoint with a challenge before accepting.
+        challenge = httpx.get(
+            f"http://127.0.0.1:{form['port'][0]}{form['path'][0]}",
+            params={"url": form["url1"][0], "challenge": "abc123"},
+        )
+        success = "true" if challenge.text == "abc123" else "false"
+        respond(handler, 200, f'<notifyResult success="{success}" msg="ok"/>'.encode())
+
+    async def run(base: str) -> list[str]:
+        pings: list[str] = []
+        cloud = Cloud("127.0.0.1", _cloud_port(base), "/pleaseNotify", "", "http-post")
+        async with httpx.AsyncClient() as client:
+            async with CloudSubscriber(
+                pings.append,
+                client=client,
+                host="127.0.0.1",
+                public_domain="127.0.0.1",
+                renew_interval=0.2,
+            ) as subscriber:
+                await subscriber.subscribe(FEED, cloud)
+                endpoint = f"http://127.0.0.1:{subscriber.port}/rsscloud"
+                await client.post(endpoint, data={"url": FEED})
+                await client.post(endpoint, data={"url": "https://example.com/other"})
+                await asyncio.sleep(0.5)
+        return pings
+
+    with serve({"/pleaseNotify": please_notify}) as base:
+        pings = asyncio.run(run(base))
+
+    assert pings == [FEED]
+    assert len(registrations) >= 2
+    assert registrations[0]["protocol"] == ["http-post"]
+    assert registrations[0]["domain"] == ["127.0.0.1"]
+
+
+def test_xml_rpc_registration_and_ping():
+    calls: list[tuple[tuple[object, ...], str | None]] = []
+
+    def rpc(handler: http.server.BaseHTTPRequestHandler) -> None:
+        calls.append(xmlrpc.client.loads(_read_body(handler)))
+        reply = xmlrpc.client.dumps((True,), methodresponse=True)
+        respond(handler, 200, reply.encode(), {"Content-Type": "text/xml"})
+
+    async def run(base: str) -> list[str]:
+        pings: list[str] = []
+
+        async def on_ping(url: str) -> None:
+            pings.append(url)
+
+        cloud = Cloud(
+            "127.0.0.1", _cloud_port(base), "/RPC2", "rssCloud.pleaseNotify", "xml-rpc"
+        )
+        async with httpx.AsyncClient() as client:
+            async with CloudSubscriber(on_ping, client=client, host="127.0.0.1") as sub:
+                await sub.subscribe(FEED, cloud)
+                notify = xmlrpc.client.dumps((FEED,), sub.notify_procedure)
+                response = await client.post(
+                    f"http://127.0.0.1:{sub.port}/rsscloud",
+                    content=notify.encode(),
+                    headers={"Content-Type": "text/xml"},
+                )
+                assert xmlrpc.client.loads(response.content)[0] == (True,)
+        return pings
+
+    with serve({"/RPC2": rpc}) as base:
+        pings = asyncio.run(run(base))
+
+    assert pings == [FEED]
+    (params, method) = calls[0]
+    assert method == "rssCloud.pleaseNotify"
+    assert params[3:] == ("xml-rpc", [FEED])
+
+
+def test_registration_failures_raise():
+    def refuse(handler: http.server.BaseHTTPRequestHandler) -> None:
+        _read_body(handler)
+        respond(handler, 200, b'<notifyResult success="false" msg="nope"/>')
+
+    async def run(base: str, protocol: str) -> None:
+        cloud = Cloud("127.0.0.1", _cloud_port(base), "/pleaseNotify", "", protocol)
+        async with httpx.AsyncClient() as client:
+            async with CloudSubscriber(print, client=client, host="127.0.0.1") as sub:
+                await sub.subscribe(FEED, cloud)
+
+    with serve({"/pleaseNotify": refuse}) as base:
+        with pytest.raises(CloudRegistrationError, match="nope"):
+            asyncio.run(run(base, "http-post"))
+        with pytest.raises(CloudRegistrationError, match="Unsupported"):
+            asyncio.run(run(base, "soap"))
+
+
+def test_xml_rpc_garbage_is_rejected():
+    def garbage(handler: http.server.BaseHTTPRequestHandler) -> None:
+        _read_body(handler)
+        respond(handler, 200, b"<html>not xml-rpc", {"Content-Type": "text/html"})
+
+    async def run(base: str) -> int:
+        cloud = Cloud(
+            "127.0.0.1", _cloud_port(base), "/RPC2", "rssCloud.pleaseNotify", "xml-rpc"
+        )
+        async with httpx.AsyncClient() as client:
+            async with CloudSubscriber(print, client=client, host="127.0.0.1") as sub:
+                response = await client.post(
+                    f"http://127.0.0.1:{sub.port}/rsscloud",
+                    content=b"<methodCall><oops",
+                    headers={"Content-Type": "text/xml"},
+                )
+                with pytest.raises(CloudRegistrationError, match="refused"):
+                    await sub.subscribe(FEED, cloud)
+        return response.status_code
+
+    with serve({"/RPC2": garbage}) as base:
+        assert asyncio.run(run(base)) == 400
+
+
+def test_failed_renewals_are_recorded_and_failing_pings_answered_500():
+    replies = [b'<notifyResult success="true"/>']
+
+    def please_notify(handler: http.server.BaseHTTPRequestHandler) -> None:
+        _read_body(handler)
+        reply = (
+            replies.pop(0) if replies else b'<notifyResult success="false" msg="full"/>'
+        )
+        respond(handler, 200, reply)
+
+    def on_ping(url: str) -> None:
+        raise RuntimeError(url)
+
+    async def run(base: str) -> tuple[dict[str, Exception], int]:
+        cloud = Cloud("127.0.0.1", _cloud_port(base), "/pleaseNotify", "", "http-post")
+        async with httpx.AsyncClient() as client:
+            async with CloudSubscriber(
+                on_ping, client=client, host="127.0.0.1", renew_interval=0.1
+            ) as sub:
+                await sub.subscribe(FEED, cloud)
+                assert sub.renewal_errors == {}
+                response = await client.post(
+                    f"http://127.0.0.1:{sub.port}/rsscloud", data={"url": FEED}
+                )
+                await asyncio.sleep(0.3)
+                return sub.renewal_errors, response.status_code
+
+    with serve({"/pleaseNotify": please_notify}) as base:
+        errors, status = asyncio.run(run(base))
+
+    assert list(errors) == [FEED]
+    assert isinstance(errors[FEED], CloudRegistrationError)
+    assert status == 500
@@ -0,0 +1,199 @@
+import hashlib
+import struct
+import typing as t
+from dataclasses import dataclass
+
+from .rss import Item, RssFeed
+
+_DIGEST_SIZE = 8
+_STATE_MAGIC = b"FCS1"
+_STATE_HEADER = struct.Struct("<4sI")
+
+
+def item_key(item: Item) -> str:
+    """Return the stable identity of `item` across polls of its feed.
+
+    The guid identifies an item when present, then its link; items with
+    neither are identified by a hash of their title and description. Keys are
+    prefixed with their origin, so a guid can never collide with a link.
+    """
+
+    guid = item.guid
+    if guid is not None and guid.value:
+        return f"guid:{guid.value}"
+    if item.link:
+        return f"link:{item.link}"
+    content = f"{item.title or ''}\0{item.description or ''}"
+    return f"hash:{_digest(content).hex()}"
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=_DIGEST_SIZE
+    ).digest()
+
+
+def _fingerprint(item: Item) -> bytes:
+    enclosure = item.enclosure
+    guid = item.guid
+    source = item.source
+    return _digest(
+        "\0".join(
+            (
+                item.title or "",
+                item.link or "",
+                item.description or "",
+                item.author or "",
+                "\x1f".join(
+                    f"{category.domain or ''}\x1e{category.value}"
+                    for category in item.categories
+                ),
+                item.comments or "",
+                ""
+                if enclosure is None
+                else f"{enclosure.url}\x1f{enclosure.length}\x1f{enclosure.media_type}",
+                "" if guid is None else f"{guid.value}\x1f{guid.is_perma_link}",
+                item.pub_date or "",
+                "" if source is None else f"{source.name}\x1f{source.url}",
+            )
+        )
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FeedState:
+    """What diff_feeds needs to remember about a feed: its item keys and fingerprints.
+
+    Each item costs its key plus an 8-byte content fingerprint, so keeping a
+    FeedState per feed between polls is far cheaper than keeping the previous
+    RssFeed. to_bytes() and from_bytes() persist it.
+    """
+
+    keys: tuple[str, ...] = ()
+    """item_key of every item, in feed order, without duplicates."""
+
+    fingerprints: bytes = b""
+    """Concatenated 8-byte content fingerprints, one per key."""
+
+    @classmethod
+    def from_items(cls, items: t.Iterable[Item]) -> "FeedState":
+        """Build the state of `items`, such as a Channel's items."""
+
+        return _index(items)[0]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def fingerprint_map(self) -> dict[str, bytes]:
+        """Return a mapping from each item key to its fingerprint."""
+
+        fingerprints = self.fingerprints
+        return {
+            key: fingerprints[offset : offset + _DIGEST_SIZE]
+            for key, offset in zip(self.keys, range(0, len(fingerprints), _DIGEST_SIZE))
+        }
+
+    def to_bytes(self) -> bytes:
+        """Serialize the state compactly; from_bytes() reverses it."""
+
+        return b"".join(
+            (
+                _STATE_HEADER.pack(_STATE_MAGIC, len(self.keys)),
+                self.fingerprints,
+                "\0".join(self.keys).encode("utf-8", "surrogatepass"),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FeedState":
+        """Rebuild a state serialized by to_bytes(); raises ValueError if malformed."""
+
+        if len(data) < _STATE_HEADER.size:
+            raise ValueError("Truncated FeedState data.")
+        magic, count = _STATE_HEADER.unpack_from(data)
+        if magic != _STATE_MAGIC:
+            raise ValueError("Not FeedState data.")
+        start = _STATE_HEADER.size
+        end = start + count * _DIGEST_SIZE
+        fingerprints = bytes(data[start:end])
+        # XML text cannot contain NUL characters, so NUL separates keys safely.
+        keys = tuple(data[end:].decode("utf-8", "surrogatepass").split("\0"))
+        if count == 0 and keys == ("",):
+            keys = ()
+        if len(fingerprints) != count * _DIGEST_SIZE or len(keys) != count:
+            raise ValueError("Corrupt FeedState data.")
+        return cls(keys, fingerprints)
+
+
+@dataclass(frozen=True, slots=True)
+class FeedDiff:
+    """Changes between two polls of a feed, as computed by diff_feeds."""
+
+    added: tuple[Item, ...] = ()
+    """Items whose key was not in the old feed, in new feed order."""
+
+    changed: tuple[Item, ...] = ()
+    """Items whose key was in the old feed but whose content differs, in new feed order."""
+
+    removed: tuple[str, ...] = ()
+    """Keys of old items missing from the new feed, in old feed order."""
+
+    state: FeedState = FeedState()
+    """State of the new feed, to diff the next poll against."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def diff_feeds(old: RssFeed | FeedState | None, new: RssFeed) -> FeedDiff:
+    """Compare two polls of a feed by item identity, in time linear in their items.
+
+    `old` is the previous RssFeed, or the FeedState of a previous diff when
+    only that was kept, or None on the first poll (every item is then added).
+    Items are matched by item_key and compared by content fingerprint; when a
+    feed repeats a key, the first item with it counts and the rest are ignored.
+    """
+
+    state, new_items = _index(new.channel.items)
+    if old is None:
+        return FeedDiff(added=new_items, state=state)
+    if isinstance(old, RssFeed):
+        old = FeedState.from_items(old.channel.items)
+
+    previous = old.fingerprint_map()
+    fingerprints = state.fingerprints
+    added: list[Item] = []
+    changed: list[Item] = []
+    for index, (key, item) in enumerate(zip(state.keys, new_items)):
+        old_fingerprint = previous.pop(key, None)
+        if old_fingerprint is None:
+            added.append(item)
+        elif (
+            old_fingerprint
+            != fingerprints[index * _DIGEST_SIZE : (index + 1) * _DIGEST_SIZE]
+        ):
+            changed.append(item)
+    return FeedDiff(
+        added=tuple(added),
+        changed=tuple(changed),
+        # What is left of the old mapping is exactly the removed keys, still in
+        # old feed order since dicts keep insertion order.
+        removed=tuple(previous),
+        state=state,
+    )
+
+
+def _index(items: t.Iterable[Item]) -> tuple[FeedState, tuple[Item, ...]]:
+    keys: list[str] = []
+    fingerprints: list[bytes] = []
+    unique: list[Item] = []
+    seen: set[str] = set()
+    for item in items:
+        key = item_key(item)
+        if key in seen:
+            continue
+        seen.add(key)
+        keys.append(key)
+        fingerprints.append(_fingerprint(item))
+        unique.append(item)
+    return FeedState(tuple(keys), b"".join(fingerprints)), tuple(unique)
@@ -0,0 +1,50 @@
+from dataclasses import replace
+
+import pytest
+
+from .diff import FeedState, diff_feeds, item_key
+from .rss import Channel, Guid, Item, RssFeed
+
+
+def _feed(*items: Item) -> RssFeed:
+    return RssFeed(Channel("Feed", "https://example.com/", "", items=items), "2.0")
+
+
+def test_item_key_prefers_guid_then_link_then_content():
+    guid = Guid("urn:1", is_perma_link=False)
+    assert item_key(Item(title="a", link="https://x/", guid=guid)) == "guid:urn:1"
+    assert item_key(Item(title="a", link="https://x/")) == "link:https://x/"
+    assert item_key(Item(title="a")) == item_key(Item(title="a"))
+    assert item_key(Item(title="a")) != item_key(Item(title="b"))
+
+
+def test_diff_feeds_reports_added_changed_and_removed():
+    kept = Item(title="kept", link="https://x/kept")
+    edited = Item(title="edited", link="https://x/edited")
+    gone = Item(title="gone", link="https://x/gone")
+    fresh = Item(title="fresh", guid=Guid("urn:fresh"))
+    old = _feed(kept, edited, gone)
+    new = _feed(fresh, kept, replace(edited, description="now longer"), fresh)
+
+    diff = diff_feeds(old, new)
+    assert diff.added == (fresh,)
+    assert diff.changed == (replace(edited, description="now longer"),)
+    assert diff.removed == ("link:https://x/gone",)
+    assert not diff_feeds(new, new)
+
+    first = diff_feeds(None, old)
+    assert first.added == old.channel.items
+    assert diff_feeds(first.state, new) == diff
+
+
+def test_feed_state_round_trips_bytes():
+    state = diff_feeds(
+        None, _feed(Item(title="é", link="https://x/1"), Item(title="b"))
+    ).state
+    assert len(state) == 2
+    assert FeedState.from_bytes(state.to_bytes()) == state
+    assert FeedState.from_bytes(FeedState().to_bytes()) == FeedState()
+    with pytest.raises(ValueError, match="Corrupt"):
+        FeedState.from_bytes(state.to_bytes()[:-3] + b"\0x")
+    with pytest.raises(ValueError, match="Not FeedState"):
+        FeedState.from_bytes(b"nope" + bytes(8))
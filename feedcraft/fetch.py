@@ -0,0 +1,267 @@
+import asyncio
+import functools
+import time
+import typing as t
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+import httpx
+
+from .rss import ParseOptions, RssFeed, parse_rss
+from .validators import Validators, ValidatorStore
+
+
+class RssFetchError(ValueError):
+    """Raised when a feed cannot be retrieved over HTTP in a usable form."""
+
+
+@dataclass(frozen=True, slots=True)
+class FetchResult:
+    """Outcome of fetching and parsing one feed URL."""
+
+    url: str
+    """The URL that was requested."""
+
+    feed: RssFeed | None = None
+    """The parsed feed, or None when fetching or parsing failed."""
+
+    status: int | None = None
+    """HTTP status code of the final response, or None when no response arrived."""
+
+    error: Exception | None = None
+    """The exception raised while fetching or parsing, or None on success."""
+
+    size: int = 0
+    """Number of body bytes received."""
+
+    elapsed: float = 0.0
+    """Wall-clock seconds from sending the request to having the parsed feed."""
+
+    not_modified: bool = False
+    """True when a conditional request was answered 304 Not Modified; feed is None."""
+
+
+@dataclass(frozen=True, slots=True)
+class FetchStats:
+    """Totals accumulated by an AsyncFeedFetcher since it was created."""
+
+    requests: int
+    """Fetches completed, successful or not."""
+
+    conditional: int
+    """Fetches sent with If-None-Match or If-Modified-Since."""
+
+    not_modified: int
+    """Fetches answered 304 Not Modified, which skipped downloading and parsing."""
+
+    errors: int
+    """Fetches that ended with an error."""
+
+    bytes_received: int
+    """Body bytes received across all fetches."""
+
+    @property
+    def not_modified_rate(self) -> float:
+        return self.not_modified / self.requests if self.requests else 0.0
+
+
+class AsyncFeedFetcher:
+    """Fetch RSS feeds concurrently over one pooled httpx.AsyncClient.
+
+    All requests share a single client, so TCP and TLS connections are reused
+    across feeds on the same host, within the `max_connections` and
+    `max_keepalive_connections` pool limits. At most `max_concurrency` fetches
+    are in flight at once across every caller of the fetcher. Bodies are
+    streamed and abandoned once they exceed `max_body_bytes`, and parsing runs
+    on `executor` (the event loop's default executor unless given) so it never
+    blocks the event loop. Keyword options are those of parse_rss.
+
+    With a `validators` store, each URL's ETag and Last-Modified response
+    headers are remembered once its feed parses, and replayed as
+    If-None-Match and If-Modified-Since; a 304 Not Modified answer then
+    short-circuits into a `not_modified` result without reading or parsing
+    a body. Store calls run on worker threads, since a store shared between
+    processes may wait on a lock.
+
+    A client passed in is used as-is, including its limits and timeouts, and
+    stays owned by the caller; otherwise the fetcher creates one and closes it
+    in aclose(). Use the fetcher as an async context manager to get that for
+    free.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 64,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: httpx.Timeout | float = httpx.Timeout(10.0, connect=5.0),
+        max_body_bytes: int = 16 << 20,
+        headers: t.Mapping[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        executor: Executor | None = None,
+        validators: ValidatorStore | None = None,
+        **options: t.Unpack[ParseOptions],
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_body_bytes = max_body_bytes
+        self._options = options
+        self._executor = executor
+        self._validators = validators
+        self._requests = 0
+        self._conditional = 0
+        self._not_modified = 0
+        self._errors = 0
+        self._bytes_received = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=timeout,
+                headers={"User-Agent": "feedcraft", **(headers or {})},
+                follow_redirects=True,
+            )
+        self._client = client
+
+    async def __aenter__(self) -> t.Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    @property
+    def stats(self) -> FetchStats:
+        return FetchStats(
+            requests=self._requests,
+            conditional=self._conditional,
+            not_modified=self._not_modified,
+            errors=self._errors,
+            bytes_received=self._bytes_received,
+        )
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Fetch and parse one feed; failures are reported on the result."""
+
+        async with self._semaphore:
+            result = await self._fetch(url)
+        self._requests += 1
+        self._bytes_received += result.size
+        if result.not_modified:
+            self._not_modified += 1
+        elif result.error is not None:
+            self._errors += 1
+        return result
+
+    async def _fetch(self, url: str) -> FetchResult:
+        start = time.perf_counter()
+        status: int | None = None
+        size = 0
+        headers: dict[str, str] = {}
+        if self._validators is not None:
+            stored = await asyncio.to_thread(self._validators.get, url)
+            if stored is not None:
+                headers = stored.request_headers()
+                self._conditional += 1
+        try:
+            async with self._client.stream("GET", url, headers=headers) as response:
+                status = response.status_code
+                if status == 304 and headers:
+                    return FetchResult(
+                        url,
+                        status=status,
+                        elapsed=time.perf_counter() - start,
+                        not_modified=True,
+                    )
+                response.raise_for_status()
+                body = await self._read_body(response)
+            size = len(body)
+            feed = await self._parse(body)
+        except Exception as exc:
+            return FetchResult(
+                url,
+                status=status,
+                error=exc,
+                size=size,
+                elapsed=time.perf_counter() - start,
+            )
+        if self._validators is not None:
+            await asyncio.to_thread(
+                _remember_validators, self._validators, url, response.headers
+            )
+        return FetchResult(
+            url,
+            feed=feed,
+            status=status,
+            size=size,
+            elapsed=time.perf_counter() - start,
+        )
+
+    async def fetch_many(self, urls: t.Iterable[str]) -> t.AsyncIterator[FetchResult]:
+        """Fetch many feeds concurrently, yielding results as they complete.
+
+        URLs are consumed lazily, keeping only a bounded window of fetches
+        scheduled at a time, so very long URL lists are fine.
+        """
+
+        window = 2 * self.max_concurrency
+        pending: set[asyncio.Task[FetchResult]] = set()
+        url_iter = iter(urls)
+        try:
+            while True:
+                for url in url_iter:
+                    pending.add(asyncio.create_task(self.fetch(url)))
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        declared = response.headers.get("Content-Length")
+        if declared is not None and declared.isdigit():
+            if int(declared) > self.max_body_bytes:
+                raise RssFetchError(
+                    f"Feed body of {declared} bytes exceeds {self.max_body_bytes}."
+                )
+        chunks: list[bytes] = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > self.max_body_bytes:
+                raise RssFetchError(f"Feed body exceeds {self.max_body_bytes} bytes.")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def _parse(self, body: bytes) -> RssFeed:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(parse_rss, body, **self._options)
+        )
+
+
+def _remember_validators(
+    store: ValidatorStore, url: str, headers: httpx.Headers
+) -> None:
+    # Only called once the body parsed: validators for a broken body would turn
+    # every later poll into a 304 for content we never managed to read.
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        store.delete(url)
+    else:
+        store.put(url, Validators(etag, last_modified))
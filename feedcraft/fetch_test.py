@@ -0,0 +1,161 @@
+import asyncio
+import contextlib
+import http.server
+import pathlib
+import threading
+import typing as t
+
+import httpx
+import pytest
+
+from .fetch import AsyncFeedFetcher, FetchResult, FetchStats, RssFetchError
+from .rss_test import SAMPLE_RSS
+from .validators import MemoryValidatorStore, SqliteValidatorStore, Validators
+
+type Route = t.Callable[[http.server.BaseHTTPRequestHandler], None]
+
+
+def respond(
+    handler: http.server.BaseHTTPRequestHandler,
+    status: int,
+    body: bytes = b"",
+    headers: t.Mapping[str, str] | None = None,
+) -> None:
+    handler.send_response(status)
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+@contextlib.contextmanager
+def serve(routes: t.Mapping[str, Route]) -> t.Iterator[str]:
+    """Serve `routes` (path -> handler) on a local port, yielding the base URL."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            route = routes.get(self.path)
+            if route is None:
+                respond(self, 404)
+            else:
+                route(self)
+
+        do_POST = do_GET
+
+        def log_message(self, format: str, *args: t.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def feed_route(handler: http.server.BaseHTTPRequestHandler) -> None:
+    respond(handler, 200, SAMPLE_RSS.encode(), {"Content-Type": "application/rss+xml"})
+
+
+def test_fetch_parses_feeds():
+    async def run(base: str) -> list[FetchResult]:
+        async with AsyncFeedFetcher(max_concurrency=4) as fetcher:
+            return [r async for r in fetcher.fetch_many([f"{base}/feed"] * 10)]
+
+    with serve({"/feed": feed_route}) as base:
+        results = asyncio.run(run(base))
+
+    assert len(results) == 10
+    assert all(r.status == 200 and r.error is None for r in results)
+    assert all(r.feed is not None and r.feed.channel.items for r in results)
+
+
+def test_fetch_reports_errors():
+    def big(handler: http.server.BaseHTTPRequestHandler) -> None:
+        respond(handler, 200, b"<rss>" + b" " * 2048 + b"</rss>")
+
+    async def run(base: str) -> tuple[FetchResult, FetchResult]:
+        async with AsyncFeedFetcher(max_body_bytes=1024) as fetcher:
+            return await fetcher.fetch(f"{base}/missing"), await fetcher.fetch(
+                f"{base}/big"
+            )
+
+    with serve({"/big": big}) as base:
+        missing, too_big = asyncio.run(run(base))
+
+    assert missing.status == 404
+    assert isinstance(missing.error, httpx.HTTPStatusError)
+    assert isinstance(too_big.error, RssFetchError)
+
+
+def test_fetch_uses_supplied_client():
+    async def run(base: str) -> FetchResult:
+        async with httpx.AsyncClient() as client:
+            async with AsyncFeedFetcher(client=client) as fetcher:
+                result = await fetcher.fetch(f"{base}/feed")
+            assert not client.is_closed
+            return result
+
+    with serve({"/feed": feed_route}) as base:
+        result = asyncio.run(run(base))
+    assert result.feed is not None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_fetch_forwards_parse_options(lazy: bool):
+    async def run(base: str) -> FetchResult:
+        async with AsyncFeedFetcher(max_items=1, lazy=lazy) as fetcher:
+            return await fetcher.fetch(f"{base}/feed")
+
+    with serve({"/feed": feed_route}) as base:
+        result = asyncio.run(run(base))
+    assert result.feed is not None
+    assert len(result.feed.channel.items) == 1
+
+
+def conditional_route(handler: http.server.BaseHTTPRequestHandler) -> None:
+    if handler.headers.get("If-None-Match") == '"v1"':
+        respond(handler, 304)
+    else:
+        respond(handler, 200, SAMPLE_RSS.encode(), {"ETag": '"v1"'})
+
+
+@pytest.mark.parametrize("store_kind", ["memory", "sqlite"])
+def test_fetch_sends_conditional_requests(tmp_path: pathlib.Path, store_kind: str):
+    store = (
+        MemoryValidatorStore()
+        if store_kind == "memory"
+        else SqliteValidatorStore(tmp_path / "validators.sqlite")
+    )
+
+    async def run(base: str) -> tuple[list[FetchResult], FetchStats]:
+        async with AsyncFeedFetcher(validators=store) as fetcher:
+            results = [await fetcher.fetch(f"{base}/feed") for _ in range(3)]
+            return results, fetcher.stats
+
+    with serve({"/feed": conditional_route}) as base:
+        (first, second, third), stats = asyncio.run(run(base))
+
+    assert first.feed is not None and not first.not_modified
+    assert second.not_modified and second.feed is None and second.error is None
+    assert third.not_modified
+    assert store.get(f"{base}/feed") == Validators(etag='"v1"')
+    assert (stats.requests, stats.conditional, stats.not_modified) == (3, 2, 2)
+    assert stats.not_modified_rate == pytest.approx(2 / 3)
+
+
+def test_sqlite_validator_store_persists(tmp_path: pathlib.Path):
+    path = tmp_path / "validators.sqlite"
+    with SqliteValidatorStore(path) as store:
+        store.put("https://example.com/feed", Validators(last_modified="yesterday"))
+    with SqliteValidatorStore(path) as store:
+        assert store.get("https://example.com/feed") == Validators(
+            last_modified="yesterday"
+        )
+        store.delete("https://example.com/feed")
+        assert len(store) == 0
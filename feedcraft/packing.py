@@ -0,0 +1,151 @@
+import dataclasses
+import datetime as dt
+import operator
+import typing as t
+
+from .rss import (
+    Category,
+    Channel,
+    Cloud,
+    Enclosure,
+    Guid,
+    Image,
+    Item,
+    RssFeed,
+    Source,
+    TextInput,
+    _category,
+    _intern,
+)
+
+type PackedFeed = tuple[t.Any, ...]
+
+type _Codec = tuple[t.Callable[[t.Any], t.Any], t.Callable[[t.Any], t.Any]]
+
+
+def pack_feed(feed: RssFeed) -> PackedFeed:
+    """Flatten an RssFeed into nested tuples of plain values for cheap pickling.
+
+    Pickling the dataclass graph directly records a class reference and a
+    __setstate__ call for every Item, Guid, Category and so on; the packed
+    form holds only tuples, str, int, bool and None (datetimes travel as ISO
+    8601 strings), so it pickles cheaply, can be stored with marshal, and is
+    rebuilt with positional constructor calls by unpack_feed.
+    """
+
+    return (feed.version, _pack_channel(feed.channel))
+
+
+def unpack_feed(packed: PackedFeed) -> RssFeed:
+    """Rebuild the RssFeed produced by pack_feed."""
+
+    version, channel = packed
+    return RssFeed(channel=_unpack_channel(channel), version=version)
+
+
+class _Packer:
+    """Pack a dataclass into a tuple of its field values and back, field by field.
+
+    Tuples follow dataclasses.fields() order, which is also the order of the
+    generated __init__ parameters, so instances are rebuilt positionally and
+    adding or reordering fields needs no change here. `codecs` maps the
+    fields that need converting to a (pack, unpack) pair of functions, which
+    are only applied to truthy values: None and empty values pass through.
+    """
+
+    __slots__ = ("_cls", "_get", "_pack", "_unpack")
+
+    def __init__(self, cls: type, codecs: dict[str, _Codec] | None = None) -> None:
+        names = [f.name for f in dataclasses.fields(cls)]
+        codecs = codecs or {}
+        unknown = codecs.keys() - set(names)
+        if unknown:
+            raise ValueError(f"No such {cls.__name__} field(s): {sorted(unknown)}")
+        self._cls = cls
+        self._get = operator.attrgetter(*names)
+        self._pack = [(names.index(name), pack) for name, (pack, _) in codecs.items()]
+        self._unpack = [
+            (names.index(name), unpack) for name, (_, unpack) in codecs.items()
+        ]
+
+    def pack(self, value: t.Any) -> tuple[t.Any, ...]:
+        values = self._get(value)
+        if not self._pack:
+            return values
+        values = list(values)
+        for index, pack in self._pack:
+            if field_value := values[index]:
+                values[index] = pack(field_value)
+        return tuple(values)
+
+    def unpack(self, packed: tuple[t.Any, ...]) -> t.Any:
+        if not self._unpack:
+            return self._cls(*packed)
+        values = list(packed)
+        for index, unpack in self._unpack:
+            if field_value := values[index]:
+                values[index] = unpack(field_value)
+        return self._cls(*values)
+
+    def codec(self) -> _Codec:
+        """Codec for a field holding an instance of this dataclass."""
+
+        return self.pack, self.unpack
+
+
+def _identity(value: t.Any) -> t.Any:
+    return value
+
+
+def _pack_categories(categories: tuple[Category, ...]) -> tuple[t.Any, ...]:
+    return tuple([(category.value, category.domain) for category in categories])
+
+
+def _unpack_categories(packed: tuple[t.Any, ...]) -> tuple[Category, ...]:
+    return tuple([_category(value, domain) for value, domain in packed])
+
+
+_INTERNED: _Codec = (_identity, _intern)
+
+_DATETIME: _Codec = (dt.datetime.isoformat, dt.datetime.fromisoformat)
+
+_CATEGORIES: _Codec = (_pack_categories, _unpack_categories)
+
+_ITEM = _Packer(
+    Item,
+    {
+        "author": _INTERNED,
+        "categories": _CATEGORIES,
+        "enclosure": _Packer(Enclosure, {"media_type": _INTERNED}).codec(),
+        "guid": _Packer(Guid).codec(),
+        "source": _Packer(Source).codec(),
+        "pub_datetime": _DATETIME,
+    },
+)
+
+_CHANNEL = _Packer(
+    Channel,
+    {
+        "language": _INTERNED,
+        "categories": _CATEGORIES,
+        "generator": _INTERNED,
+        "docs": _INTERNED,
+        "cloud": _Packer(Cloud).codec(),
+        "image": _Packer(Image).codec(),
+        "text_input": _Packer(TextInput).codec(),
+        "pub_datetime": _DATETIME,
+        "last_build_datetime": _DATETIME,
+        "items": (
+            lambda items: tuple([_ITEM.pack(item) for item in items]),
+            lambda items: tuple([_ITEM.unpack(item) for item in items]),
+        ),
+    },
+)
+
+
+def _pack_channel(channel: Channel) -> tuple[t.Any, ...]:
+    return _CHANNEL.pack(channel)
+
+
+def _unpack_channel(packed: tuple[t.Any, ...]) -> Channel:
+    return _CHANNEL.unpack(packed)
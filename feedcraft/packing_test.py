@@ -0,0 +1,90 @@
+import dataclasses
+import datetime as dt
+import marshal
+import pickle
+
+from .packing import pack_feed, unpack_feed
+from .rss import (
+    Category,
+    Channel,
+    Cloud,
+    Enclosure,
+    Guid,
+    Image,
+    Item,
+    RssFeed,
+    Source,
+    TextInput,
+    parse_rss,
+)
+from .rss_test import SAMPLE_RSS
+
+
+def test_pack_feed_round_trip():
+    feed = parse_rss(SAMPLE_RSS)
+    packed = pickle.loads(pickle.dumps(pack_feed(feed)))
+    assert unpack_feed(packed) == feed
+
+
+def test_pack_feed_materializes_lazy_items():
+    feed = parse_rss(SAMPLE_RSS, lazy=True)
+    assert unpack_feed(pack_feed(feed)) == parse_rss(SAMPLE_RSS)
+
+
+def test_pack_feed_carries_every_field():
+    published = dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.UTC)
+    item = Item(
+        title="t",
+        link="https://x/",
+        description="d",
+        author="a@x",
+        categories=(Category("c", "dom"),),
+        comments="https://x/c",
+        enclosure=Enclosure("https://x/e.mp3", 1, "audio/mpeg"),
+        guid=Guid("g", is_perma_link=False),
+        pub_date="Tue, 02 Jan 2024 03:04:05 GMT",
+        source=Source("s", "https://s/"),
+        pub_datetime=published,
+        pub_timestamp=int(published.timestamp()),
+    )
+    channel = Channel(
+        title="t",
+        link="https://x/",
+        description="d",
+        language="en",
+        copyright="c",
+        managing_editor="m@x",
+        web_master="w@x",
+        pub_date=item.pub_date,
+        last_build_date=item.pub_date,
+        categories=(Category("c"),),
+        generator="g",
+        docs="https://docs/",
+        cloud=Cloud("rpc.x", 80, "/RPC2", "x.register", "xml-rpc"),
+        ttl=60,
+        image=Image("https://x/i.png", "t", "https://x/", 10, 20, "i"),
+        rating="r",
+        text_input=TextInput("t", "d", "q", "https://x/s"),
+        skip_hours=(1,),
+        skip_days=("Monday",),
+        items=(item,),
+        pub_datetime=published,
+        last_build_datetime=published,
+        invalid_dates=("bad",),
+        hub_links=("https://hub/",),
+        self_link="https://x/feed",
+    )
+    for value, default in ((item, Item()), (channel, Channel("", "", ""))):
+        unset = [
+            f.name
+            for f in dataclasses.fields(value)
+            if getattr(value, f.name) == getattr(default, f.name)
+        ]
+        assert unset == [], "extend this test to cover the new fields"
+
+    # Only marshal-able primitives, so DiskParseCache can store it without pickle.
+    packed = marshal.loads(marshal.dumps(pack_feed(RssFeed(channel, "2.0"))))
+    unpacked = unpack_feed(packed).channel
+    for original, copy in ((channel, unpacked), (item, unpacked.items[0])):
+        for f in dataclasses.fields(original):
+            assert getattr(copy, f.name) == getattr(original, f.name), f.name
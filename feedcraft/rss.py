@@ -1,10 +1,20 @@
+import abc
+import contextlib
 import datetime as dt
+import functools
+import io
+import mmap
+import os
+import threading
 import typing as t
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from dataclasses import fields as dataclass_fields
 from email.utils import parsedate_to_datetime
 
 from bs4 import BeautifulSoup, FeatureNotFound
 from bs4.element import Tag
+from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
 
 type Weekday = t.Literal[
     "Monday",
@@ -16,6 +26,56 @@ type Weekday = t.Literal[
     "Sunday",
 ]
 
+type Backend = t.Literal["auto", "lxml", "soup"]
+
+type RssSource = str | bytes | memoryview | t.BinaryIO
+
+type ItemField = t.Literal[
+    "title",
+    "link",
+    "description",
+    "author",
+    "categories",
+    "comments",
+    "enclosure",
+    "guid",
+    "pub_date",
+    "source",
+]
+
+type ChannelField = t.Literal[
+    "language",
+    "copyright",
+    "managing_editor",
+    "web_master",
+    "pub_date",
+    "last_build_date",
+    "categories",
+    "generator",
+    "docs",
+    "cloud",
+    "ttl",
+    "image",
+    "rating",
+    "text_input",
+    "skip_hours",
+    "skip_days",
+    "hub_links",
+    "self_link",
+]
+
+
+class ParseOptions(t.TypedDict, total=False):
+    """Keyword options of parse_rss, for APIs that forward them unchanged."""
+
+    backend: Backend
+    fields: t.Iterable[ItemField] | None
+    channel_fields: t.Iterable[ChannelField] | None
+    max_items: int | None
+    since: dt.datetime | None
+    newest_first: bool
+    lazy: bool
+
 
 @dataclass(frozen=True, slots=True)
 class Category:
@@ -182,11 +242,127 @@ class Item:
     source: Source | None = None
     """Channel from which the item originated; includes the source channel's title and URL."""
 
+    pub_datetime: dt.datetime | None = field(default=None, compare=False)
+    """pub_date parsed to an aware datetime; None when pub_date is absent or invalid.
+
+    Derived from pub_date, so it is left out of comparisons and hashing.
+    """
+
+    pub_timestamp: int | None = field(default=None, compare=False)
+    """pub_datetime as whole seconds since the Unix epoch, for cheap sorting and filtering."""
+
     def validate(self) -> None:
         if self.title is None and self.description is None:
             raise ValueError("RSS items require at least a title or a description.")
 
 
+_UNPARSED: t.Any = object()
+
+
+class _LazyField[T]:
+    """Descriptor that parses one Item attribute from the retained element on first access."""
+
+    __slots__ = ("_cache", "_parse")
+
+    def __init__(self, cache: str, parse: t.Callable[["_Element"], T]) -> None:
+        self._cache = cache
+        self._parse = parse
+
+    @t.overload
+    def __get__(self, obj: None, objtype: type | None = None) -> t.Self: ...
+
+    @t.overload
+    def __get__(self, obj: "LazyItem", objtype: type | None = None) -> T: ...
+
+    def __get__(
+        self, obj: "LazyItem | None", objtype: type | None = None
+    ) -> "T | t.Self":
+        if obj is None:
+            return self
+        value = getattr(obj, self._cache)
+        if value is _UNPARSED:
+            value = self._parse(obj._item_tag)
+            object.__setattr__(obj, self._cache, value)
+        return value
+
+    def __set__(self, obj: "LazyItem", value: T) -> None:
+        # Only reached from Item.__init__ (e.g. via dataclasses.replace), since
+        # the frozen dataclass __setattr__ rejects ordinary assignment.
+        object.__setattr__(obj, self._cache, value)
+
+
+class LazyItem(Item):
+    """An Item that parses description, categories, enclosure and source on first access.
+
+    Lazy items keep a reference to their parsed element, so the document tree
+    stays alive for as long as any of its lazy items do. Each lazily parsed
+    attribute is cached after its first access. Lazy items compare, hash and
+    pickle exactly like the equivalent Item; unpickling yields a plain Item.
+    """
+
+    __slots__ = ("_categories", "_description", "_enclosure", "_item_tag", "_source")
+
+    # Overriding the dataclass fields with descriptors is the point of this class.
+    description = _LazyField(
+        "_description", lambda tag: _optional_child_text(tag, "description")
+    )  # pyright: ignore[reportIncompatibleVariableOverride, reportAssignmentType]
+    categories = _LazyField("_categories", lambda tag: _parse_categories(tag))  # pyright: ignore[reportIncompatibleVariableOverride, reportAssignmentType]
+    enclosure = _LazyField("_enclosure", lambda tag: _parse_enclosure(tag))  # pyright: ignore[reportIncompatibleVariableOverride, reportAssignmentType]
+    source = _LazyField("_source", lambda tag: _parse_source(tag))  # pyright: ignore[reportIncompatibleVariableOverride, reportAssignmentType]
+
+    _item_tag: "_Element"
+
+    @classmethod
+    def _from_element(
+        cls,
+        item_tag: "_Element",
+        fields: frozenset[str],
+        *,
+        title: str | None,
+        link: str | None,
+        author: str | None,
+        comments: str | None,
+        guid: Guid | None,
+        pub_date: str | None,
+        pub_datetime: dt.datetime | None,
+    ) -> "LazyItem":
+        item = object.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(item, "_item_tag", item_tag)
+        set_attr(item, "title", title)
+        set_attr(item, "link", link)
+        set_attr(item, "author", author)
+        set_attr(item, "comments", comments)
+        set_attr(item, "guid", guid)
+        set_attr(item, "pub_date", pub_date)
+        set_attr(item, "pub_datetime", pub_datetime)
+        set_attr(item, "pub_timestamp", _timestamp(pub_datetime))
+        # Projected-away attributes keep their defaults instead of parsing later.
+        set_attr(item, "_description", _UNPARSED if "description" in fields else None)
+        set_attr(item, "_categories", _UNPARSED if "categories" in fields else ())
+        set_attr(item, "_enclosure", _UNPARSED if "enclosure" in fields else None)
+        set_attr(item, "_source", _UNPARSED if "source" in fields else None)
+        return item
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Item):
+            return NotImplemented
+        return _compared_values(self) == _compared_values(other)
+
+    __hash__ = Item.__hash__
+
+    def __reduce__(self) -> tuple[type[Item], tuple[t.Any, ...]]:
+        return (Item, _item_values(self))
+
+
+def _item_values(item: Item) -> tuple[t.Any, ...]:
+    return tuple(getattr(item, f.name) for f in dataclass_fields(Item))
+
+
+def _compared_values(item: Item) -> tuple[t.Any, ...]:
+    return tuple(getattr(item, f.name) for f in dataclass_fields(Item) if f.compare)
+
+
 @dataclass(frozen=True, slots=True)
 class Channel:
     """Encapsulates the required metadata and content elements of an RSS <channel>."""
@@ -251,6 +427,21 @@ class Channel:
     items: tuple[Item, ...] = field(default_factory=tuple)
     """Ordered collection of items contained in the channel; a channel may include any number."""
 
+    pub_datetime: dt.datetime | None = field(default=None, compare=False)
+    """pub_date parsed to an aware datetime; None when pub_date is absent or invalid."""
+
+    last_build_datetime: dt.datetime | None = field(default=None, compare=False)
+    """last_build_date parsed to an aware datetime; None when absent or invalid."""
+
+    invalid_dates: tuple[str, ...] = field(default_factory=tuple, compare=False)
+    """Distinct channel and item date strings that could not be parsed, channel ones first."""
+
+    hub_links: tuple[str, ...] = field(default_factory=tuple)
+    """WebSub hub URLs advertised by <atom:link rel="hub"> elements."""
+
+    self_link: str | None = None
+    """Canonical feed URL from <atom:link rel="self">; the topic to subscribe to at a hub."""
+
     def validate(self) -> None:
         if len(self.skip_hours) > 24:
             raise ValueError("skip_hours may contain at most 24 entries.")
@@ -288,8 +479,25 @@ class RssParseError(ValueError):
     """Raised when an RSS document cannot be parsed into the expected RSS 2.0 structure."""
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_rfc822_date(value: str) -> dt.datetime:
-    """Parse an RFC 822 date-time string as used by RSS <pubDate> and <lastBuildDate>."""
+    """Parse an RFC 822 date-time string as used by RSS <pubDate> and <lastBuildDate>.
+
+    The common `Day, DD Mon YYYY HH:MM[:SS] +ZZZZ` and `GMT` shapes are parsed
+    directly; anything else goes through email.utils. Results are memoized,
+    since feeds repeat the same few timestamps over and over.
+    """
+
+    if not value:
+        raise RssDateError("RSS date strings must be non-empty.")
+    parsed = _parse_rfc822_date_fast(value)
+    if parsed is None:
+        parsed = _parse_rfc822_date_stdlib(value)
+    return parsed
+
+
+def _parse_rfc822_date_stdlib(value: str) -> dt.datetime:
+    """Reference implementation of parse_rfc822_date on top of email.utils."""
 
     if not value:
         raise RssDateError("RSS date strings must be non-empty.")
@@ -304,6 +512,78 @@ def parse_rfc822_date(value: str) -> dt.datetime:
     return parsed
 
 
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun")
+        + ("jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+
+_TWO_DIGITS = {f"{number:02d}": number for number in range(100)}
+
+_DAYS = {**{str(day): day for day in range(1, 10)}, **_TWO_DIGITS}
+
+_ZONES = {zone: dt.timezone.utc for zone in ("GMT", "UT", "UTC", "Z", "+0000", "-0000")}
+
+
+def _parse_rfc822_date_fast(value: str) -> dt.datetime | None:
+    # Returns None for anything outside the common shapes, and for anything the
+    # stdlib would reject, so that the reference implementation has the last word.
+    if not value.isascii():
+        return None
+    parts = value.split()
+    if len(parts) == 6:
+        if not parts[0].endswith(","):
+            return None
+        _, day, month_name, year, clock, zone = parts
+    elif len(parts) == 5:
+        day, month_name, year, clock, zone = parts
+    else:
+        return None
+
+    mday = _DAYS.get(day)
+    month = _MONTHS.get(month_name.lower())
+    # email.utils maps years below 100 into 1969-2068, even when zero-padded.
+    if (
+        mday is None
+        or month is None
+        or len(year) != 4
+        or not year.isdigit()
+        or year[0] == "0"
+    ):
+        return None
+
+    if len(clock) == 8 and clock[2] == clock[5] == ":":
+        second = _TWO_DIGITS.get(clock[6:])
+    elif len(clock) == 5 and clock[2] == ":":
+        second = 0
+    else:
+        return None
+    hour = _TWO_DIGITS.get(clock[:2])
+    minute = _TWO_DIGITS.get(clock[3:5])
+    if hour is None or minute is None or second is None:
+        return None
+
+    tzinfo = _ZONES.get(zone)
+    if tzinfo is None:
+        if len(zone) != 5 or zone[0] not in "+-" or not zone[1:].isdigit():
+            return None
+        offset = int(zone[1:3]) * 3600 + int(zone[3:]) * 60
+        if offset >= 86400:
+            return None
+        tzinfo = dt.timezone(
+            dt.timedelta(seconds=-offset if zone[0] == "-" else offset)
+        )
+        _ZONES[zone] = tzinfo
+
+    try:
+        return dt.datetime(int(year), month, mday, hour, minute, second, tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
 def parse_optional_rfc822_date(value: str | None) -> dt.datetime | None:
     """Parse an optional RSS date string, returning None when the input is None."""
 
@@ -312,17 +592,55 @@ def parse_optional_rfc822_date(value: str | None) -> dt.datetime | None:
     return parse_rfc822_date(value)
 
 
-def parse_rss(rss: str) -> RssFeed:
-    """Parse an RSS 2.0 document using BeautifulSoup with defensive input checks."""
-
-    try:
-        soup = BeautifulSoup(rss, "xml")
-    except FeatureNotFound:
-        soup = BeautifulSoup(rss, "html.parser")
-    except Exception as exc:  # pragma: no cover - BeautifulSoup rarely raises
-        raise RssParseError("Unable to parse RSS XML document.") from exc
-
-    rss_tag = soup.find("rss")
+def parse_rss(
+    rss: RssSource,
+    *,
+    backend: Backend = "auto",
+    fields: t.Iterable[ItemField] | None = None,
+    channel_fields: t.Iterable[ChannelField] | None = None,
+    max_items: int | None = None,
+    since: dt.datetime | None = None,
+    newest_first: bool = True,
+    lazy: bool = False,
+) -> RssFeed:
+    """Parse an RSS 2.0 document with the chosen backend and defensive input checks.
+
+    The "lxml" backend works directly on lxml.etree elements and is strict about
+    well-formedness; the "soup" backend builds a BeautifulSoup tree and tolerates
+    broken markup. The default "auto" backend tries lxml first and falls back to
+    BeautifulSoup when the document is not well-formed XML.
+
+    Bytes, memoryviews and binary file objects are handed to the XML layer
+    undecoded, so the byte order mark or XML declaration decides the encoding.
+    A str is treated as already-decoded text and any declared encoding ignored.
+
+    `fields` and `channel_fields` project the result onto the named Item and
+    Channel attributes; elements behind any other attribute are never
+    text-extracted and the attribute keeps its default. A channel's title, link,
+    description and items are always parsed. Items are still skipped when they
+    have neither a <title> nor a <description>, whether or not those are
+    projected, but projected items are not otherwise validated.
+
+    `max_items` stops item extraction once that many items have been built.
+    `since` keeps only items published strictly after the given moment (naive
+    datetimes are taken as UTC); items without a parseable <pubDate> are always
+    kept. With `newest_first` (the default) the feed is assumed to list items
+    newest first, so extraction stops at the first item at or before `since`;
+    pass False for feeds in arbitrary order to check every item instead.
+
+    Channel and item dates are also parsed in one pass over the distinct date
+    strings of the channel, into the pub_datetime, last_build_datetime and
+    pub_timestamp fields; strings that fail to parse are listed in
+    Channel.invalid_dates instead of raising.
+
+    With `lazy`, items are LazyItem instances that defer their description,
+    categories, enclosure and source until first access.
+    """
+
+    item_fields = _project(ItemField, fields)
+    channel_field_set = _project(ChannelField, channel_fields)
+
+    rss_tag = _load_root(rss, backend)
     if rss_tag is None:
         raise RssParseError("Missing <rss> root element.")
 
@@ -333,37 +651,353 @@ def parse_rss(rss: str) -> RssFeed:
     if channel_tag is None:
         raise RssParseError("Missing <channel> element inside <rss>.")
 
-    channel = Channel(
-        title=_require_child_text(channel_tag, "title"),
-        link=_require_child_text(channel_tag, "link"),
-        description=_require_child_text(channel_tag, "description"),
-        language=_optional_child_text(channel_tag, "language"),
-        copyright=_optional_child_text(channel_tag, "copyright"),
-        managing_editor=_optional_child_text(channel_tag, "managingEditor"),
-        web_master=_optional_child_text(channel_tag, "webMaster"),
-        pub_date=_optional_child_text(channel_tag, "pubDate"),
-        last_build_date=_optional_child_text(channel_tag, "lastBuildDate"),
-        categories=_parse_categories(channel_tag),
-        generator=_optional_child_text(channel_tag, "generator"),
-        docs=_optional_child_text(channel_tag, "docs"),
-        cloud=_parse_cloud(channel_tag),
-        ttl=_parse_int(_optional_child_text(channel_tag, "ttl")),
-        image=_parse_image(channel_tag),
-        rating=_optional_child_text(channel_tag, "rating"),
-        text_input=_parse_text_input(channel_tag),
-        skip_hours=_parse_skip_hours(channel_tag),
-        skip_days=_parse_skip_days(channel_tag),
-        items=_parse_items(channel_tag),
+    dates: dict[str, dt.datetime | None] = {}
+    channel = _parse_channel(
+        channel_tag,
+        _parse_items(
+            channel_tag,
+            item_fields,
+            max_items=max_items,
+            since=since,
+            newest_first=newest_first,
+            lazy=lazy,
+            dates=dates,
+        ),
+        channel_field_set,
+        dates,
     )
 
     feed = RssFeed(channel=channel, version=version)
     channel.validate()
-    for item in channel.items:
-        item.validate()
+    if fields is None:
+        for item in channel.items:
+            item.validate()
     feed.validate()
     return feed
 
 
+def parse_rss_file(
+    path: str | os.PathLike[str], **options: t.Unpack[ParseOptions]
+) -> RssFeed:
+    """Parse the RSS 2.0 document at `path` straight from a read-only memory map.
+
+    The file is never copied into a Python str or bytes object: the mapped pages
+    are handed to the XML layer as a buffer, so large documents do not cost an
+    extra resident copy and concurrent processes share the same page cache.
+    Keyword options are those of parse_rss.
+    """
+
+    with map_rss_file(path) as view:
+        return parse_rss(view, **options)
+
+
+@contextlib.contextmanager
+def map_rss_file(
+    path: str | os.PathLike[str], *, kind: str = "RSS"
+) -> t.Iterator[memoryview]:
+    """Memory-map the document at `path` read-only and yield a view of its bytes.
+
+    The view must not be used after the context exits. Empty files cannot be
+    mapped and raise RssParseError, whose message names the document `kind`.
+    """
+
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # raised for empty files, which cannot be mapped
+            raise RssParseError(f"Empty {kind} document: {path}") from exc
+    with mapped, memoryview(mapped) as view:
+        yield view
+
+
+def iter_rss_items(
+    source: RssSource | os.PathLike[str],
+    *,
+    fields: t.Iterable[ItemField] | None = None,
+    channel_fields: t.Iterable[ChannelField] | None = None,
+) -> "RssItemStream":
+    """Incrementally parse an RSS 2.0 document, yielding each item as its </item> closes.
+
+    `source` is anything parse_rss accepts, or a path to the document. Unlike
+    parse_rss, the whole tree is never held in memory: each item is converted to
+    an Item and then detached from the tree, so peak memory stays roughly flat
+    regardless of how many items the feed carries. Streaming always uses lxml
+    and is therefore strict about well-formedness. `fields` and `channel_fields`
+    project the results exactly as they do for parse_rss.
+    """
+
+    return RssItemStream(source, fields=fields, channel_fields=channel_fields)
+
+
+class RssItemStream:
+    """Iterator of Items from an incrementally parsed RSS document; see iter_rss_items."""
+
+    __slots__ = ("_channel_fields", "_fields", "_items", "channel", "version")
+
+    channel: Channel | None
+    """Channel metadata with empty items, available once the stream is exhausted."""
+
+    version: str | None
+    """Version attribute of the <rss> element, available once the root has been read."""
+
+    def __init__(
+        self,
+        source: RssSource | os.PathLike[str],
+        *,
+        fields: t.Iterable[ItemField] | None = None,
+        channel_fields: t.Iterable[ChannelField] | None = None,
+    ) -> None:
+        self.channel = None
+        self.version = None
+        self._fields = _project(ItemField, fields)
+        self._channel_fields = _project(ChannelField, channel_fields)
+        self._items = self._iter_items(source)
+
+    def __iter__(self) -> t.Iterator[Item]:
+        return self
+
+    def __next__(self) -> Item:
+        return next(self._items)
+
+    def _iter_items(self, source: RssSource | os.PathLike[str]) -> t.Iterator[Item]:
+        if isinstance(source, str):
+            yield from self._iter_events(io.BytesIO(source.encode("utf-8")), "utf-8")
+        elif isinstance(source, (bytes, memoryview)):
+            yield from self._iter_events(io.BytesIO(source), None)
+        elif isinstance(source, os.PathLike):
+            with open(source, "rb") as f:
+                yield from self._iter_events(f, None)
+        else:
+            yield from self._iter_events(source, None)
+
+    def _iter_events(self, f: t.BinaryIO, encoding: str | None) -> t.Iterator[Item]:
+        events = etree.iterparse(
+            f,
+            events=("start", "end"),
+            tag=("rss", "channel", "item"),
+            encoding=encoding,
+            resolve_entities="internal",
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        rss_el = None
+        channel_el = None
+        try:
+            for event, el in events:
+                if event == "start":
+                    if rss_el is None:
+                        if el.tag == "rss":
+                            rss_el = el
+                            self.version = el.get("version") or "2.0"
+                    elif el.tag == "channel" and el.getparent() is rss_el:
+                        if channel_el is not None:
+                            raise RssParseError(
+                                "Multiple <channel> elements found where only one expected."
+                            )
+                        channel_el = el
+                elif channel_el is None:
+                    continue
+                elif el.tag == "item" and el.getparent() is channel_el:
+                    item = _parse_item(_LxmlElement(el), self._fields)
+                    # Detach the finished item so the tree only ever holds
+                    # channel metadata plus the item currently being read.
+                    channel_el.remove(el)
+                    if item is not None:
+                        yield item
+                elif el is channel_el:
+                    channel = _parse_channel(_LxmlElement(el), (), self._channel_fields)
+                    channel.validate()
+                    self.channel = channel
+        except etree.XMLSyntaxError as exc:
+            raise RssParseError(f"Unable to parse RSS XML document: {exc}") from exc
+
+        if rss_el is None:
+            raise RssParseError("Missing <rss> root element.")
+        if channel_el is None:
+            raise RssParseError("Missing <channel> element inside <rss>.")
+
+
+def _load_root(
+    source: RssSource,
+    backend: Backend,
+    *,
+    tags: tuple[str, ...] = ("rss",),
+    kind: str = "RSS",
+) -> "_Element | None":
+    """Parse `source` with `backend` and return its element named one of `tags`.
+
+    The root element itself is preferred, then the first such element anywhere
+    in the document; None when there is none. soup matches local names only,
+    so namespaced `tags` in Clark notation need their bare name listed as
+    well. Parse errors name the document `kind`.
+    """
+
+    if backend == "lxml":
+        return _load_lxml(source, tags, kind)
+    if backend == "soup":
+        return _load_soup(source, tags, kind)
+    if backend != "auto":
+        raise ValueError(f"Unknown RSS parsing backend: {backend!r}")
+    if not isinstance(source, (str, bytes, memoryview)):
+        # The soup fallback may need the document a second time.
+        source = source.read()
+    try:
+        return _load_lxml(source, tags, kind)
+    except RssParseError:
+        return _load_soup(source, tags, kind)
+
+
+def _load_soup(
+    rss: RssSource, tags: tuple[str, ...] = ("rss",), kind: str = "RSS"
+) -> "_Element | None":
+    if isinstance(rss, memoryview):
+        rss = rss.tobytes()
+    try:
+        soup = BeautifulSoup(rss, "xml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(rss, "html.parser")
+    except Exception as exc:  # pragma: no cover - BeautifulSoup rarely raises
+        raise RssParseError(f"Unable to parse {kind} XML document.") from exc
+
+    rss_tag = soup.find(list(tags))
+    if rss_tag is None:
+        return None
+    return _SoupElement(rss_tag)
+
+
+def _new_lxml_parser(encoding: str | None = None) -> etree.XMLParser:
+    # lxml parsers are not safe to share between threads, so each parse gets its own.
+    return etree.XMLParser(
+        encoding=encoding,
+        resolve_entities="internal",
+        no_network=True,
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+
+def _load_lxml(
+    rss: RssSource, tags: tuple[str, ...] = ("rss",), kind: str = "RSS"
+) -> "_Element | None":
+    try:
+        if isinstance(rss, str):
+            # lxml rejects str input that carries an encoding declaration, so
+            # re-encode and tell the parser to ignore whatever was declared.
+            root = etree.fromstring(rss.encode("utf-8"), _new_lxml_parser("utf-8"))
+        elif isinstance(rss, (bytes, memoryview)):
+            root = etree.fromstring(rss, _new_lxml_parser())
+        else:
+            root = etree.parse(rss, _new_lxml_parser()).getroot()
+    except etree.XMLSyntaxError as exc:
+        raise RssParseError(f"Unable to parse {kind} XML document: {exc}") from exc
+
+    if root.tag in tags:
+        return _LxmlElement(root)
+    rss_el = next(root.iter(*tags), None)
+    if rss_el is None:
+        return None
+    return _LxmlElement(rss_el)
+
+
+class _Element(abc.ABC):
+    """Backend-neutral, read-only view over a parsed element used by the _parse_* helpers.
+
+    Direct children are grouped by tag name in a single pass the first time any
+    child is looked up, so extracting every field of a channel or item costs one
+    walk over its children rather than one walk per field. Children outside any
+    namespace are keyed by their bare name; namespaced children are keyed in
+    Clark notation ("{uri}local").
+    """
+
+    __slots__ = ("_children",)
+
+    def __init__(self) -> None:
+        self._children: dict[str, list[_Element]] | None = None
+
+    def children(self, name: str) -> t.Sequence["_Element"]:
+        """Return the direct children with the given key, in document order."""
+        children = self._children
+        if children is None:
+            children = self._children = self._index_children()
+        return children.get(name, ())
+
+    def has_child(self, name: str) -> bool:
+        """Report whether at least one direct child with the given key exists."""
+        return bool(self.children(name))
+
+    @abc.abstractmethod
+    def _index_children(self) -> dict[str, list["_Element"]]: ...
+
+    @abc.abstractmethod
+    def get_attr(self, name: str) -> str | None:
+        """Return the raw value of an attribute, or None when absent."""
+
+    @abc.abstractmethod
+    def get_text(self) -> str:
+        """Return the concatenated text content of the element and its descendants."""
+
+
+class _SoupElement(_Element):
+    __slots__ = ("tag",)
+
+    def __init__(self, tag: Tag) -> None:
+        super().__init__()
+        self.tag = tag
+
+    def _index_children(self) -> dict[str, list[_Element]]:
+        index: dict[str, list[_Element]] = {}
+        for child in self.tag.children:
+            if not isinstance(child, Tag):
+                continue
+            if child.namespace is None:
+                key = child.name
+            else:
+                key = f"{{{child.namespace}}}{_local_name(child.name)}"
+            bucket = index.get(key)
+            if bucket is None:
+                index[key] = [_SoupElement(child)]
+            else:
+                bucket.append(_SoupElement(child))
+        return index
+
+    def get_attr(self, name: str) -> str | None:
+        return _normalize_attr(self.tag.attrs.get(name))
+
+    def get_text(self) -> str:
+        if self.tag.string is not None:
+            return self.tag.string
+        return self.tag.get_text()
+
+
+class _LxmlElement(_Element):
+    __slots__ = ("el",)
+
+    def __init__(self, el: etree._Element) -> None:
+        super().__init__()
+        self.el = el
+
+    def _index_children(self) -> dict[str, list[_Element]]:
+        # lxml tags are already bare names or Clark notation, matching our keys.
+        index: dict[str, list[_Element]] = {}
+        for child in self.el.iterchildren(etree.Element):
+            key = child.tag
+            bucket = index.get(key)
+            if bucket is None:
+                index[key] = [_LxmlElement(child)]
+            else:
+                bucket.append(_LxmlElement(child))
+        return index
+
+    def get_attr(self, name: str) -> str | None:
+        return self.el.get(name)
+
+    def get_text(self) -> str:
+        if len(self.el) == 0:
+            return self.el.text or ""
+        return "".join(self.el.itertext())
+
+
 def _local_name(tag_name: str) -> str:
     return tag_name.split(":", 1)[-1]
 
@@ -387,24 +1021,18 @@ def _normalize_attr(value: t.Any) -> str | None:
     return str(value)
 
 
-def _get_attr(tag: Tag, name: str, *, strip: bool = True) -> str | None:
-    raw = tag.attrs.get(name)
-    value = _normalize_attr(raw)
+def _get_attr(tag: _Element, name: str, *, strip: bool = True) -> str | None:
+    value = tag.get_attr(name)
     if value is None:
         return None
     return value.strip() if strip else value
 
 
-def _find_direct_children(parent: Tag, name: str) -> list[Tag]:
-    matches: list[Tag] = [
-        child
-        for child in parent.children
-        if isinstance(child, Tag) and child.name == name and child.namespace is None
-    ]
-    return matches
+def _find_direct_children(parent: _Element, name: str) -> t.Sequence[_Element]:
+    return parent.children(name)
 
 
-def _find_direct_child(parent: Tag, name: str) -> Tag | None:
+def _find_direct_child(parent: _Element, name: str) -> _Element | None:
     children = _find_direct_children(parent, name)
     if len(children) == 1:
         return children[0]
@@ -415,15 +1043,10 @@ def _find_direct_child(parent: Tag, name: str) -> Tag | None:
     return None
 
 
-def _get_text(node, *, strip: bool = True) -> str | None:
+def _get_text(node: _Element | None, *, strip: bool = True) -> str | None:
     if node is None:
         return None
-    if node.string is not None:
-        text = node.string
-    else:
-        text = node.get_text()
-    if text is None:
-        return None
+    text = node.get_text()
     return text.strip() if strip else text
 
 
@@ -435,9 +1058,59 @@ def _require_child_text(parent, name: str) -> str:
     return value
 
 
-def _optional_child_text(parent, name: str) -> str | None:
+def _optional_child_text(parent, name: str, *, interned: bool = False) -> str | None:
     child = _find_direct_child(parent, name)
-    return _get_text(child)
+    value = _get_text(child)
+    if interned and value is not None:
+        return _intern(value)
+    return value
+
+
+class _InternPool[K, V]:
+    """Bounded mapping handing out one shared value per key; the oldest entry goes first."""
+
+    __slots__ = ("_entries", "_lock", "max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+
+    def get(self, key: K) -> V | None:
+        return self._entries.get(key)
+
+    def add(self, key: K, value: V) -> V:
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            if len(self._entries) > self.max_size:
+                # Deleting the first key of a plain dict leaves a dead slot that
+                # every later eviction must skip; OrderedDict pops in O(1).
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Only short values are pooled: repetitive fields (authors, MIME types, category
+# names, generators) are short, and long one-off strings should not be pinned.
+_INTERN_MAX_LENGTH = 256
+
+_STRINGS: _InternPool[str, str] = _InternPool(1 << 16)
+
+_CATEGORIES: _InternPool[tuple[str, str | None], Category] = _InternPool(1 << 14)
+
+
+def _intern(value: str) -> str:
+    """Return the pooled copy of a low-cardinality string value."""
+
+    if len(value) > _INTERN_MAX_LENGTH:
+        return value
+    pooled = _STRINGS.get(value)
+    if pooled is None:
+        pooled = _STRINGS.add(value, value)
+    return pooled
 
 
 def _parse_categories(parent) -> tuple[Category, ...]:
@@ -447,10 +1120,28 @@ def _parse_categories(parent) -> tuple[Category, ...]:
         if not value:
             continue
         domain = _get_attr(cat, "domain")
-        categories.append(Category(value=value, domain=domain))
+        categories.append(_category(value, domain))
     return tuple(categories)
 
 
+def _category(value: str, domain: str | None) -> Category:
+    """Return a shared Category; they are immutable, so identical ones are flyweights."""
+
+    key = (value, domain)
+    category = _CATEGORIES.get(key)
+    if category is None:
+        if len(value) > _INTERN_MAX_LENGTH:
+            return Category(value=value, domain=domain)
+        category = _CATEGORIES.add(
+            key,
+            Category(
+                value=_intern(value),
+                domain=None if domain is None else _intern(domain),
+            ),
+        )
+    return category
+
+
 def _parse_cloud(parent) -> Cloud | None:
     cloud_tag = _find_direct_child(parent, "cloud")
     if cloud_tag is None:
@@ -552,7 +1243,7 @@ def _parse_skip_days(parent) -> tuple[Weekday, ...]:
     skip_days_tag = _find_direct_child(parent, "skipDays")
     if skip_days_tag is None:
         return tuple()
-    valid_days: set[str] = set(t.get_args(Weekday))
+    valid_days: set[str] = set(t.get_args(Weekday.__value__))
     days: list[Weekday] = []
     for day_tag in _find_direct_children(skip_days_tag, "day"):
         value = _get_text(day_tag)
@@ -564,40 +1255,221 @@ def _parse_skip_days(parent) -> tuple[Weekday, ...]:
     return tuple(days)
 
 
-def _parse_items(parent) -> tuple[Item, ...]:
-    items: list[Item] = []
-    for item_tag in _find_direct_children(parent, "item"):
-        title = _optional_child_text(item_tag, "title")
-        link = _optional_child_text(item_tag, "link")
-        description = _optional_child_text(item_tag, "description")
-        author = _optional_child_text(item_tag, "author")
-        comments = _optional_child_text(item_tag, "comments")
-        pub_date = _optional_child_text(item_tag, "pubDate")
-        guid = _parse_guid(item_tag)
-        enclosure = _parse_enclosure(item_tag)
-        source = _parse_source(item_tag)
-        categories = _parse_categories(item_tag)
-
-        if title is None and description is None:
+def _project(
+    field_type: t.TypeAliasType, names: t.Iterable[str] | None
+) -> frozenset[str]:
+    allowed = frozenset(t.get_args(field_type.__value__))
+    if names is None:
+        return allowed
+    selected = frozenset(names)
+    unknown = selected - allowed
+    if unknown:
+        raise ValueError(
+            f"Unknown {field_type.__name__} name(s): {', '.join(sorted(unknown))}"
+        )
+    return selected
+
+
+def _parse_channel(
+    channel_tag: _Element,
+    items: tuple[Item, ...],
+    fields: frozenset[str],
+    dates: dict[str, dt.datetime | None] | None = None,
+) -> Channel:
+    def text(name: str, field_name: str, *, interned: bool = False) -> str | None:
+        if field_name not in fields:
+            return None
+        return _optional_child_text(channel_tag, name, interned=interned)
+
+    hub_links, self_link = _parse_atom_links(channel_tag, fields)
+    pub_date = text("pubDate", "pub_date")
+    last_build_date = text("lastBuildDate", "last_build_date")
+    # `dates` already holds the item dates parsed while building the items.
+    if dates is None:
+        dates = {}
+    pub_datetime = _parse_date_once(dates, pub_date)
+    last_build_datetime = _parse_date_once(dates, last_build_date)
+    invalid_dates = dict.fromkeys(
+        value for value in (pub_date, last_build_date) if value is not None
+    )
+    invalid_dates.update(dates)
+
+    return Channel(
+        title=_require_child_text(channel_tag, "title"),
+        link=_require_child_text(channel_tag, "link"),
+        description=_require_child_text(channel_tag, "description"),
+        language=text("language", "language", interned=True),
+        copyright=text("copyright", "copyright"),
+        managing_editor=text("managingEditor", "managing_editor"),
+        web_master=text("webMaster", "web_master"),
+        pub_date=pub_date,
+        last_build_date=last_build_date,
+        categories=(_parse_categories(channel_tag) if "categories" in fields else ()),
+        generator=text("generator", "generator", interned=True),
+        docs=text("docs", "docs", interned=True),
+        cloud=_parse_cloud(channel_tag) if "cloud" in fields else None,
+        ttl=_parse_int(text("ttl", "ttl")),
+        image=_parse_image(channel_tag) if "image" in fields else None,
+        rating=text("rating", "rating"),
+        text_input=(_parse_text_input(channel_tag) if "text_input" in fields else None),
+        skip_hours=_parse_skip_hours(channel_tag) if "skip_hours" in fields else (),
+        skip_days=_parse_skip_days(channel_tag) if "skip_days" in fields else (),
+        items=items,
+        pub_datetime=pub_datetime,
+        last_build_datetime=last_build_datetime,
+        invalid_dates=tuple(value for value in invalid_dates if dates[value] is None),
+        hub_links=hub_links,
+        self_link=self_link,
+    )
+
+
+_ATOM_LINK = "{http://www.w3.org/2005/Atom}link"
+
+
+def _parse_atom_links(
+    channel_tag: _Element, fields: frozenset[str]
+) -> tuple[tuple[str, ...], str | None]:
+    if "hub_links" not in fields and "self_link" not in fields:
+        return (), None
+    hubs: list[str] = []
+    self_link: str | None = None
+    for link in _find_direct_children(channel_tag, _ATOM_LINK):
+        href = _get_attr(link, "href")
+        if not href:
             continue
+        rels = (_get_attr(link, "rel") or "alternate").lower().split()
+        if "hub" in rels:
+            hubs.append(href.strip())
+        if "self" in rels and self_link is None:
+            self_link = href.strip()
+    return (
+        tuple(hubs) if "hub_links" in fields else (),
+        self_link if "self_link" in fields else None,
+    )
+
 
-        items.append(
-            Item(
-                title=title,
-                link=link,
-                description=description,
-                author=author,
-                categories=categories,
-                comments=comments,
-                enclosure=enclosure,
-                guid=guid,
-                pub_date=pub_date,
-                source=source,
+def _parse_date_or_none(value: str | None) -> dt.datetime | None:
+    try:
+        return parse_optional_rfc822_date(value)
+    except RssDateError:
+        return None
+
+
+def _parse_date_once(
+    dates: dict[str, dt.datetime | None],
+    value: str | None,
+    parse: t.Callable[[str], dt.datetime | None] = _parse_date_or_none,
+) -> dt.datetime | None:
+    """Parse `value` with `parse` unless `dates` already holds it.
+
+    `parse` returns None for strings it cannot parse; the default takes RFC 822
+    dates. Sharing one `dates` mapping across a document parses each distinct
+    date string once, however many items repeat it.
+    """
+
+    if value is None:
+        return None
+    try:
+        return dates[value]
+    except KeyError:
+        parsed = dates[value] = parse(value)
+        return parsed
+
+
+def _timestamp(published: dt.datetime | None) -> int | None:
+    return None if published is None else int(published.timestamp())
+
+
+def _parse_items(
+    parent: _Element,
+    fields: frozenset[str],
+    *,
+    max_items: int | None = None,
+    since: dt.datetime | None = None,
+    newest_first: bool = True,
+    lazy: bool = False,
+    dates: dict[str, dt.datetime | None] | None = None,
+) -> tuple[Item, ...]:
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=dt.timezone.utc)
+    if dates is None:
+        dates = {}
+
+    items: list[Item] = []
+    for item_tag in _find_direct_children(parent, "item"):
+        if max_items is not None and len(items) >= max_items:
+            break
+        if since is not None:
+            published = _parse_date_once(
+                dates, _optional_child_text(item_tag, "pubDate")
             )
-        )
+            if published is not None and published <= since:
+                if newest_first:
+                    break
+                continue
+        item = _parse_item(item_tag, fields, lazy=lazy, dates=dates)
+        if item is not None:
+            items.append(item)
     return tuple(items)
 
 
+def _parse_item(
+    item_tag: _Element,
+    fields: frozenset[str],
+    *,
+    lazy: bool = False,
+    dates: dict[str, dt.datetime | None] | None = None,
+) -> Item | None:
+    def text(name: str, field_name: str, *, interned: bool = False) -> str | None:
+        if field_name not in fields:
+            return None
+        return _optional_child_text(item_tag, name, interned=interned)
+
+    title = text("title", "title")
+    description = None if lazy else text("description", "description")
+    if title is None and description is None:
+        # Either may have been projected away or deferred, so check presence
+        # without paying for text extraction.
+        if not (item_tag.has_child("title") or item_tag.has_child("description")):
+            return None
+
+    pub_date = text("pubDate", "pub_date")
+    if dates is None:
+        # Streamed items have no document-wide mapping to share parses with;
+        # the parse_rfc822_date memo absorbs the repeats instead.
+        pub_datetime = _parse_date_or_none(pub_date)
+    else:
+        pub_datetime = _parse_date_once(dates, pub_date)
+
+    if lazy:
+        return LazyItem._from_element(
+            item_tag,
+            fields,
+            title=title,
+            link=text("link", "link"),
+            author=text("author", "author", interned=True),
+            comments=text("comments", "comments"),
+            guid=_parse_guid(item_tag) if "guid" in fields else None,
+            pub_date=pub_date,
+            pub_datetime=pub_datetime,
+        )
+
+    return Item(
+        title=title,
+        link=text("link", "link"),
+        description=description,
+        author=text("author", "author", interned=True),
+        categories=_parse_categories(item_tag) if "categories" in fields else (),
+        comments=text("comments", "comments"),
+        enclosure=_parse_enclosure(item_tag) if "enclosure" in fields else None,
+        guid=_parse_guid(item_tag) if "guid" in fields else None,
+        pub_date=pub_date,
+        source=_parse_source(item_tag) if "source" in fields else None,
+        pub_datetime=pub_datetime,
+        pub_timestamp=_timestamp(pub_datetime),
+    )
+
+
 def _parse_guid(parent) -> Guid | None:
     guid_tag = _find_direct_child(parent, "guid")
     if guid_tag is None:
@@ -632,7 +1504,7 @@ def _parse_enclosure(parent) -> Enclosure | None:
         length_int = int(length_text)
     except ValueError:
         return None
-    enclosure = Enclosure(url=url, length=length_int, media_type=media_type)
+    enclosure = Enclosure(url=url, length=length_int, media_type=_intern(media_type))
     try:
         enclosure.validate()
     except ValueError:
@@ -1,9 +1,25 @@
+import dataclasses
+import datetime as dt
+import io
 import pathlib
+import pickle
 import typing as t
 
 import pytest
 
-from .rss import parse_rss
+from .rss import (
+    Item,
+    LazyItem,
+    RssDateError,
+    RssFeed,
+    RssParseError,
+    _InternPool,
+    _parse_rfc822_date_stdlib,
+    iter_rss_items,
+    parse_rfc822_date,
+    parse_rss,
+    parse_rss_file,
+)
 
 TEST_DIR = pathlib.Path(__file__).parent.parent / "testdata" / "feeds"
 
@@ -35,3 +51,334 @@ def test_rss_20_feeds_parsing(feed_id: str):
         feed_content = f.read()
     feed = parse_rss(feed_content)
     assert feed is not None, f"Failed to parse RSS 2.0 feed: {feed_id}"
+
+
+SAMPLE_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Example <![CDATA[<b>Feed</b>]]></title>
+    <link>https://example.com/</link>
+    <description>An example feed</description>
+    <atom:link rel="self" href="https://example.com/feed.xml" />
+    <category domain="https://example.com/tax">news</category>
+    <ttl>60</ttl>
+    <skipHours><hour>1</hour><hour>25</hour></skipHours>
+    <image>
+      <url>https://example.com/logo.png</url>
+      <title>Logo</title>
+      <link>https://example.com/</link>
+    </image>
+    <item>
+      <title>First</title>
+      <link>https://example.com/1</link>
+      <guid isPermaLink="false">item-1</guid>
+      <pubDate>Tue, 10 Jun 2003 04:00:00 GMT</pubDate>
+      <enclosure url="https://example.com/1.mp3" length="1024" type="audio/mpeg" />
+      <source url="https://other.example.com/feed.xml">Other</source>
+      <category>a</category>
+      <category>b</category>
+    </item>
+    <item>
+      <description>Second <i>item</i></description>
+    </item>
+    <item>
+      <link>https://example.com/skipped</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+@pytest.mark.parametrize("backend", ["auto", "lxml", "soup"])
+def test_parse_rss_backends(backend: t.Literal["auto", "lxml", "soup"]):
+    feed = parse_rss(SAMPLE_RSS, backend=backend)
+    assert feed.channel.title == "Example <b>Feed</b>"
+    assert feed.channel.link == "https://example.com/"
+    assert feed.channel.ttl == 60
+    assert feed.channel.skip_hours == (1,)
+    assert [item.title for item in feed.channel.items] == ["First", None]
+    assert feed.channel.items[1].description == "Second item"
+    assert feed == parse_rss(SAMPLE_RSS, backend="soup")
+
+
+def test_parse_rss_auto_falls_back_to_soup():
+    malformed = SAMPLE_RSS.replace(
+        "<title>First</title>", "<title>First &nbsp;</title>"
+    )
+    with pytest.raises(RssParseError):
+        parse_rss(malformed, backend="lxml")
+    feed = parse_rss(malformed)
+    assert feed.channel.items[0].title == "First"
+
+
+@pytest.mark.parametrize("backend", ["lxml", "soup"])
+def test_parse_rss_rejects_duplicate_singletons(
+    backend: t.Literal["auto", "lxml", "soup"],
+):
+    duplicated = SAMPLE_RSS.replace(
+        "<title>First</title>", "<title>First</title><title>Again</title>"
+    )
+    with pytest.raises(RssParseError, match="Multiple <title>"):
+        parse_rss(duplicated, backend=backend)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [SAMPLE_RSS, SAMPLE_RSS.encode("utf-8"), io.BytesIO(SAMPLE_RSS.encode("utf-8"))],
+    ids=["str", "bytes", "file"],
+)
+def test_iter_rss_items_matches_parse_rss(source: str | bytes | t.BinaryIO):
+    feed = parse_rss(SAMPLE_RSS)
+    stream = iter_rss_items(source)
+    assert stream.channel is None
+    assert tuple(stream) == feed.channel.items
+    assert stream.version == "2.0"
+    assert stream.channel == dataclasses.replace(feed.channel, items=())
+
+
+def test_iter_rss_items_reads_paths(tmp_path: pathlib.Path):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_text(SAMPLE_RSS, encoding="utf-8")
+    assert [item.title for item in iter_rss_items(feed_path)] == ["First", None]
+
+
+def test_iter_rss_items_requires_rss_root():
+    with pytest.raises(RssParseError, match="Missing <rss>"):
+        list(iter_rss_items("<feed><channel /></feed>"))
+
+
+ENTITY_RSS = """<?xml version="1.0"?>
+<!DOCTYPE rss [
+  <!ENTITY co "Company">
+  <!ENTITY secret SYSTEM "file:///etc/hostname">
+]>
+<rss version="2.0">
+  <channel>
+    <title>T &co; x</title>
+    <link>https://example.com/</link>
+    <description>Description</description>
+    <item><title>T &co; x</title></item>
+  </channel>
+</rss>
+"""
+
+
+def test_lxml_expands_internal_entities_only():
+    assert parse_rss(ENTITY_RSS, backend="lxml").channel.title == "T Company x"
+    assert [item.title for item in iter_rss_items(ENTITY_RSS)] == ["T Company x"]
+    external = ENTITY_RSS.replace("T &co; x</title>", "&secret;</title>", 1)
+    with pytest.raises(RssParseError, match="secret"):
+        parse_rss(external, backend="lxml")
+
+
+LATIN1_RSS = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0">
+  <channel>
+    <title>Café des Artistes</title>
+    <link>https://example.com/</link>
+    <description>Crème brûlée</description>
+  </channel>
+</rss>
+""".encode("iso-8859-1")
+
+
+@pytest.mark.parametrize("backend", ["auto", "lxml", "soup"])
+@pytest.mark.parametrize(
+    "wrap",
+    [bytes, memoryview, io.BytesIO],
+    ids=["bytes", "memoryview", "file"],
+)
+def test_parse_rss_honors_declared_encoding(
+    backend: t.Literal["auto", "lxml", "soup"],
+    wrap: t.Callable[[bytes], bytes | memoryview | t.BinaryIO],
+):
+    feed = parse_rss(wrap(LATIN1_RSS), backend=backend)
+    assert feed.channel.title == "Café des Artistes"
+    assert feed.channel.description == "Crème brûlée"
+
+
+@pytest.mark.parametrize("backend", ["auto", "lxml", "soup"])
+def test_parse_rss_file(
+    tmp_path: pathlib.Path, backend: t.Literal["auto", "lxml", "soup"]
+):
+    feed_path = tmp_path / "feed.xml"
+    feed_path.write_bytes(LATIN1_RSS)
+    feed = parse_rss_file(feed_path, backend=backend)
+    assert feed == parse_rss(LATIN1_RSS, backend=backend)
+
+
+def test_parse_rss_file_rejects_empty_files(tmp_path: pathlib.Path):
+    feed_path = tmp_path / "empty.xml"
+    feed_path.touch()
+    with pytest.raises(RssParseError, match="Empty RSS document"):
+        parse_rss_file(feed_path)
+
+
+@pytest.mark.parametrize("backend", ["lxml", "soup"])
+def test_parse_rss_field_projection(backend: t.Literal["auto", "lxml", "soup"]):
+    feed = parse_rss(
+        SAMPLE_RSS,
+        backend=backend,
+        fields=["title", "guid"],
+        channel_fields=["ttl"],
+    )
+    assert feed.channel.ttl == 60
+    assert feed.channel.categories == ()
+    assert feed.channel.image is None
+    first, second = feed.channel.items
+    assert first.title == "First"
+    assert first.guid is not None and first.guid.value == "item-1"
+    assert first.link is None and first.enclosure is None and first.categories == ()
+    # Kept because it has a <description>, even though it was not projected.
+    assert second.title is None and second.description is None
+
+
+def test_parse_rss_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="Unknown ItemField name"):
+        parse_rss(SAMPLE_RSS, fields=["title", "summary"])  # pyright: ignore[reportArgumentType]
+
+
+ARCHIVE_RSS = """<rss version="2.0">
+  <channel>
+    <title>Archive</title>
+    <link>https://example.com/</link>
+    <description>Newest first</description>
+    <item><title>Day 4</title><pubDate>Fri, 04 Jul 2025 12:00:00 GMT</pubDate></item>
+    <item><title>Undated</title></item>
+    <item><title>Day 3</title><pubDate>Thu, 03 Jul 2025 12:00:00 GMT</pubDate></item>
+    <item><title>Day 1</title><pubDate>Tue, 01 Jul 2025 12:00:00 GMT</pubDate></item>
+    <item><title>Day 2</title><pubDate>Wed, 02 Jul 2025 12:00:00 GMT</pubDate></item>
+  </channel>
+</rss>
+"""
+
+
+def _titles(feed: RssFeed) -> list[str | None]:
+    return [item.title for item in feed.channel.items]
+
+
+def test_parse_rss_parses_dates():
+    feed = parse_rss(
+        ARCHIVE_RSS.replace(
+            "<title>Undated</title>",
+            "<title>Undated</title><pubDate>sometime</pubDate>",
+        ).replace(
+            "<link>",
+            "<lastBuildDate>Fri, 04 Jul 2025 13:00:00 +0100</lastBuildDate><link>",
+        )
+    )
+    channel = feed.channel
+    assert channel.last_build_datetime == dt.datetime(
+        2025, 7, 4, 12, 0, tzinfo=dt.timezone.utc
+    )
+    assert channel.pub_datetime is None
+    assert channel.invalid_dates == ("sometime",)
+
+    dated = sorted(
+        (item for item in channel.items if item.pub_timestamp is not None),
+        key=lambda item: item.pub_timestamp or 0,
+    )
+    assert [item.title for item in dated] == ["Day 1", "Day 2", "Day 3", "Day 4"]
+    assert dated[0].pub_datetime == dt.datetime(
+        2025, 7, 1, 12, 0, tzinfo=dt.timezone.utc
+    )
+    assert dated[0].pub_timestamp == 1751371200
+
+
+def test_iter_rss_items_parses_dates():
+    items = list(iter_rss_items(ARCHIVE_RSS))
+    assert [item.pub_timestamp for item in items] == [
+        item.pub_timestamp for item in parse_rss(ARCHIVE_RSS).channel.items
+    ]
+
+
+def test_parse_rss_max_items():
+    assert _titles(parse_rss(ARCHIVE_RSS, max_items=2)) == ["Day 4", "Undated"]
+    assert _titles(parse_rss(ARCHIVE_RSS, max_items=0)) == []
+
+
+def test_parse_rss_since_stops_at_cutoff_for_newest_first_feeds():
+    since = dt.datetime(2025, 7, 2, 12, 0, tzinfo=dt.timezone.utc)
+    feed = parse_rss(ARCHIVE_RSS, since=since)
+    assert _titles(feed) == ["Day 4", "Undated", "Day 3"]
+
+
+def test_parse_rss_since_scans_unordered_feeds():
+    since = dt.datetime(2025, 7, 1, 12, 0)
+    feed = parse_rss(ARCHIVE_RSS, since=since, newest_first=False)
+    assert _titles(feed) == ["Day 4", "Undated", "Day 3", "Day 2"]
+
+
+@pytest.mark.parametrize("backend", ["lxml", "soup"])
+def test_parse_rss_lazy_items(backend: t.Literal["auto", "lxml", "soup"]):
+    eager = parse_rss(SAMPLE_RSS, backend=backend)
+    lazy = parse_rss(SAMPLE_RSS, backend=backend, lazy=True)
+    first = lazy.channel.items[0]
+    assert isinstance(first, LazyItem)
+    assert first.enclosure == eager.channel.items[0].enclosure
+    assert lazy == eager
+    assert hash(first) == hash(eager.channel.items[0])
+
+    restored = pickle.loads(pickle.dumps(first))
+    assert type(restored) is Item
+    assert restored == first
+
+    replaced = dataclasses.replace(first, title="Changed")
+    assert replaced.title == "Changed"
+    assert replaced.categories == first.categories
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Mon, 02 Jan 2006 15:04:05 +0000",
+        "Mon, 02 Jan 2006 15:04:05 GMT",
+        "Mon, 02 Jan 2006 15:04:05 -0000",
+        "2 jan 2006 15:04 -0730",
+        "02 Jan 2006 15:04:05 +2359",
+        "Tue 02 Jan 2006 15:04:05 +0100",
+        "Mon, 02 Jan 2006 15:04:05 EST",
+        "Mon, 02 Jan 0049 15:04:05 GMT",
+        "Mon, 02 Jan 06 15:04:05 GMT",
+        "Mon, 31 Feb 2006 15:04:05 GMT",
+        "Mon, 02 Jan 2006 24:00:00 GMT",
+        "Mon, 02 Jan 2006 15:04:05 +9999",
+        "2006-01-02T15:04:05Z",
+        "not a date",
+    ],
+)
+def test_parse_rfc822_date_matches_stdlib(value: str):
+    try:
+        expected = _parse_rfc822_date_stdlib(value)
+    except RssDateError:
+        with pytest.raises(RssDateError):
+            parse_rfc822_date(value)
+    else:
+        parsed = parse_rfc822_date(value)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_rss_shares_repeated_values():
+    # Built at runtime so the values are not compile-time constants shared anyway.
+    generator = "".join(["feedgen ", "1.0"])
+    rss = SAMPLE_RSS.replace(
+        "<ttl>", f"<generator>{generator}</generator><language>en-us</language><ttl>"
+    )
+    first = parse_rss(rss).channel
+    second = parse_rss(rss.encode(), backend="soup").channel
+    assert first.generator == generator
+    assert first.categories
+    assert first.categories[0] is second.categories[0]
+    assert first.generator is second.generator
+    assert first.language is second.language
+
+
+def test_intern_pool_evicts_oldest_entries_when_full():
+    pool: _InternPool[str, str] = _InternPool(3)
+    for value in "abcde":
+        assert pool.add(value, value) == value
+    assert [pool.get(value) for value in "abcde"] == [None, None, "c", "d", "e"]
+    assert pool.add("d", "other") == "d"
+    pool.add("f", "f")
+    assert pool.get("c") is None and pool.get("f") == "f"
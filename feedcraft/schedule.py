@@ -0,0 +1,305 @@
+import asyncio
+import datetime as dt
+import heapq
+import itertools
+import random
+import time
+import typing as t
+from dataclasses import dataclass, replace
+
+from .adaptive import UpdateRateEstimator
+from .fetch import FetchResult
+from .rss import Channel
+
+_WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PollPolicy:
+    """Bounds applied when turning a channel's hints into a polling interval."""
+
+    min_interval: float = 300.0
+    """Shortest interval between polls of one feed, in seconds, whatever its ttl."""
+
+    max_interval: float = 86400.0
+    """Longest interval between polls of one feed, in seconds."""
+
+    default_interval: float = 3600.0
+    """Interval used for channels without a ttl, in seconds."""
+
+    jitter: float = 0.1
+    """Fraction by which each interval is randomly stretched or shrunk, spreading load."""
+
+    honor_skip: bool = True
+    """Whether to avoid the channel's skipHours and skipDays."""
+
+
+def next_poll_time(
+    channel: Channel | None,
+    now: float,
+    policy: PollPolicy = PollPolicy(),
+    *,
+    interval: float | None = None,
+    rng: random.Random | None = None,
+) -> float:
+    """Return when to poll a feed next, in epoch seconds, after polling it at `now`.
+
+    The interval is the given `interval` (such as an UpdateRateEstimator
+    recommendation) but no shorter than the channel's ttl, or the ttl alone, or
+    else the policy default; it is then jittered and clamped to the policy
+    bounds. A due time
+    falling in one of the channel's skipHours or skipDays, both read in GMT as
+    the RSS specification says, moves to the start of the next allowed hour.
+    Hints that skip every hour or every day are ignored.
+    """
+
+    ttl = channel.ttl * 60.0 if channel is not None and channel.ttl else None
+    if interval is None:
+        interval = policy.default_interval if ttl is None else ttl
+    elif ttl is not None:
+        interval = max(interval, ttl)
+    if policy.jitter:
+        interval *= (rng or random).uniform(1.0 - policy.jitter, 1.0 + policy.jitter)
+    due = now + min(max(interval, policy.min_interval), policy.max_interval)
+    if channel is None or not policy.honor_skip:
+        return due
+    return _skip_forward(
+        due, frozenset(channel.skip_hours), frozenset(channel.skip_days)
+    )
+
+
+def _skip_forward(
+    due: float, skip_hours: frozenset[int], skip_days: frozenset[str]
+) -> float:
+    if len(skip_hours) >= 24:
+        skip_hours = frozenset()
+    if len(skip_days) >= 7:
+        skip_days = frozenset()
+    if not skip_hours and not skip_days:
+        return due
+
+    moment = dt.datetime.fromtimestamp(due, dt.timezone.utc)
+    # At most a week of hours needs checking before an allowed one turns up.
+    for _ in range(24 * 7):
+        if _WEEKDAYS[moment.weekday()] in skip_days:
+            moment = (moment + dt.timedelta(days=1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        elif moment.hour in skip_hours:
+            moment = (moment + dt.timedelta(hours=1)).replace(
+                minute=0, second=0, microsecond=0
+            )
+        else:
+            break
+    return moment.timestamp()
+
+
+class _Subscription:
+    __slots__ = ("channel", "due", "failures", "generation", "url")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.channel: Channel | None = None
+        self.due = 0.0
+        self.failures = 0
+        # Bumped whenever the subscription is rescheduled or removed, so older
+        # heap entries for it can be recognized as stale and dropped.
+        self.generation = 0
+
+
+class PollScheduler:
+    """Keep feed subscriptions polled according to their ttl, skipHours and skipDays.
+
+    Subscriptions live in a heap ordered by due time, so finding and popping
+    due subscriptions costs O(log n) each regardless of how many there are;
+    rescheduling and removal push a new heap entry and leave the old one to be
+    discarded lazily. run() sleeps until the earliest due time, then hands due
+    subscriptions to `fetch` (typically AsyncFeedFetcher.fetch) with at most
+    `max_concurrency` fetches in flight, and reschedules each from the channel
+    it returned. A 304 keeps the previous channel's hints, and failures back off
+    exponentially from the policy's minimum interval. Every FetchResult is
+    passed to `on_result`.
+
+    With an `estimator`, each feed's observed publication rate replaces the
+    policy default interval, and channels' ttl values act as lower bounds.
+
+    The scheduler is not thread-safe; use it from its event loop.
+    """
+
+    def __init__(
+        self,
+        fetch: t.Callable[[str], t.Awaitable[FetchResult]],
+        *,
+        policy: PollPolicy = PollPolicy(),
+        max_concurrency: int = 32,
+        on_result: t.Callable[[FetchResult], None] | None = None,
+        estimator: UpdateRateEstimator | None = None,
+        clock: t.Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.policy = policy
+        self.max_concurrency = max_concurrency
+        self._fetch = fetch
+        self._on_result = on_result
+        self._estimator = estimator
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._heap: list[tuple[float, int, int, _Subscription]] = []
+        self._counter = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._subscriptions
+
+    def add(self, url: str, *, due: float | None = None) -> None:
+        """Subscribe to `url`, first due at `due` (epoch seconds; now by default)."""
+
+        subscription = self._subscriptions.get(url)
+        if subscription is None:
+            subscription = self._subscriptions[url] = _Subscription(url)
+        self._schedule(subscription, self._clock() if due is None else due)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def remove(self, url: str) -> None:
+        """Unsubscribe from `url`; a fetch already in flight still completes."""
+
+        subscription = self._subscriptions.pop(url, None)
+        if subscription is not None:
+            subscription.generation += 1
+        if self._estimator is not None:
+            self._estimator.forget(url)
+
+    def due_at(self, url: str) -> float:
+        """Return when `url` is next due, in epoch seconds."""
+
+        return self._subscriptions[url].due
+
+    def next_due(self) -> float | None:
+        """Return the earliest due time of any subscription, or None if there are none."""
+
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float | None = None) -> list[str]:
+        """Take every subscription due by `now` out of the queue, earliest first.
+
+        Popped subscriptions stay subscribed but are not due again until
+        rescheduled, which run() does once their fetch completes.
+        """
+
+        if now is None:
+            now = self._clock()
+        due: list[str] = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            _, _, _, subscription = heapq.heappop(self._heap)
+            subscription.generation += 1
+            due.append(subscription.url)
+
+    def record(self, result: FetchResult) -> None:
+        """Reschedule the subscription a FetchResult belongs to."""
+
+        subscription = self._subscriptions.get(result.url)
+        if subscription is None:
+            return
+        now = self._clock()
+        if result.feed is not None:
+            # Keep the scheduling hints without holding on to every item.
+            subscription.channel = replace(result.feed.channel, items=())
+            if self._estimator is not None:
+                self._estimator.observe(result.url, result.feed.channel.items, now)
+        elif not result.not_modified:
+            subscription.failures += 1
+            backoff = self.policy.min_interval * 2 ** min(subscription.failures - 1, 32)
+            self._schedule(subscription, now + min(backoff, self.policy.max_interval))
+            return
+        subscription.failures = 0
+        interval = None
+        if self._estimator is not None:
+            interval = self._estimator.interval(result.url, now)
+        self._schedule(
+            subscription,
+            next_poll_time(
+                subscription.channel,
+                now,
+                self.policy,
+                interval=interval,
+                rng=self._rng,
+            ),
+        )
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Poll due subscriptions until `stop` is set, then wait for in-flight fetches."""
+
+        stop = stop or asyncio.Event()
+        self._wakeup = asyncio.Event()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: set[asyncio.Task[None]] = set()
+        stopping = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                for url in self.pop_due():
+                    await semaphore.acquire()
+                    task = asyncio.create_task(self._poll(url, semaphore))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                self._wakeup.clear()
+                next_due = self.next_due()
+                timeout = (
+                    None if next_due is None else max(0.0, next_due - self._clock())
+                )
+                waking = asyncio.ensure_future(self._wakeup.wait())
+                await asyncio.wait(
+                    (stopping, waking),
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                waking.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            stopping.cancel()
+            self._wakeup = None
+
+    async def _poll(self, url: str, semaphore: asyncio.Semaphore) -> None:
+        try:
+            result = await self._fetch(url)
+        except Exception as exc:
+            # A fetch that raises must still be rescheduled, so treat it as failed.
+            result = FetchResult(url, error=exc)
+        finally:
+            semaphore.release()
+        self.record(result)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._on_result is not None:
+            self._on_result(result)
+
+    def _schedule(self, subscription: _Subscription, due: float) -> None:
+        subscription.generation += 1
+        subscription.due = due
+        heapq.heappush(
+            self._heap,
+            (due, next(self._counter), subscription.generation, subscription),
+        )
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2] != heap[0][3].generation:
+            heapq.heappop(heap)
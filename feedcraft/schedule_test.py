@@ -0,0 +1,118 @@
+import asyncio
+import datetime as dt
+import random
+
+from .fetch import FetchResult
+from .rss import Channel, RssFeed
+from .schedule import PollPolicy, PollScheduler, next_poll_time
+
+NO_JITTER = PollPolicy(min_interval=60, max_interval=7200, jitter=0)
+
+# A Monday, 10:00 GMT.
+MONDAY = dt.datetime(2025, 7, 7, 10, 0, tzinfo=dt.timezone.utc).timestamp()
+
+
+def _channel(**hints: object) -> Channel:
+    return Channel("Title", "https://example.com/", "Description", **hints)  # pyright: ignore[reportArgumentType]
+
+
+def test_next_poll_time_uses_ttl_within_bounds():
+    assert next_poll_time(None, MONDAY, NO_JITTER) == MONDAY + 3600
+    assert next_poll_time(_channel(ttl=30), MONDAY, NO_JITTER) == MONDAY + 1800
+    assert next_poll_time(_channel(ttl=0), MONDAY, NO_JITTER) == MONDAY + 3600
+    assert next_poll_time(_channel(ttl=1), MONDAY, NO_JITTER) == MONDAY + 60
+    assert next_poll_time(_channel(ttl=1440), MONDAY, NO_JITTER) == MONDAY + 7200
+
+
+def test_next_poll_time_applies_jitter():
+    policy = PollPolicy(jitter=0.5)
+    rng = random.Random(0)
+    times = {next_poll_time(None, MONDAY, policy, rng=rng) for _ in range(20)}
+    assert len(times) > 1
+    assert all(MONDAY + 1800 <= due <= MONDAY + 5400 for due in times)
+
+
+def test_next_poll_time_honors_skip_hours_and_days():
+    channel = _channel(ttl=60, skip_hours=(11, 12))
+    assert next_poll_time(channel, MONDAY, NO_JITTER) == MONDAY + 3 * 3600
+
+    channel = _channel(ttl=60, skip_days=("Monday",))
+    assert next_poll_time(channel, MONDAY, NO_JITTER) == MONDAY + 14 * 3600
+
+    channel = _channel(ttl=60, skip_hours=tuple(range(24)))
+    assert next_poll_time(channel, MONDAY, NO_JITTER) == MONDAY + 3600
+
+    ignored = PollPolicy(min_interval=60, jitter=0, honor_skip=False)
+    assert next_poll_time(channel, MONDAY, ignored) == MONDAY + 3600
+
+
+def test_pop_due_returns_due_subscriptions_in_order():
+    scheduler = PollScheduler(_never_called, clock=lambda: 0.0)
+    scheduler.add("c", due=30)
+    scheduler.add("a", due=10)
+    scheduler.add("b", due=20)
+    scheduler.add("gone", due=5)
+    scheduler.remove("gone")
+    scheduler.add("a", due=25)
+
+    assert scheduler.next_due() == 20
+    assert scheduler.pop_due(25) == ["b", "a"]
+    assert scheduler.pop_due(25) == []
+    assert scheduler.next_due() == 30
+    assert len(scheduler) == 3
+
+
+def test_run_reschedules_from_results():
+    feed = RssFeed(_channel(ttl=60), version="2.0")
+    fetched: list[str] = []
+    results: list[FetchResult] = []
+    stop = asyncio.Event()
+
+    async def fetch(url: str) -> FetchResult:
+        fetched.append(url)
+        if url == "broken":
+            raise OSError("unreachable")
+        return FetchResult(url, feed=feed, status=200)
+
+    def on_result(result: FetchResult) -> None:
+        results.append(result)
+        if len(results) == 3:
+            stop.set()
+
+    clock = [MONDAY]
+    scheduler = PollScheduler(
+        fetch, policy=NO_JITTER, on_result=on_result, clock=lambda: clock[0]
+    )
+    for url in ("a", "b", "broken"):
+        scheduler.add(url)
+    asyncio.run(scheduler.run(stop))
+
+    assert sorted(fetched) == ["a", "b", "broken"]
+    assert scheduler.due_at("a") == MONDAY + 3600
+    assert scheduler.due_at("broken") == MONDAY + 60
+    assert any(isinstance(result.error, OSError) for result in results)
+
+
+def test_record_resets_failures_after_not_modified():
+    scheduler = PollScheduler(_never_called, policy=NO_JITTER, clock=lambda: MONDAY)
+    scheduler.add("a")
+    error = FetchResult("a", error=OSError("unreachable"))
+
+    scheduler.record(error)
+    scheduler.record(error)
+    assert scheduler.due_at("a") == MONDAY + 120
+    scheduler.record(FetchResult("a", status=304, not_modified=True))
+    assert scheduler.due_at("a") == MONDAY + 3600
+    scheduler.record(error)
+    assert scheduler.due_at("a") == MONDAY + 60
+
+
+async def _never_called(url: str) -> FetchResult:
+    raise AssertionError(url)
+
+
+def test_next_poll_time_prefers_estimated_interval_over_default():
+    assert next_poll_time(None, MONDAY, NO_JITTER, interval=600) == MONDAY + 600
+    # A channel's ttl still bounds how often it is polled.
+    channel = _channel(ttl=30)
+    assert next_poll_time(channel, MONDAY, NO_JITTER, interval=600) == MONDAY + 1800
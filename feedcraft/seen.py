@@ -0,0 +1,223 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import typing as t
+
+from ._sqlite import SqliteStore
+from .diff import item_key
+from .rss import Item
+
+_BLOOM_MAGIC = b"FCBLOOM1"
+_BLOOM_HEADER = struct.Struct("<8sQQQ")
+# Keeps each SQLite query well below the host parameter limit.
+_QUERY_CHUNK = 500
+
+
+class SeenStore(SqliteStore):
+    """Remember which items have been seen, across feeds, processes and restarts.
+
+    Items are identified by feedcraft.diff.item_key, optionally scoped to a
+    feed, and stored as 16-byte digests in a SQLite database at `path`. A Bloom
+    filter kept in the memory-mapped file `path` + ".bloom" answers most
+    lookups for unseen items without touching the database: only items the
+    filter reports as possibly seen are checked against SQLite. The filter is
+    sized for `capacity` items at `false_positive_rate`; both are fixed when
+    the file is created, and the rate degrades gracefully beyond capacity.
+    Since the filter is a mapped file, reopening the store reuses it as is.
+
+    The bulk methods take whole tuples such as Channel.items and do one
+    filter pass and a few batched queries per call. Filter bits are set before
+    the database commits, so the filter can only err towards "maybe seen".
+    The store is thread-safe; any number of processes may read it, but only
+    one should write to it at a time.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        capacity: int = 10_000_000,
+        false_positive_rate: float = 0.001,
+        timeout: float = 30.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be between 0 and 1.")
+        super().__init__(
+            path,
+            timeout=timeout,
+            schema=(
+                "CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY) WITHOUT ROWID",
+            ),
+        )
+        self._lock = self._database.lock
+        self._db = self._database.connection
+        bloom_path = f"{os.fspath(path)}.bloom"
+        created = not os.path.exists(bloom_path)
+        if created:
+            _create_bloom(bloom_path, capacity, false_positive_rate)
+        with open(bloom_path, "r+b") as file:
+            self._bloom = mmap.mmap(file.fileno(), 0)
+        magic, self._num_bits, self._num_hashes, _ = _BLOOM_HEADER.unpack_from(
+            self._bloom
+        )
+        if magic != _BLOOM_MAGIC:
+            self._bloom.close()
+            super().close()
+            raise ValueError(f"{bloom_path} is not a SeenStore Bloom filter.")
+        if created:
+            # A database without its filter, e.g. after the filter file was
+            # deleted to resize it, rebuilds the filter from the exact store.
+            for (key,) in self._db.execute("SELECT key FROM seen"):
+                self._set_bits(key)
+            self._set_count(self._count_rows())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count_rows()
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """Filter false positive rate expected at the current number of items."""
+
+        (count,) = struct.unpack_from("<Q", self._bloom, _BLOOM_HEADER.size - 8)
+        k = self._num_hashes
+        return (1.0 - math.exp(-k * count / self._num_bits)) ** k
+
+    def contains(self, item: Item, *, feed: str | None = None) -> bool:
+        """Return whether `item` has been recorded as seen."""
+
+        return self.contains_many((item,), feed=feed)[0]
+
+    def contains_many(
+        self, items: t.Iterable[Item], *, feed: str | None = None
+    ) -> list[bool]:
+        """Return, for each of `items`, whether it has been recorded as seen."""
+
+        keys = [_digest(item_key(item), feed) for item in items]
+        with self._lock:
+            found = self._lookup(keys)
+        return [key in found for key in keys]
+
+    def add_many(
+        self, items: t.Iterable[Item], *, feed: str | None = None
+    ) -> list[bool]:
+        """Record `items` as seen; return, for each, whether it was new.
+
+        An item repeated within `items` is only new at its first occurrence.
+        """
+
+        keys = [_digest(item_key(item), feed) for item in items]
+        with self._database.transaction():
+            found = self._lookup(keys)
+            new: list[bool] = []
+            added: dict[bytes, None] = {}
+            for key in keys:
+                is_new = key not in found and key not in added
+                if is_new:
+                    added[key] = None
+                new.append(is_new)
+            if added:
+                self._insert(list(added))
+        return new
+
+    def filter_new(
+        self, items: t.Iterable[Item], *, feed: str | None = None
+    ) -> tuple[Item, ...]:
+        """Record `items` as seen and return those that had not been seen before."""
+
+        items = tuple(items)
+        new = self.add_many(items, feed=feed)
+        return tuple(item for item, is_new in zip(items, new) if is_new)
+
+    def sync(self) -> None:
+        """Write the filter's changed pages to disk."""
+
+        with self._lock:
+            self._bloom.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._bloom.closed:
+                return
+            self._bloom.flush()
+            self._bloom.close()
+        super().close()
+
+    def _lookup(self, keys: list[bytes]) -> set[bytes]:
+        maybe = list({key: None for key in keys if self._maybe_contains(key)})
+        found: set[bytes] = set()
+        for start in range(0, len(maybe), _QUERY_CHUNK):
+            chunk = maybe[start : start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                key
+                for (key,) in self._db.execute(
+                    f"SELECT key FROM seen WHERE key IN ({placeholders})", chunk
+                )
+            )
+        return found
+
+    def _insert(self, keys: list[bytes]) -> None:
+        cursor = self._db.executemany(
+            "INSERT OR IGNORE INTO seen (key) VALUES (?)", ((key,) for key in keys)
+        )
+        for key in keys:
+            self._set_bits(key)
+        (count,) = struct.unpack_from("<Q", self._bloom, _BLOOM_HEADER.size - 8)
+        self._set_count(count + max(cursor.rowcount, 0))
+
+    def _count_rows(self) -> int:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM seen").fetchone()
+        return count
+
+    def _set_count(self, count: int) -> None:
+        struct.pack_into("<Q", self._bloom, _BLOOM_HEADER.size - 8, count)
+
+    def _maybe_contains(self, key: bytes) -> bool:
+        # Kirsch-Mitzenmacher double hashing: k positions from two 64-bit hashes.
+        bloom = self._bloom
+        num_bits = self._num_bits
+        position = int.from_bytes(key[:8], "little") % num_bits
+        step = (int.from_bytes(key[8:], "little") | 1) % num_bits
+        for _ in range(self._num_hashes):
+            if not bloom[_BLOOM_HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+            position = (position + step) % num_bits
+        return True
+
+    def _set_bits(self, key: bytes) -> None:
+        bloom = self._bloom
+        num_bits = self._num_bits
+        position = int.from_bytes(key[:8], "little") % num_bits
+        step = (int.from_bytes(key[8:], "little") | 1) % num_bits
+        for _ in range(self._num_hashes):
+            bloom[_BLOOM_HEADER.size + (position >> 3)] |= 1 << (position & 7)
+            position = (position + step) % num_bits
+
+
+def _digest(key: str, feed: str | None) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    if feed is not None:
+        digest.update(feed.encode("utf-8", "surrogatepass"))
+        # Separates the feed from the key; neither can contain a NUL character.
+        digest.update(b"\0")
+    digest.update(key.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _create_bloom(path: str, capacity: int, false_positive_rate: float) -> None:
+    num_bits = max(
+        64, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+    )
+    num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+    # Write to a temporary name first so a crash never leaves a partial filter.
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, num_bits, num_hashes, 0))
+        # Truncating past the end leaves a sparse, zero-filled bit array.
+        file.truncate(_BLOOM_HEADER.size + (num_bits + 7) // 8)
+    os.replace(temporary, path)
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from .diff import item_key
+from .rss import Guid, Item, parse_rss
+from .rss_test import ARCHIVE_RSS
+from .seen import SeenStore, _digest
+
+
+def test_seen_store_filters_new_items_and_persists(tmp_path):
+    items = parse_rss(ARCHIVE_RSS).channel.items
+    path = tmp_path / "seen.sqlite"
+    with SeenStore(path, capacity=1000) as store:
+        assert store.filter_new(items[:2]) == items[:2]
+        assert store.add_many(items[1:] + items[-1:]) == [False] + [True] * (
+            len(items) - 2
+        ) + [False]
+        assert store.contains_many(items, feed="https://other/") == [False] * len(items)
+        assert store.add_many(items[:1], feed="https://other/") == [True]
+        assert len(store) == len(items) + 1
+
+    with SeenStore(path) as store:
+        assert store.contains_many(items) == [True] * len(items)
+        assert store.filter_new(items) == ()
+        assert not store.contains(Item(title="unseen", guid=Guid("urn:x")))
+
+
+def test_seen_store_rebuilds_a_missing_filter(tmp_path):
+    items = parse_rss(ARCHIVE_RSS).channel.items
+    path = tmp_path / "seen.sqlite"
+    with SeenStore(path, capacity=1000) as store:
+        store.add_many(items)
+    os.remove(f"{path}.bloom")
+    with SeenStore(path, capacity=10) as store:
+        assert store.contains_many(items) == [True] * len(items)
+
+
+def test_seen_store_false_positive_rate(tmp_path):
+    with SeenStore(tmp_path / "seen.sqlite", capacity=5000) as store:
+        store.add_many(Item(title=str(i), link=f"https://x/{i}") for i in range(5000))
+        probes = [Item(title=str(i), link=f"https://y/{i}") for i in range(20000)]
+        maybe = sum(map(store._maybe_contains, map(_key, probes)))
+        assert maybe / len(probes) < 0.005
+        assert store.contains_many(probes) == [False] * len(probes)
+        assert store.estimated_false_positive_rate == pytest.approx(0.001, rel=0.2)
+
+
+def _key(item: Item) -> bytes:
+    return _digest(item_key(item), None)
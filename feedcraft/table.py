@@ -0,0 +1,251 @@
+import array
+import datetime as dt
+import typing as t
+
+from .rss import (
+    Enclosure,
+    Guid,
+    Item,
+    RssDateError,
+    Source,
+    _category,
+    parse_rfc822_date,
+)
+
+type ItemColumn = t.Literal[
+    "title",
+    "link",
+    "description",
+    "author",
+    "comments",
+    "guid",
+    "guid_is_perma_link",
+    "enclosure_url",
+    "enclosure_length",
+    "enclosure_type",
+    "pub_date",
+    "pub_timestamp",
+    "source_name",
+    "source_url",
+    "category",
+    "category_domain",
+    "category_offsets",
+]
+
+NO_TIMESTAMP = -(1 << 63)
+"""Value of the pub_timestamp column for items without a parseable pubDate."""
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+class ItemTable(t.Sequence[Item]):
+    """Columnar, struct-of-arrays storage for a large sequence of items.
+
+    Every Item attribute is held in a parallel column: plain lists for strings,
+    `array` columns for enclosure lengths, guid permalink flags and publication
+    timestamps, and flattened category columns delimited by an offsets array
+    (the categories of row i are entries `offsets[i]:offsets[i + 1]`). Nested
+    Guid, Enclosure, Source and Category objects only exist for rows that are
+    read back, so a table costs a fraction of the memory of the items it was
+    built from. Indexing or iterating yields ordinary Item objects built on
+    demand; column() exposes the raw columns for scans that need no objects.
+
+    Absent values are None in string columns. A row has a guid, enclosure or
+    source when its guid, enclosure_url or source_name entry is not None, and
+    rows without a parseable pubDate hold NO_TIMESTAMP in pub_timestamp.
+    Enclosure lengths outside the 64-bit range are clamped to it in the
+    enclosure_length column; rows read back still carry the exact length.
+    """
+
+    __slots__ = (
+        "_author",
+        "_category",
+        "_category_domain",
+        "_category_offsets",
+        "_comments",
+        "_description",
+        "_enclosure_length",
+        "_enclosure_length_overflow",
+        "_enclosure_type",
+        "_enclosure_url",
+        "_guid",
+        "_guid_is_perma_link",
+        "_link",
+        "_pub_date",
+        "_pub_timestamp",
+        "_source_name",
+        "_source_url",
+        "_title",
+    )
+
+    def __init__(self) -> None:
+        self._title: list[str | None] = []
+        self._link: list[str | None] = []
+        self._description: list[str | None] = []
+        self._author: list[str | None] = []
+        self._comments: list[str | None] = []
+        self._guid: list[str | None] = []
+        self._guid_is_perma_link = array.array("b")
+        self._enclosure_url: list[str | None] = []
+        self._enclosure_length = array.array("q")
+        self._enclosure_length_overflow: dict[int, int] = {}
+        self._enclosure_type: list[str | None] = []
+        self._pub_date: list[str | None] = []
+        self._pub_timestamp = array.array("q")
+        self._source_name: list[str | None] = []
+        self._source_url: list[str | None] = []
+        self._category: list[str] = []
+        self._category_domain: list[str | None] = []
+        self._category_offsets = array.array("q", (0,))
+
+    @classmethod
+    def from_items(cls, items: t.Iterable[Item]) -> "ItemTable":
+        """Build a table holding `items`, e.g. the items of a Channel."""
+
+        table = cls()
+        table.extend(items)
+        return table
+
+    def append(self, item: Item) -> None:
+        """Add `item` as the last row."""
+
+        self._title.append(item.title)
+        self._link.append(item.link)
+        self._description.append(item.description)
+        self._author.append(item.author)
+        self._comments.append(item.comments)
+
+        guid = item.guid
+        if guid is None:
+            self._guid.append(None)
+            self._guid_is_perma_link.append(0)
+        else:
+            self._guid.append(guid.value)
+            self._guid_is_perma_link.append(guid.is_perma_link)
+
+        enclosure = item.enclosure
+        if enclosure is None:
+            self._enclosure_url.append(None)
+            self._enclosure_length.append(0)
+            self._enclosure_type.append(None)
+        else:
+            self._enclosure_url.append(enclosure.url)
+            length = enclosure.length
+            if not _INT64_MIN <= length <= _INT64_MAX:
+                self._enclosure_length_overflow[len(self._enclosure_length)] = length
+                length = max(_INT64_MIN, min(length, _INT64_MAX))
+            self._enclosure_length.append(length)
+            self._enclosure_type.append(enclosure.media_type)
+
+        self._pub_date.append(item.pub_date)
+        timestamp = item.pub_timestamp
+        self._pub_timestamp.append(NO_TIMESTAMP if timestamp is None else timestamp)
+
+        source = item.source
+        if source is None:
+            self._source_name.append(None)
+            self._source_url.append(None)
+        else:
+            self._source_name.append(source.name)
+            self._source_url.append(source.url)
+
+        for category in item.categories:
+            self._category.append(category.value)
+            self._category_domain.append(category.domain)
+        self._category_offsets.append(len(self._category))
+
+    def extend(self, items: t.Iterable[Item]) -> None:
+        """Add each of `items` as a row, in order."""
+
+        for item in items:
+            self.append(item)
+
+    def column(self, name: ItemColumn) -> t.Sequence[t.Any]:
+        """Return the named column itself; callers must not modify it.
+
+        Row columns have one entry per item. The category and category_domain
+        columns have one entry per category, and category_offsets has one more
+        entry than there are rows.
+        """
+
+        if name not in t.get_args(ItemColumn.__value__):
+            raise ValueError(f"Unknown ItemColumn name: {name!r}")
+        return getattr(self, f"_{name}")
+
+    def __len__(self) -> int:
+        return len(self._title)
+
+    @t.overload
+    def __getitem__(self, index: int) -> Item: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "ItemTable": ...
+
+    def __getitem__(self, index: int | slice) -> "Item | ItemTable":
+        if isinstance(index, slice):
+            return ItemTable.from_items(
+                self._row(row) for row in range(*index.indices(len(self)))
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ItemTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> t.Iterator[Item]:
+        for row in range(len(self)):
+            yield self._row(row)
+
+    def __repr__(self) -> str:
+        return f"<ItemTable with {len(self)} items>"
+
+    def _row(self, row: int) -> Item:
+        guid = self._guid[row]
+        enclosure_url = self._enclosure_url[row]
+        enclosure_type = self._enclosure_type[row]
+        source_name = self._source_name[row]
+        source_url = self._source_url[row]
+        start, end = self._category_offsets[row], self._category_offsets[row + 1]
+        pub_date = self._pub_date[row]
+        timestamp = self._pub_timestamp[row]
+        return Item(
+            self._title[row],
+            self._link[row],
+            self._description[row],
+            self._author[row],
+            tuple(
+                _category(value, domain)
+                for value, domain in zip(
+                    self._category[start:end], self._category_domain[start:end]
+                )
+            ),
+            self._comments[row],
+            None
+            if enclosure_url is None or enclosure_type is None
+            else Enclosure(enclosure_url, self._length(row), enclosure_type),
+            None if guid is None else Guid(guid, bool(self._guid_is_perma_link[row])),
+            pub_date,
+            None
+            if source_name is None or source_url is None
+            else Source(source_name, source_url),
+            None if timestamp == NO_TIMESTAMP else _published(pub_date, timestamp),
+            None if timestamp == NO_TIMESTAMP else timestamp,
+        )
+
+    def _length(self, row: int) -> int:
+        length = self._enclosure_length[row]
+        if length in (_INT64_MIN, _INT64_MAX):
+            return self._enclosure_length_overflow.get(row, length)
+        return length
+
+
+def _published(pub_date: str | None, timestamp: int) -> dt.datetime:
+    # The column keeps no UTC offset, so recover pub_datetime from the (memoized)
+    # date string where possible to preserve it.
+    if pub_date is not None:
+        try:
+            return parse_rfc822_date(pub_date)
+        except RssDateError:
+            pass
+    return dt.datetime.fromtimestamp(timestamp, dt.timezone.utc)
@@ -0,0 +1,46 @@
+import pytest
+
+from .rss import Category, Enclosure, Item, parse_rss
+from .rss_test import ARCHIVE_RSS, SAMPLE_RSS
+from .table import NO_TIMESTAMP, ItemTable
+
+
+def test_item_table_round_trips_items():
+    items = parse_rss(SAMPLE_RSS).channel.items + parse_rss(ARCHIVE_RSS).channel.items
+    table = ItemTable.from_items(items)
+    assert len(table) == len(items)
+    assert list(table) == list(items)
+    assert table[-1] == items[-1]
+    assert list(table[1:3]) == list(items[1:3])
+    with pytest.raises(IndexError):
+        table[len(items)]
+
+
+def test_item_table_columns():
+    items = parse_rss(ARCHIVE_RSS).channel.items
+    table = ItemTable.from_items(items)
+    assert list(table.column("title")) == [item.title for item in items]
+    assert [ts for ts in table.column("pub_timestamp") if ts != NO_TIMESTAMP] == [
+        item.pub_timestamp for item in items if item.pub_timestamp is not None
+    ]
+    assert list(table.column("category_offsets")) == [0] * (len(items) + 1)
+    with pytest.raises(ValueError, match="Unknown ItemColumn"):
+        table.column("nope")  # pyright: ignore[reportArgumentType]
+
+
+def test_item_table_keeps_enclosure_lengths_beyond_64_bits():
+    huge = 99999999999999999999
+    item = Item(enclosure=Enclosure("https://example.com/a.mp3", huge, "audio/mpeg"))
+    table = ItemTable.from_items([item, item])
+    assert list(table.column("enclosure_length")) == [(1 << 63) - 1] * 2
+    assert list(table) == [item, item]
+    assert table[1:][0].enclosure == item.enclosure
+
+
+def test_item_table_shares_categories_between_rows():
+    items = [
+        Item(title=str(i), categories=(Category("News", "tags"),)) for i in range(2)
+    ]
+    first, second = ItemTable.from_items(items)
+    assert first.categories == items[0].categories
+    assert first.categories[0] is second.categories[0]
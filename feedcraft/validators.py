@@ -0,0 +1,106 @@
+import os
+import typing as t
+from dataclasses import dataclass
+
+from ._sqlite import SqliteStore
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """HTTP cache validators last seen for a URL, replayed on conditional requests."""
+
+    etag: str | None = None
+    """ETag response header, sent back as If-None-Match."""
+
+    last_modified: str | None = None
+    """Last-Modified response header, sent back as If-Modified-Since."""
+
+    def request_headers(self) -> dict[str, str]:
+        """Return the conditional request headers these validators translate to."""
+
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore(t.Protocol):
+    """Storage for the Validators of each fetched URL.
+
+    Methods are called from worker threads (through asyncio.to_thread), so
+    they may block on I/O but must be thread-safe.
+    """
+
+    def get(self, url: str) -> Validators | None: ...
+
+    def put(self, url: str, validators: Validators) -> None: ...
+
+    def delete(self, url: str) -> None: ...
+
+
+class MemoryValidatorStore:
+    """ValidatorStore kept in a dict, for a single long-running process."""
+
+    def __init__(self) -> None:
+        self._validators: dict[str, Validators] = {}
+
+    def get(self, url: str) -> Validators | None:
+        return self._validators.get(url)
+
+    def put(self, url: str, validators: Validators) -> None:
+        self._validators[url] = validators
+
+    def delete(self, url: str) -> None:
+        self._validators.pop(url, None)
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+class SqliteValidatorStore(SqliteStore):
+    """ValidatorStore persisted in a SQLite database, surviving restarts.
+
+    The database runs in WAL mode, so several processes may share it.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout: float = 30.0) -> None:
+        super().__init__(
+            path,
+            timeout=timeout,
+            schema=(
+                "CREATE TABLE IF NOT EXISTS validators ("
+                " url TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " last_modified TEXT)",
+            ),
+        )
+
+    def get(self, url: str) -> Validators | None:
+        with self._database.lock:
+            row = self._database.connection.execute(
+                "SELECT etag, last_modified FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+        return None if row is None else Validators(*row)
+
+    def put(self, url: str, validators: Validators) -> None:
+        with self._database.lock:
+            self._database.connection.execute(
+                "INSERT OR REPLACE INTO validators (url, etag, last_modified)"
+                " VALUES (?, ?, ?)",
+                (url, validators.etag, validators.last_modified),
+            )
+
+    def delete(self, url: str) -> None:
+        with self._database.lock:
+            self._database.connection.execute(
+                "DELETE FROM validators WHERE url = ?", (url,)
+            )
+
+    def __len__(self) -> int:
+        with self._database.lock:
+            (count,) = self._database.connection.execute(
+                "SELECT COUNT(*) FROM validators"
+            ).fetchone()
+        return count
@@ -0,0 +1,339 @@
+import asyncio
+import functools
+import hashlib
+import hmac
+import inspect
+import secrets
+import typing as t
+from concurrent.futures import Executor
+
+import httpx
+
+from ._receiver import Receiver, Request, Response
+from .rss import Channel, ParseOptions, RssFeed, parse_rss
+
+type FeedCallback = t.Callable[[str, RssFeed], t.Awaitable[None] | None]
+
+_SIGNATURE_ALGORITHMS = {
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+}
+
+
+class WebSubError(ValueError):
+    """Raised when a WebSub hub rejects or never verifies a subscription request."""
+
+
+class _Subscription:
+    __slots__ = ("hub", "mode", "renewal", "secret", "token", "topic", "verified")
+
+    def __init__(self, topic: str, hub: str, token: str, secret: str) -> None:
+        self.topic = topic
+        self.hub = hub
+        self.token = token
+        self.secret = secret
+        # The pending intent the hub's verification request must match.
+        self.mode = "subscribe"
+        self.verified: asyncio.Future[int | None] | None = None
+        self.renewal: asyncio.Task[None] | None = None
+
+
+class WebSubSubscriber:
+    """Subscribe to feeds at their WebSub hubs and parse the content hubs push.
+
+    start() runs a callback receiver on `host`:`port`; `callback_base` is the
+    URL at which hubs can reach it (such as "https://feeds.example.com", and
+    by default the receiver's own host and port), and each subscription gets
+    its own unguessable callback path beneath `path`.
+    subscribe() sends the subscription request and, by default, waits up to
+    `verify_timeout` seconds for the hub to verify it. Verified subscriptions
+    are renewed once `renew_fraction` of the granted lease has passed, and
+    retried a few times within the lease when the hub fails; the error of the
+    last failed renewal of each topic is kept in renewal_errors until a
+    renewal succeeds.
+
+    Every subscription has its own secret, and content distribution requests
+    are only parsed when their X-Hub-Signature HMAC matches it; unsigned or
+    mismatched requests are acknowledged but dropped, as the specification
+    asks. Signed requests are acknowledged before their body is parsed, so
+    hubs never wait on a slow parse or `on_feed`. Parsing runs on `executor`
+    (the event loop's default unless given) with the parse_rss keyword
+    options, and the feed is passed to `on_feed` together with its topic URL.
+    Bodies larger than `max_body_bytes` are refused. Deliveries that fail to
+    parse, or whose `on_feed` call raises, leave their error in
+    delivery_errors until the next delivery of the topic succeeds.
+    """
+
+    def __init__(
+        self,
+        on_feed: FeedCallback,
+        *,
+        client: httpx.AsyncClient,
+        callback_base: str | None = None,
+        host: str = "0.0.0.0",
+        port: int = 0,
+        path: str = "/websub",
+        lease_seconds: int = 7 * 86400,
+        renew_fraction: float = 0.9,
+        verify_timeout: float | None = 30.0,
+        max_body_bytes: int = 16 << 20,
+        executor: Executor | None = None,
+        **options: t.Unpack[ParseOptions],
+    ) -> None:
+        self.callback_base = (
+            None if callback_base is None else callback_base.rstrip("/")
+        )
+        self.host = host
+        self.path = path.rstrip("/")
+        self.lease_seconds = lease_seconds
+        self.renew_fraction = renew_fraction
+        self.verify_timeout = verify_timeout
+        self._on_feed = on_feed
+        self._client = client
+        self._port = port
+        self._executor = executor
+        self._options = options
+        self._receiver = Receiver(self._handle, max_body_bytes=max_body_bytes)
+        self._by_topic: dict[str, _Subscription] = {}
+        self._by_token: dict[str, _Subscription] = {}
+        self._deliveries: set[asyncio.Task[None]] = set()
+        self._renewal_errors: dict[str, Exception] = {}
+        self._delivery_errors: dict[str, Exception] = {}
+
+    @property
+    def port(self) -> int:
+        """Port the callback receiver listens on."""
+
+        return self._receiver.port
+
+    @property
+    def subscriptions(self) -> frozenset[str]:
+        """Topics with a subscription requested or verified."""
+
+        return frozenset(self._by_topic)
+
+    @property
+    def renewal_errors(self) -> dict[str, Exception]:
+        """Error of the last renewal of each topic whose last renewal failed."""
+
+        return dict(self._renewal_errors)
+
+    @property
+    def delivery_errors(self) -> dict[str, Exception]:
+        """Error of the last delivery of each topic whose last delivery failed."""
+
+        return dict(self._delivery_errors)
+
+    async def start(self) -> None:
+        await self._receiver.start(self.host, self._port)
+
+    async def aclose(self) -> None:
+        for subscription in self._by_topic.values():
+            if subscription.renewal is not None:
+                subscription.renewal.cancel()
+        self._by_topic.clear()
+        self._by_token.clear()
+        for task in self._deliveries:
+            task.cancel()
+        self._renewal_errors.clear()
+        self._delivery_errors.clear()
+        await self._receiver.close()
+
+    async def __aenter__(self) -> t.Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def subscribe_channel(self, channel: Channel) -> bool:
+        """Subscribe at the first hub a channel advertises; False if it has none.
+
+        The topic is the channel's atom:link rel="self" URL, which hubs key
+        subscriptions on.
+        """
+
+        if not channel.hub_links or channel.self_link is None:
+            return False
+        await self.subscribe(channel.self_link, channel.hub_links[0])
+        return True
+
+    async def subscribe(self, topic: str, hub: str) -> None:
+        """Ask `hub` to push updates of `topic`, waiting for verification if configured."""
+
+        subscription = self._by_topic.get(topic)
+        if subscription is None or subscription.hub != hub:
+            if subscription is not None:
+                self._forget(subscription)
+            subscription = _Subscription(
+                topic, hub, secrets.token_urlsafe(16), secrets.token_urlsafe(32)
+            )
+            self._by_topic[topic] = subscription
+            self._by_token[subscription.token] = subscription
+        await self._request(subscription, "subscribe")
+
+    async def unsubscribe(self, topic: str) -> None:
+        """Ask the hub to stop pushing `topic`, and stop renewing it."""
+
+        subscription = self._by_topic.get(topic)
+        if subscription is None:
+            return
+        if subscription.renewal is not None:
+            subscription.renewal.cancel()
+            subscription.renewal = None
+        try:
+            await self._request(subscription, "unsubscribe")
+        finally:
+            self._forget(subscription)
+
+    def _forget(self, subscription: _Subscription) -> None:
+        if subscription.renewal is not None:
+            subscription.renewal.cancel()
+        self._by_topic.pop(subscription.topic, None)
+        self._by_token.pop(subscription.token, None)
+        self._renewal_errors.pop(subscription.topic, None)
+        self._delivery_errors.pop(subscription.topic, None)
+
+    async def _request(self, subscription: _Subscription, mode: str) -> None:
+        subscription.mode = mode
+        subscription.verified = asyncio.get_running_loop().create_future()
+        data = {
+            "hub.mode": mode,
+            "hub.topic": subscription.topic,
+            "hub.callback": self._callback_url(subscription),
+        }
+        if mode == "subscribe":
+            data["hub.lease_seconds"] = str(self.lease_seconds)
+            data["hub.secret"] = subscription.secret
+        response = await self._client.post(subscription.hub, data=data)
+        if response.status_code not in (202, 204):
+            raise WebSubError(
+                f"Hub {subscription.hub} rejected {mode} of {subscription.topic}: "
+                f"{response.status_code} {response.text[:200]!r}"
+            )
+        if self.verify_timeout is None:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(subscription.verified), self.verify_timeout
+            )
+        except TimeoutError:
+            raise WebSubError(
+                f"Hub {subscription.hub} did not verify {mode} of {subscription.topic}."
+            ) from None
+
+    def _callback_url(self, subscription: _Subscription) -> str:
+        base = self.callback_base or f"http://{self.host}:{self.port}"
+        return f"{base}{self.path}/{subscription.token}"
+
+    async def _renew(self, subscription: _Subscription, lease: int) -> None:
+        await asyncio.sleep(lease * self.renew_fraction)
+        # Verifying the renewal schedules the next one; make sure that does not
+        # cancel this task while it is still waiting for the verification.
+        subscription.renewal = None
+        for _ in range(3):
+            if self._by_token.get(subscription.token) is not subscription:
+                # Denied or unsubscribed in the meantime.
+                return
+            try:
+                await self._request(subscription, "subscribe")
+            except Exception as exc:
+                if self._by_token.get(subscription.token) is subscription:
+                    self._renewal_errors[subscription.topic] = exc
+                # Retry within whatever is left of the current lease.
+                await asyncio.sleep(lease * (1 - self.renew_fraction) / 4)
+            else:
+                self._renewal_errors.pop(subscription.topic, None)
+                return
+
+    async def _handle(self, request: Request) -> Response:
+        prefix = f"{self.path}/"
+        if not request.path.startswith(prefix):
+            return Response(404)
+        subscription = self._by_token.get(request.path[len(prefix) :])
+        if subscription is None:
+            return Response(404)
+        if request.method == "GET":
+            return self._verify(subscription, request.query)
+        if request.method == "POST":
+            if _signature_matches(
+                subscription.secret,
+                request.body,
+                request.headers.get("x-hub-signature"),
+            ):
+                task = asyncio.create_task(self._deliver(subscription, request.body))
+                self._deliveries.add(task)
+                task.add_done_callback(self._deliveries.discard)
+            return Response(202)
+        return Response(400)
+
+    def _verify(
+        self, subscription: _Subscription, query: dict[str, list[str]]
+    ) -> Response:
+        def param(name: str) -> str | None:
+            values = query.get(name)
+            return values[0] if values else None
+
+        mode = param("hub.mode")
+        verified = subscription.verified
+        if param("hub.topic") != subscription.topic:
+            return Response(404)
+        if mode == "denied":
+            self._forget(subscription)
+            if verified is not None and not verified.done():
+                verified.set_exception(
+                    WebSubError(
+                        f"Hub denied subscription to {subscription.topic}: "
+                        f"{param('hub.reason')}"
+                    )
+                )
+            return Response(200)
+        challenge = param("hub.challenge")
+        if mode != subscription.mode or challenge is None:
+            return Response(404)
+
+        lease_text = param("hub.lease_seconds")
+        lease = int(lease_text) if lease_text and lease_text.isdigit() else None
+        if mode == "subscribe":
+            if subscription.renewal is not None:
+                subscription.renewal.cancel()
+            subscription.renewal = asyncio.create_task(
+                self._renew(subscription, lease or self.lease_seconds)
+            )
+        if verified is not None and not verified.done():
+            verified.set_result(lease)
+        return Response(200, challenge.encode())
+
+    async def _deliver(self, subscription: _Subscription, body: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            feed = await loop.run_in_executor(
+                self._executor, functools.partial(parse_rss, body, **self._options)
+            )
+        except ValueError as exc:
+            self._delivery_errors[subscription.topic] = exc
+            return
+        try:
+            result = self._on_feed(subscription.topic, feed)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as exc:
+            self._delivery_errors[subscription.topic] = exc
+        else:
+            self._delivery_errors.pop(subscription.topic, None)
+
+
+def _signature_matches(secret: str, body: bytes, header: str | None) -> bool:
+    if header is None:
+        return False
+    algorithm, _, signature = header.partition("=")
+    digest = _SIGNATURE_ALGORITHMS.get(algorithm.strip().lower())
+    if digest is None:
+        return False
+    expected = hmac.new(secret.encode(), body, digest).hexdigest()
+    # compare_digest only accepts ASCII str, and the header may hold anything.
+    return hmac.compare_digest(
+        expected.encode(), signature.strip().lower().encode("utf-8", "replace")
+    )
@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import hmac
+import http.server
+import secrets
+import threading
+import urllib.parse
+
+import httpx
+import pytest
+
+from .fetch_test import respond, serve
+from .rss import RssFeed, parse_rss
+from .rss_test import SAMPLE_RSS
+from .websub import WebSubError, WebSubSubscriber, _signature_matches
+
+TOPIC = "https://example.com/feed.xml"
+
+HUB_RSS = SAMPLE_RSS.replace(
+    '<atom:link rel="self"',
+    '<atom:link rel="hub" href="HUB" /><atom:link rel="self"',
+)
+
+
+def _stand_in_hub(
+    requests: list[dict[str, str]], *, lease: int = 3600, deny: bool = False
+):
+    """Return a hub route that accepts requests and verifies them asynchronously."""
+
+    def verify(form: dict[str, str]) -> None:
+        query = {
+            "hub.mode": "denied" if deny else form["hub.mode"],
+            "hub.topic": form["hub.topic"],
+            "hub.challenge": secrets.token_hex(8),
+            "hub.lease_seconds": str(lease),
+        }
+        response = httpx.get(form["hub.callback"], params=query)
+        form["verified"] = str(response.text == query["hub.challenge"])
+
+    def hub(handler: http.server.BaseHTTPRequestHandler) -> None:
+        body = handler.rfile.read(int(handler.headers["Content-Length"]))
+        form = {k: v[0] for k, v in urllib.parse.parse_qs(body.decode()).items()}
+        requests.append(form)
+        respond(handler, 202)
+        threading.Thread(target=verify, args=(form,)).start()
+
+    return hub
+
+
+def _sign(secret: str, body: bytes) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_parse_rss_captures_hub_and_self_links():
+    channel = parse_rss(HUB_RSS.replace("HUB", "https://hub.example/")).channel
+    assert channel.hub_links == ("https://hub.example/",)
+    assert channel.self_link == TOPIC
+
+
+def test_websub_subscribe_deliver_and_renew():
+    requests: list[dict[str, str]] = []
+
+    async def run(base: str) -> list[tuple[str, RssFeed]]:
+        delivered: list[tuple[str, RssFeed]] = []
+        channel = parse_rss(HUB_RSS.replace("HUB", f"{base}/hub")).channel
+        async with httpx.AsyncClient() as client:
+            async with WebSubSubscriber(
+                lambda topic, feed: delivered.append((topic, feed)),
+                client=client,
+                host="127.0.0.1",
+                renew_fraction=0.5,
+                verify_timeout=5,
+            ) as subscriber:
+                assert await subscriber.subscribe_channel(channel)
+                callback = requests[0]["hub.callback"]
+                secret = requests[0]["hub.secret"]
+                body = SAMPLE_RSS.encode()
+                await client.post(
+                    callback,
+                    content=body,
+                    headers={"X-Hub-Signature": _sign(secret, body)},
+                )
+                forged = await client.post(
+                    callback,
+                    content=body,
+                    headers={"X-Hub-Signature": _sign("x", body)},
+                )
+                assert forged.status_code == 202
+                await client.post(callback, content=body)
+                await asyncio.sleep(1.2)
+                await subscriber.unsubscribe(TOPIC)
+                assert subscriber.subscriptions == frozenset()
+        return delivered
+
+    with serve({"/hub": _stand_in_hub(requests, lease=2)}) as base:
+        delivered = asyncio.run(run(base))
+
+    assert [topic for topic, _ in delivered] == [TOPIC]
+    assert delivered[0][1] == parse_rss(SAMPLE_RSS)
+    modes = [request["hub.mode"] for request in requests]
+    assert modes[0] == "subscribe" and modes[-1] == "unsubscribe"
+    assert modes.count("subscribe") >= 2
+    assert all(request["verified"] == "True" for request in requests)
+
+
+def test_websub_denied_subscription_raises():
+    requests: list[dict[str, str]] = []
+
+    async def run(base: str) -> None:
+        async with httpx.AsyncClient() as client:
+            async with WebSubSubscriber(
+                print, client=client, host="127.0.0.1", verify_timeout=5
+            ) as subscriber:
+                await subscriber.subscribe(TOPIC, f"{base}/hub")
+
+    with serve({"/hub": _stand_in_hub(requests, deny=True)}) as base:
+        with pytest.raises(WebSubError, match="denied"):
+            asyncio.run(run(base))
+
+
+def test_signature_matches_rejects_non_ascii_signatures():
+    body = SAMPLE_RSS.encode()
+    assert _signature_matches("s", body, _sign("s", body))
+    assert not _signature_matches("s", body, "sha256=é")
+    assert not _signature_matches("s", body, "sha256=" + "\N{SNOWMAN}" * 64)
+
+
+def test_websub_refuses_bodies_over_max_body_bytes():
+    async def run() -> tuple[int, int]:
+        async with httpx.AsyncClient() as client:
+            async with WebSubSubscriber(
+                print, client=client, host="127.0.0.1", max_body_bytes=10
+            ) as subscriber:
+                callback = f"http://127.0.0.1:{subscriber.port}/websub/nope"
+                small = await client.post(callback, content=b"0123456789")
+                large = await client.post(callback, content=b"0123456789a")
+        return small.status_code, large.status_code
+
+    assert asyncio.run(run()) == (404, 400)
+
+
+def test_websub_records_renewal_and_delivery_errors():
+    requests: list[dict[str, str]] = []
+    accept = _stand_in_hub(requests, lease=1)
+
+    def hub(handler: http.server.BaseHTTPRequestHandler) -> None:
+        if requests:
+            handler.rfile.read(int(handler.headers["Content-Length"]))
+            respond(handler, 500)
+        else:
+            accept(handler)
+
+    def on_feed(topic: str, feed: RssFeed) -> None:
+        raise RuntimeError(topic)
+
+    async def run(base: str) -> tuple[dict[str, Exception], dict[str, Exception]]:
+        async with httpx.AsyncClient() as client:
+            async with WebSubSubscriber(
+                on_feed,
+                client=client,
+                host="127.0.0.1",
+                renew_fraction=0.2,
+                verify_timeout=5,
+            ) as subscriber:
+                await subscriber.subscribe(TOPIC, f"{base}/hub")
+                body = SAMPLE_RSS.encode()
+                await client.post(
+                    requests[0]["hub.callback"],
+                    content=body,
+                    headers={"X-Hub-Signature": _sign(requests[0]["hub.secret"], body)},
+                )
+                await asyncio.sleep(0.5)
+                return subscriber.renewal_errors, subscriber.delivery_errors
+
+    with serve({"/hub": hub}) as base:
+        renewal_errors, delivery_errors = asyncio.run(run(base))
+
+    assert isinstance(renewal_errors[TOPIC], WebSubError)
+    assert isinstance(delivery_errors[TOPIC], RuntimeError)
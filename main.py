@@ -1,8 +1,32 @@
+import asyncio
+import bisect
+import functools
+import http.server
+import itertools
+import mmap
+import random
+import threading
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
 
-from feedcraft.rss import parse_rss
+from feedcraft.adaptive import UpdateRateEstimator
+from feedcraft.cache import DiskParseCache
+from feedcraft.fetch import AsyncFeedFetcher
+from feedcraft.schedule import PollPolicy, next_poll_time
+from feedcraft.rss import (
+    Backend,
+    Item,
+    RssDateError,
+    RssParseError,
+    _parse_rfc822_date_stdlib,
+    parse_rfc822_date,
+    parse_rss,
+    parse_rss_file,
+)
 
 
 @click.group()
@@ -10,8 +34,18 @@ def main():
     pass
 
 
-def _is_feed_any_rss(feed: str) -> bool:
-    return "<rss" in feed
+def _is_feed_any_rss(feed: bytes) -> bool:
+    return b"<rss" in feed
+
+
+def _is_file_any_rss(feed_path: Path) -> bool:
+    with open(feed_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return False
+    with mapped:
+        return mapped.find(b"<rss") != -1
 
 
 @main.command()
@@ -20,16 +54,13 @@ def _is_feed_any_rss(feed: str) -> bool:
 def parse(feed_path: Path):
     """Parse the RSS feed at the given FEED_PATH and print the titles of the items."""
 
-    with open(feed_path, "r", encoding="utf-8") as f:
-        feed_content = f.read()
-
-    if not _is_feed_any_rss(feed_content):
+    if not _is_file_any_rss(feed_path):
         click.echo(
             "The provided file does not appear to be a valid RSS feed.", err=True
         )
         return
 
-    feed = parse_rss(feed_content)
+    feed = parse_rss_file(feed_path)
 
     click.echo(f"Feed Title: {feed.channel.title}")
     click.echo("Items:")
@@ -39,35 +70,336 @@ def parse(feed_path: Path):
 
 @main.command()
 @click.argument("feed_dir_path", type=click.Path(exists=True, dir_okay=True))
-def parse_dir(feed_dir_path: Path):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes; 0 uses every available CPU.",
+)
+@click.option(
+    "--cache",
+    "cache_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite parse cache to reuse between runs and worker processes.",
+)
+def parse_dir(feed_dir_path: Path, jobs: int, cache_path: str | None):
     """Parse all RSS feeds in the given FEED_DIR_PATH and print the titles of the items."""
 
-    feed_dir = Path(feed_dir_path)
+    feed_files = sorted(Path(feed_dir_path).iterdir())
+    numbers = range(1, len(feed_files) + 1)
+    stdout = click.get_text_stream("stdout")
+    stderr = click.get_text_stream("stderr")
+    cache_paths = itertools.repeat(cache_path)
+
+    if jobs == 1:
+        rendered = map(_render_feed_file, numbers, feed_files, cache_paths)
+        _write_rendered(rendered, stdout, stderr)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+        # map() yields in submission order, so output matches a serial run.
+        rendered = executor.map(
+            _render_feed_file, numbers, feed_files, cache_paths, chunksize=16
+        )
+        _write_rendered(rendered, stdout, stderr)
+
+
+@functools.cache
+def _open_cache(cache_path: str) -> DiskParseCache:
+    """Open the parse cache once per process."""
+
+    return DiskParseCache(cache_path)
+
+
+def _render_feed_file(
+    number: int, feed_file: Path, cache_path: str | None = None
+) -> tuple[str, str]:
+    """Read, sniff and parse one feed file, returning its (stdout, stderr) text."""
+
+    if not feed_file.is_file():
+        return "", ""
+
+    if not _is_file_any_rss(feed_file):
+        return "", f"[{number}] {feed_file.name}: not a valid RSS feed\n"
+
+    try:
+        if cache_path is None:
+            feed = parse_rss_file(feed_file)
+        else:
+            feed = _open_cache(cache_path).parse_rss_file(feed_file)
+    except Exception as e:
+        return "", f"[{number}] Error parsing {feed_file}: {str(e)}\n"
+
+    lines = [
+        f"\n\n-------\n\n[{number}]\nFeed Title: {feed.channel.title} (from {feed_file.name})",
+        "Items:",
+    ]
+    lines.extend(f"- {item.pub_date}: {item.title}" for item in feed.channel.items)
+    lines.append("")
+    return "\n".join(lines), ""
 
-    for i, feed_file in enumerate(feed_dir.iterdir()):
+
+def _write_rendered(
+    rendered: t.Iterable[tuple[str, str]], stdout: t.TextIO, stderr: t.TextIO
+) -> None:
+    for out, err in rendered:
+        if out:
+            stdout.write(out)
+        if err:
+            stderr.write(err)
+    stdout.flush()
+    stderr.flush()
+
+
+@main.group()
+def bench():
+    """Benchmarks that exercise feedcraft against local data."""
+
+
+@bench.command("parse")
+@click.argument("feed_dir_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--repeat", default=3, show_default=True, help="Passes over the corpus.")
+def bench_parse(feed_dir_path: Path, repeat: int):
+    """Compare parse_rss throughput across backends for the feeds in FEED_DIR_PATH."""
+
+    feeds: list[bytes] = []
+    for feed_file in sorted(Path(feed_dir_path).iterdir()):
         if feed_file.is_file():
-            with open(feed_file, "r", encoding="utf-8") as f:
-                feed_content = f.read()
-
-            if not _is_feed_any_rss(feed_content):
-                click.echo(
-                    f"[{i + 1}] {feed_file.name}: not a valid RSS feed",
-                    err=True,
-                )
-                continue
-
-            try:
-                feed = parse_rss(feed_content)
-            except Exception as e:
-                click.echo(f"[{i + 1}] Error parsing {feed_file}: {str(e)}", err=True)
-                continue
-
-            click.echo(
-                f"\n\n-------\n\n[{i + 1}]\nFeed Title: {feed.channel.title} (from {feed_file.name})"
-            )
-            click.echo("Items:")
-            for item in feed.channel.items:
-                click.echo(f"- {item.pub_date}: {item.title}")
+            feed_content = feed_file.read_bytes()
+            if _is_feed_any_rss(feed_content):
+                feeds.append(feed_content)
+
+    total_bytes = sum(len(feed) for feed in feeds)
+    click.echo(f"{len(feeds)} RSS feeds, {total_bytes / 1e6:.1f} MB, {repeat} passes")
+
+    backends: tuple[Backend, ...] = ("soup", "lxml", "auto")
+    timings: dict[str, float] = {}
+    for backend in backends:
+        failures = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for feed in feeds:
+                try:
+                    parse_rss(feed, backend=backend)
+                except RssParseError:
+                    failures += 1
+        elapsed = time.perf_counter() - start
+        timings[backend] = elapsed
+        click.echo(
+            f"{backend:>5}: {elapsed:8.3f}s  "
+            f"{len(feeds) * repeat / elapsed:10.1f} feeds/s  "
+            f"{failures // repeat} failures"
+        )
+
+    click.echo(f"lxml speedup over soup: {timings['soup'] / timings['lxml']:.2f}x")
+
+
+@bench.command("dates")
+@click.argument("feed_dir_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--repeat", default=3, show_default=True, help="Passes over the dates.")
+def bench_dates(feed_dir_path: Path, repeat: int):
+    """Compare RFC 822 date parsing against the email.utils reference implementation.
+
+    Dates are the channel and item pubDate/lastBuildDate strings of the feeds in
+    FEED_DIR_PATH, in document order and with their natural repetition.
+    """
+
+    dates: list[str] = []
+    for feed_file in sorted(Path(feed_dir_path).iterdir()):
+        if not feed_file.is_file() or not _is_file_any_rss(feed_file):
+            continue
+        try:
+            channel = parse_rss_file(feed_file).channel
+        except RssParseError:
+            continue
+        candidates = [channel.pub_date, channel.last_build_date]
+        candidates.extend(item.pub_date for item in channel.items)
+        dates.extend(date for date in candidates if date)
+
+    click.echo(f"{len(dates)} dates, {len(set(dates))} distinct, {repeat} passes")
+    if not dates:
+        return
+
+    def run(parse: t.Callable[[str], object]) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for date in dates:
+                try:
+                    parse(date)
+                except RssDateError:
+                    pass
+        return time.perf_counter() - start
+
+    parse_rfc822_date.cache_clear()
+    timings = {
+        "stdlib": run(_parse_rfc822_date_stdlib),
+        "fast": run(parse_rfc822_date.__wrapped__),
+        "fast + memo": run(parse_rfc822_date),
+    }
+    for name, elapsed in timings.items():
+        click.echo(
+            f"{name:>11}: {elapsed:8.3f}s  "
+            f"{len(dates) * repeat / elapsed:12.1f} dates/s  "
+            f"{timings['stdlib'] / elapsed:6.2f}x"
+        )
+
+
+@bench.command("fetch")
+@click.argument("feed_dir_path", type=click.Path(exists=True, file_okay=False))
+@click.option("--requests", "request_count", default=2000, show_default=True)
+@click.option("--concurrency", default=64, show_default=True)
+@click.option("--connections", default=100, show_default=True)
+def bench_fetch(
+    feed_dir_path: Path, request_count: int, concurrency: int, connections: int
+):
+    """Measure AsyncFeedFetcher throughput against a local server for FEED_DIR_PATH.
+
+    The RSS files in FEED_DIR_PATH are served over HTTP/1.1 keep-alive from a
+    threaded server on localhost and fetched round-robin REQUESTS times.
+    """
+
+    bodies = {
+        f"/{feed_file.name}": feed_file.read_bytes()
+        for feed_file in sorted(Path(feed_dir_path).iterdir())
+        if feed_file.is_file() and _is_file_any_rss(feed_file)
+    }
+    if not bodies:
+        raise click.ClickException(f"No RSS feeds found in {feed_dir_path}.")
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            body = bodies.get(self.path)
+            self.send_response(200 if body is not None else 404)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body or b"")))
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+        def log_message(self, format: str, *args: t.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    paths = list(bodies)
+    urls = [base + paths[i % len(paths)] for i in range(request_count)]
+
+    async def run() -> tuple[int, int, float]:
+        failures = 0
+        received = 0
+        async with AsyncFeedFetcher(
+            max_concurrency=concurrency, max_connections=connections
+        ) as fetcher:
+            start = time.perf_counter()
+            async for result in fetcher.fetch_many(urls):
+                received += result.size
+                failures += result.error is not None
+            return failures, received, time.perf_counter() - start
+
+    try:
+        failures, received, elapsed = asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    click.echo(
+        f"{request_count} fetches of {len(paths)} feeds in {elapsed:.3f}s: "
+        f"{request_count / elapsed:.1f} feeds/s, "
+        f"{received / elapsed / 1e6:.1f} MB/s, {failures} failures"
+    )
+
+
+@bench.command("polling")
+@click.argument("feed_dir_path", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--window", default=20, show_default=True, help="Items a feed shows at a time."
+)
+def bench_polling(feed_dir_path: Path, window: int):
+    """Simulate fixed and adaptive polling over the item histories in FEED_DIR_PATH.
+
+    Each feed's dated items are replayed as its publication history, with the
+    feed showing only its latest WINDOW items at any moment; both strategies
+    poll it from its first publication to its last.
+    """
+
+    histories: list[list[int]] = []
+    for feed_file in sorted(Path(feed_dir_path).iterdir()):
+        if not feed_file.is_file() or not _is_file_any_rss(feed_file):
+            continue
+        try:
+            items = parse_rss_file(feed_file).channel.items
+        except RssParseError:
+            continue
+        history = sorted(
+            {item.pub_timestamp for item in items if item.pub_timestamp is not None}
+        )
+        if len(history) >= 2:
+            histories.append(history)
+    published = sum(len(history) for history in histories)
+    click.echo(f"{len(histories)} feeds with {published} dated items")
+    if not histories:
+        return
+
+    policy = PollPolicy()
+    for name, adaptive in (("fixed", False), ("adaptive", True)):
+        polls = empty = missed = 0
+        delay = 0.0
+        rng = random.Random(0)
+        for history in histories:
+            stats = _simulate_polling(history, policy, window, adaptive, rng)
+            polls += stats[0]
+            empty += stats[1]
+            missed += stats[2]
+            delay += stats[3]
+        seen = published - missed
+        click.echo(
+            f"{name:>8}: {polls:8d} polls, {empty / polls:6.1%} without new items, "
+            f"{missed} items missed, "
+            f"mean delay {delay / max(seen, 1) / 60:8.1f} min"
+        )
+
+
+def _simulate_polling(
+    history: list[int],
+    policy: PollPolicy,
+    window: int,
+    adaptive: bool,
+    rng: random.Random,
+) -> tuple[int, int, int, float]:
+    """Poll one feed's publication history; return (polls, empty, missed, delay)."""
+
+    estimator = UpdateRateEstimator() if adaptive else None
+    items = [
+        Item(title=str(timestamp), pub_timestamp=timestamp) for timestamp in history
+    ]
+    polls = empty = missed = 0
+    delay = 0.0
+    seen = 0
+    now = float(history[0])
+    while seen < len(history):
+        polls += 1
+        visible = bisect.bisect_right(history, now)
+        shown = max(0, visible - window)
+        # Items that scrolled out of the window between polls are never seen.
+        missed += max(0, shown - seen)
+        new = history[max(seen, shown) : visible]
+        if new:
+            delay += sum(now - timestamp for timestamp in new)
+        else:
+            empty += 1
+        seen = visible
+
+        interval = None
+        if estimator is not None:
+            estimator.observe("feed", items[shown:visible], now)
+            interval = estimator.interval("feed", now)
+        now = next_poll_time(None, now, policy, interval=interval, rng=rng)
+    return polls, empty, missed, delay
 
 
 if __name__ == "__main__":